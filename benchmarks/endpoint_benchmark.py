@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import List, Tuple
+
+from benchmarks.endpoints.dataset_seeder import DatasetSeeder
+from benchmarks.endpoints.drivers import Driver, HttpDriver, InProcessDriver
+from benchmarks.endpoints.report import compare_reports, regressions, run_report, scenario_result
+from benchmarks.endpoints.scenarios import SCENARIOS, Scenario, ScenarioState
+
+
+def run_scenario(a_driver: Driver, a_scenario: Scenario, a_state: ScenarioState, a_requests: int,
+                 a_concurrency: int) -> Tuple[List[float], int, float]:
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    counter = iter(range(a_requests))
+
+    def worker() -> None:
+        client = a_driver.client()
+        try:
+            while True:
+                with lock:
+                    index = next(counter, None)
+                if index is None:
+                    return
+                path, body = a_scenario.build(a_state, index)
+                started = time.perf_counter()
+                status, payload = client.request(a_scenario.method, path, body)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                with lock:
+                    latencies.append(elapsed_ms)
+                    if status != a_scenario.expected_status:
+                        errors[0] += 1
+                if a_scenario.record and status == a_scenario.expected_status:
+                    a_scenario.record(a_state, json.loads(payload))
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(a_concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0], time.perf_counter() - started
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.driver == 'http':
+        driver = HttpDriver(a_port=args.port, an_app_server=args.app_server, a_server_mode=args.server_mode)
+    else:
+        driver = InProcessDriver()
+
+    scenarios = [scenario for scenario in SCENARIOS if not args.scenarios or scenario.name in args.scenarios]
+    seeder = DatasetSeeder(args.data_dir)
+    results = []
+
+    for size in args.sizes:
+        print(f"Seeding {size} users...", file=sys.stderr)
+        driver.start(seeder.seed(size))
+        try:
+            state = ScenarioState(size)
+            for scenario in scenarios:
+                if args.warmup and scenario.method == 'GET':
+                    run_scenario(driver, scenario, ScenarioState(size), args.warmup, 1)
+                latencies, errors, elapsed = run_scenario(driver, scenario, state, args.requests, args.concurrency)
+                result = scenario_result(size, scenario.name, latencies, errors, elapsed)
+                results.append(result)
+                print(f"{size:>8} {scenario.name:<18} {result['throughput_rps']:>10.1f} req/s  "
+                      f"p50 {result['latency_ms']['p50']:>8.2f} ms  p95 {result['latency_ms']['p95']:>8.2f} ms  "
+                      f"p99 {result['latency_ms']['p99']:>8.2f} ms  errors {errors}", file=sys.stderr)
+        finally:
+            driver.stop()
+
+    report = run_report(driver.name, {
+        'sizes': args.sizes,
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'warmup': args.warmup,
+    }, results)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding='utf-8') as baseline, open(args.candidate, encoding='utf-8') as candidate:
+        rows = compare_reports(json.load(baseline), json.load(candidate))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'dataset':>8} {'scenario':<18} {'req/s':>9} {'p50':>9} {'p95':>9} {'p99':>9}")
+        for row in rows:
+            changes = [row[key]['change_percent'] for key in ('throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms')]
+            print(f"{row['dataset']:>8} {row['scenario']:<18} " + ' '.join(
+                f"{change:>+8.1f}%" if change is not None else f"{'n/a':>9}" for change in changes
+            ))
+
+    if args.fail_on_regression is not None and regressions(rows, args.fail_on_regression):
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the users API endpoints on seeded SQLite datasets")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Seed datasets, drive every endpoint and report JSON")
+    run_parser.add_argument('--driver', choices=('inprocess', 'http'), default='inprocess')
+    run_parser.add_argument('--sizes', type=lambda value: [int(size) for size in value.split(',')],
+                            default=[10000, 100000, 1000000], help="Comma separated dataset sizes")
+    run_parser.add_argument('--scenarios', type=lambda value: value.split(','), default=None,
+                            help=f"Comma separated subset of: {','.join(scenario.name for scenario in SCENARIOS)}")
+    run_parser.add_argument('--requests', type=int, default=500, help="Requests per scenario")
+    run_parser.add_argument('--concurrency', type=int, default=1, help="Concurrent clients per scenario")
+    run_parser.add_argument('--warmup', type=int, default=20, help="Unrecorded requests before each read scenario")
+    run_parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'users-benchmark'),
+                            help="Where seeded SQLite files are kept and reused")
+    run_parser.add_argument('--output', default=None, help="Write the JSON report here instead of stdout")
+    run_parser.add_argument('--port', type=int, default=8765, help="Port for the http driver's server")
+    run_parser.add_argument('--app-server', choices=('flask', 'asgi'), default='flask')
+    run_parser.add_argument('--server-mode', choices=('development', 'production'), default='development')
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subparsers.add_parser('compare', help="Diff two JSON reports")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--json', action='store_true', help="Print the diff as JSON")
+    compare_parser.add_argument('--fail-on-regression', type=float, default=None, metavar='PERCENT',
+                                help="Exit 1 when throughput drops or p95 grows by more than PERCENT")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == '__main__':
+    main()
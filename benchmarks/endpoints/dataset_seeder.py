@@ -0,0 +1,39 @@
+import os
+from typing import Iterator, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.infra.db.migrations import MigrationRunner
+from src.infra.db.settings.engine_registry import EngineRegistry
+from src.infra.persistence.importers import UserBulkImporter
+
+
+class DatasetSeeder:
+    def __init__(self, a_directory: str, chunk_size: int = 50000) -> None:
+        self.__directory = a_directory
+        self.__chunk_size = chunk_size
+
+    def url_for(self, a_size: int) -> str:
+        return f"sqlite:///{os.path.join(self.__directory, f'users-{a_size}.db')}"
+
+    def seed(self, a_size: int) -> str:
+        os.makedirs(self.__directory, exist_ok=True)
+        url = self.url_for(a_size)
+        engine = EngineRegistry.get_engine(url)
+        MigrationRunner(engine).upgrade()
+
+        if self.__count(engine) != a_size:
+            with engine.begin() as connection:
+                connection.execute(text('DELETE FROM users'))
+            UserBulkImporter(engine, chunk_size=self.__chunk_size, drop_indexes=True).run(self.records(a_size))
+        return url
+
+    @staticmethod
+    def records(a_size: int) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+        for index in range(1, a_size + 1):
+            yield index, {'name': f"User {index}", 'email': f"user{index}@example.com"}, None
+
+    @staticmethod
+    def __count(an_engine) -> int:
+        with an_engine.connect() as connection:
+            return connection.execute(text('SELECT COUNT(*) FROM users')).scalar()
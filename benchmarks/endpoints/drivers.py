@@ -0,0 +1,130 @@
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from flask import Flask
+
+from src.infra.api.routes.user.user_routes import UserRoutes
+from src.infra.config.settings import settings
+from src.infra.persistence.repositories import UsersRepository
+
+
+class DriverClient(ABC):
+    @abstractmethod
+    def request(self, a_method: str, a_path: str, a_body: Optional[dict] = None) -> Tuple[int, bytes]: pass
+
+    def close(self) -> None:
+        pass
+
+
+class Driver(ABC):
+    name: str
+
+    @abstractmethod
+    def start(self, a_database_url: str) -> None: pass
+
+    @abstractmethod
+    def client(self) -> DriverClient: pass
+
+    def stop(self) -> None:
+        pass
+
+
+class InProcessClient(DriverClient):
+    def __init__(self, an_app: Flask) -> None:
+        self.__client = an_app.test_client()
+
+    def request(self, a_method: str, a_path: str, a_body: Optional[dict] = None) -> Tuple[int, bytes]:
+        response = self.__client.open(a_path, method=a_method, json=a_body)
+        return response.status_code, response.get_data()
+
+
+class InProcessDriver(Driver):
+    name = 'inprocess'
+
+    def __init__(self) -> None:
+        self.__app: Optional[Flask] = None
+
+    def start(self, a_database_url: str) -> None:
+        settings.DATABASE_URL = a_database_url
+        UsersRepository._count_cache.clear()
+        self.__app = Flask(__name__)
+        self.__app.register_blueprint(UserRoutes().get_blueprint())
+
+    def client(self) -> DriverClient:
+        return InProcessClient(self.__app)
+
+
+class HttpClient(DriverClient):
+    def __init__(self, a_host: str, a_port: int) -> None:
+        self.__connection = http.client.HTTPConnection(a_host, a_port, timeout=60)
+
+    def request(self, a_method: str, a_path: str, a_body: Optional[dict] = None) -> Tuple[int, bytes]:
+        payload = json.dumps(a_body).encode('utf-8') if a_body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload is not None else {}
+        self.__connection.request(a_method, a_path, body=payload, headers=headers)
+        response = self.__connection.getresponse()
+        return response.status, response.read()
+
+    def close(self) -> None:
+        self.__connection.close()
+
+
+class HttpDriver(Driver):
+    name = 'http'
+
+    def __init__(self, a_host: str = '127.0.0.1', a_port: int = 8765, an_app_server: str = 'flask',
+                 a_server_mode: str = 'development', a_startup_timeout: float = 60.0) -> None:
+        self.__host = a_host
+        self.__port = a_port
+        self.__app_server = an_app_server
+        self.__server_mode = a_server_mode
+        self.__startup_timeout = a_startup_timeout
+        self.__process: Optional[subprocess.Popen] = None
+
+    def start(self, a_database_url: str) -> None:
+        environment = dict(
+            os.environ,
+            DATABASE_URL=a_database_url,
+            APP_HOST=self.__host,
+            APP_PORT=str(self.__port),
+            APP_SERVER=self.__app_server,
+            APP_SERVER_MODE=self.__server_mode,
+            DB_AUTO_MIGRATE='true',
+        )
+        self.__process = subprocess.Popen(
+            [sys.executable, 'main.py'], env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        self.__wait_until_listening()
+
+    def client(self) -> DriverClient:
+        return HttpClient(self.__host, self.__port)
+
+    def stop(self) -> None:
+        if self.__process is None:
+            return
+        self.__process.terminate()
+        try:
+            self.__process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.__process.kill()
+        self.__process = None
+
+    def __wait_until_listening(self) -> None:
+        deadline = time.monotonic() + self.__startup_timeout
+        while time.monotonic() < deadline:
+            if self.__process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {self.__process.returncode} before listening")
+            try:
+                with socket.create_connection((self.__host, self.__port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"Server did not listen on {self.__host}:{self.__port} within {self.__startup_timeout}s")
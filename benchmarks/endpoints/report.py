@@ -0,0 +1,91 @@
+import platform
+import statistics
+from datetime import datetime, timezone
+from typing import Dict, List
+
+PERCENTILES = (50, 95, 99)
+
+
+def latency_summary(a_latencies_ms: List[float]) -> Dict[str, float]:
+    if not a_latencies_ms:
+        return {'mean': 0.0, 'max': 0.0, **{f'p{percentile}': 0.0 for percentile in PERCENTILES}}
+
+    if len(a_latencies_ms) == 1:
+        cut_points = a_latencies_ms * 99
+    else:
+        cut_points = statistics.quantiles(a_latencies_ms, n=100, method='inclusive')
+
+    return {
+        'mean': round(statistics.fmean(a_latencies_ms), 3),
+        'max': round(max(a_latencies_ms), 3),
+        **{f'p{percentile}': round(cut_points[percentile - 1], 3) for percentile in PERCENTILES},
+    }
+
+
+def scenario_result(a_dataset: int, a_scenario: str, a_latencies_ms: List[float], an_errors: int,
+                    an_elapsed_seconds: float) -> dict:
+    return {
+        'dataset': a_dataset,
+        'scenario': a_scenario,
+        'requests': len(a_latencies_ms),
+        'errors': an_errors,
+        'throughput_rps': round(len(a_latencies_ms) / an_elapsed_seconds, 2) if an_elapsed_seconds else 0.0,
+        'latency_ms': latency_summary(a_latencies_ms),
+    }
+
+
+def run_report(a_driver: str, a_settings: dict, a_results: List[dict]) -> dict:
+    return {
+        'meta': {
+            'driver': a_driver,
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            **a_settings,
+        },
+        'results': a_results,
+    }
+
+
+def compare_reports(a_baseline: dict, a_candidate: dict) -> List[dict]:
+    baseline = {(result['dataset'], result['scenario']): result for result in a_baseline['results']}
+    rows = []
+    for result in a_candidate['results']:
+        previous = baseline.get((result['dataset'], result['scenario']))
+        if previous is None:
+            continue
+        rows.append({
+            'dataset': result['dataset'],
+            'scenario': result['scenario'],
+            'throughput_rps': _delta(previous['throughput_rps'], result['throughput_rps']),
+            **{
+                f'p{percentile}_ms': _delta(previous['latency_ms'][f'p{percentile}'],
+                                            result['latency_ms'][f'p{percentile}'])
+                for percentile in PERCENTILES
+            },
+        })
+    return rows
+
+
+def regressions(a_rows: List[dict], a_threshold_percent: float) -> List[dict]:
+    return [
+        row for row in a_rows
+        if _worse(row['throughput_rps'], -a_threshold_percent, lower_is_worse=True)
+        or _worse(row['p95_ms'], a_threshold_percent, lower_is_worse=False)
+    ]
+
+
+def _delta(a_baseline: float, a_candidate: float) -> dict:
+    change = ((a_candidate - a_baseline) / a_baseline * 100) if a_baseline else None
+    return {
+        'baseline': a_baseline,
+        'candidate': a_candidate,
+        'change_percent': round(change, 2) if change is not None else None,
+    }
+
+
+def _worse(a_delta: dict, a_limit: float, lower_is_worse: bool) -> bool:
+    change = a_delta['change_percent']
+    if change is None:
+        return not lower_is_worse and a_delta['candidate'] > a_delta['baseline']
+    return change < a_limit if lower_is_worse else change > a_limit
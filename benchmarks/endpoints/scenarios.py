@@ -0,0 +1,88 @@
+import random
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple
+
+BASE_PATH = '/api/v1/users'
+PER_PAGE = 50
+
+
+@dataclass
+class ScenarioState:
+    size: int
+    rng: random.Random = field(default_factory=lambda: random.Random(42))
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    created: deque = field(default_factory=deque)
+
+    def existing_id(self) -> int:
+        return self.rng.randint(1, self.size)
+
+    def unique_user(self, an_index: int, a_prefix: str) -> dict:
+        return {
+            'name': f"{a_prefix} {self.run_id} {an_index}",
+            'email': f"{a_prefix.lower()}.{self.run_id}.{an_index}@example.com",
+        }
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    expected_status: int
+    build: Callable[[ScenarioState, int], Tuple[str, Optional[dict]]]
+    record: Optional[Callable[[ScenarioState, dict], None]] = None
+
+
+def _list(a_query: str = '') -> Callable[[ScenarioState, int], Tuple[str, None]]:
+    return lambda state, _: (f"{BASE_PATH}?page=1&per_page={PER_PAGE}{a_query}", None)
+
+
+def _list_terms(a_query: str = '') -> Callable[[ScenarioState, int], Tuple[str, None]]:
+    return lambda state, _: (
+        f"{BASE_PATH}?page=1&per_page={PER_PAGE}&terms=User+{state.existing_id()}{a_query}", None
+    )
+
+
+def _list_deep_page(state: ScenarioState, _: int) -> Tuple[str, None]:
+    last_page = max(1, state.size // PER_PAGE)
+    page = max(1, last_page - state.rng.randrange(10))
+    return f"{BASE_PATH}?page={page}&per_page={PER_PAGE}", None
+
+
+def _get(state: ScenarioState, _: int) -> Tuple[str, None]:
+    return f"{BASE_PATH}/{state.existing_id()}", None
+
+
+def _create(state: ScenarioState, an_index: int) -> Tuple[str, dict]:
+    return BASE_PATH, state.unique_user(an_index, 'Bench')
+
+
+def _record_created(state: ScenarioState, a_body: dict) -> None:
+    state.created.append(a_body['id'])
+
+
+def _update(state: ScenarioState, an_index: int) -> Tuple[str, dict]:
+    an_id = state.created[an_index % len(state.created)] if state.created else state.existing_id()
+    return f"{BASE_PATH}/{an_id}", state.unique_user(an_index, 'Updated')
+
+
+def _delete(state: ScenarioState, _: int) -> Tuple[str, None]:
+    try:
+        an_id = state.created.popleft()
+    except IndexError:
+        an_id = state.size + 1_000_000_000
+    return f"{BASE_PATH}/{an_id}", None
+
+
+SCENARIOS = (
+    Scenario('list', 'GET', 206, _list()),
+    Scenario('list_sorted', 'GET', 206, _list('&sort=name&direction=desc')),
+    Scenario('list_terms', 'GET', 206, _list_terms()),
+    Scenario('list_terms_sorted', 'GET', 206, _list_terms('&sort=email&direction=asc')),
+    Scenario('list_deep_page', 'GET', 206, _list_deep_page),
+    Scenario('get', 'GET', 200, _get),
+    Scenario('create', 'POST', 201, _create, _record_created),
+    Scenario('update', 'PUT', 200, _update),
+    Scenario('delete', 'DELETE', 204, _delete),
+)
@@ -0,0 +1,73 @@
+import argparse
+import time
+import tracemalloc
+
+from flask import Flask, request
+
+from src.infra.adapters.api.request_adapter import request_adapter
+from src.infra.api.presentation.http_types.http_request import HttpRequest
+from src.infra.api.presentation.http_types.http_response import HttpResponse
+
+HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, br',
+    'User-Agent': 'request-adapter-benchmark/1.0',
+    'X-Request-Id': '6f1c3a52-3f0e-4f38-9d5c-2f3a1c0a7b11',
+}
+
+
+def eager_request_adapter(a_request, controller):
+    body = a_request.json if a_request.data else None
+    return controller(HttpRequest(
+        a_body=body,
+        a_headers=a_request.headers,
+        a_query_params=a_request.args,
+        a_path_params=a_request.view_args,
+        an_url=a_request.full_path,
+    ))
+
+
+def get_by_id(http_request: HttpRequest) -> HttpResponse:
+    return HttpResponse(a_status_code=200, a_body={'id': http_request.path_params['id']})
+
+
+def measure(app: Flask, an_adapter, a_requests: int) -> tuple[float, float]:
+    contexts = [
+        app.test_request_context(f'/api/v1/users/{index}?fields=id,name', headers=HEADERS)
+        for index in range(a_requests)
+    ]
+    responses = []
+    allocated = 0
+    elapsed = 0.0
+
+    tracemalloc.start()
+    for index, context in enumerate(contexts):
+        context.push()
+        request.view_args = {'id': index}
+        before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        responses.append(an_adapter(request, get_by_id))
+        elapsed += time.perf_counter() - started
+        allocated += tracemalloc.get_traced_memory()[0] - before
+        context.pop()
+    tracemalloc.stop()
+
+    return allocated / a_requests, elapsed / a_requests * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare eager and lazy request adapters on the GET-by-id path")
+    parser.add_argument('--requests', type=int, default=5000, help="Requests per adapter")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    results = {}
+    for name, adapter in (('eager', eager_request_adapter), ('lazy', request_adapter)):
+        results[name] = measure(app, adapter, args.requests)
+        print(f"{name:>6}: {results[name][0]:8.1f} bytes retained/request  {results[name][1]:6.2f} us/request")
+
+    print(f"  lazy: {results['eager'][0] / max(results['lazy'][0], 1):.2f}x fewer bytes than eager")
+
+
+if __name__ == '__main__':
+    main()
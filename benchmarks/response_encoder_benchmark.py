@@ -0,0 +1,52 @@
+import argparse
+import timeit
+
+from flask import Flask
+
+from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
+from src.domain.pagination.pagination import Pagination
+from src.infra.api.presentation.encoders import ResponseEncoders
+
+
+def build_page(an_items: int) -> Pagination[ListUserOutput]:
+    return Pagination.of(
+        current_page=1,
+        per_page=an_items,
+        total=an_items * 100,
+        items=[ListUserOutput(index, f"User {index}", f"user{index}@example.com") for index in range(an_items)],
+        total_exact=True
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare response encoder throughput on a list page")
+    parser.add_argument('--items', type=int, default=500, help="Users per page")
+    parser.add_argument('--iterations', type=int, default=200, help="Encodes per measurement")
+    parser.add_argument('--repeat', type=int, default=5, help="Measurements per encoder, the best one is reported")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    page = build_page(args.items)
+    results = {}
+
+    with app.app_context():
+        for name in ResponseEncoders.ENCODERS:
+            try:
+                encoder = ResponseEncoders.create(name)
+            except ValueError as error:
+                print(f"{name:>8}: skipped ({error})")
+                continue
+
+            size = len(encoder.encode(page))
+            best = min(timeit.repeat(lambda: encoder.encode(page), number=args.iterations, repeat=args.repeat))
+            results[name] = args.iterations / best
+            print(f"{name:>8}: {results[name]:10.1f} pages/s  {results[name] * size / 1024 / 1024:8.1f} MiB/s  "
+                  f"({size} bytes/page)")
+
+    if 'jsonify' in results:
+        for name, pages_per_second in results.items():
+            print(f"{name:>8}: {pages_per_second / results['jsonify']:.2f}x jsonify")
+
+
+if __name__ == '__main__':
+    main()
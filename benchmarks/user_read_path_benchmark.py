@@ -0,0 +1,67 @@
+import argparse
+import timeit
+import tracemalloc
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from src.infra.db.settings.base import Base
+from src.infra.persistence.entities.users import UserEntity
+from src.infra.persistence.repositories import UsersRepository
+
+
+def seed(a_session: Session, a_count: int) -> None:
+    a_session.execute(
+        insert(UserEntity.__table__),
+        [{'name': f"User {index}", 'email': f"user{index}@example.com"} for index in range(a_count)]
+    )
+    a_session.commit()
+
+
+def orm_page(a_session: Session, a_page_size: int) -> list:
+    users = a_session.query(UserEntity).order_by(UserEntity.id).limit(a_page_size).all()
+    items = [user.to_dict() for user in users]
+    a_session.expunge_all()
+    return items
+
+
+def core_page(a_session: Session, a_page_size: int) -> list:
+    statement = UsersRepository._select_list_statement().order_by(UserEntity.__table__.c.id).limit(a_page_size)
+    return UsersRepository._to_list_outputs(a_session.execute(statement))
+
+
+def page_memory(a_read, a_session: Session, a_page_size: int) -> tuple[int, int]:
+    tracemalloc.start()
+    items = a_read(a_session, a_page_size)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return retained, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare ORM and Core read paths for one page of users")
+    parser.add_argument('--page-size', type=int, default=1000, help="Users per page")
+    parser.add_argument('--iterations', type=int, default=50, help="Pages per measurement")
+    parser.add_argument('--repeat', type=int, default=5, help="Measurements per path, the best one is reported")
+    args = parser.parse_args()
+
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    results = {}
+
+    with Session(engine) as session:
+        seed(session, args.page_size)
+        for name, read in (('orm', orm_page), ('core', core_page)):
+            read(session, args.page_size)
+            best = min(timeit.repeat(lambda: read(session, args.page_size), number=args.iterations, repeat=args.repeat))
+            retained, peak = page_memory(read, session, args.page_size)
+            results[name] = args.page_size * args.iterations / best
+            print(f"{name:>5}: {results[name]:12.1f} rows/s  {retained / 1024:8.1f} KiB/page retained  "
+                  f"{peak / 1024:8.1f} KiB/page peak")
+
+    print(f" core: {results['core'] / results['orm']:.2f}x orm")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import re
+import timeit
+from typing import Dict, List
+
+from src.domain.notification import Notification
+from src.domain.user.user import User
+from src.domain.validators.user_validator import UserValidator
+
+
+def build_users(a_count: int) -> List[User]:
+    users = []
+    for index in range(a_count):
+        if index % 10 == 0:
+            users.append(User(a_name=f"User {index}", an_email=f"user{index}.example.com"))
+        else:
+            users.append(User(a_name=f"User {index}", an_email=f"user{index}@mail.example.com"))
+    return users
+
+
+def legacy_validate(users: List[User]) -> Dict[int, List[str]]:
+    errors = {}
+    for index, user in enumerate(users):
+        notification = Notification()
+        if not user.name:
+            notification.add_error("Name cannot be empty")
+        elif len(user.name) < 3:
+            notification.add_error("Name must have at least 3 characters")
+        elif len(user.name) > 50:
+            notification.add_error("Name must have less than 50 characters")
+        if not user.email:
+            notification.add_error("Email cannot be empty")
+        elif len(user.email) > 120:
+            notification.add_error("Email must have less than 120 characters")
+        elif not re.match(UserValidator.EMAIL_PATTERN, user.email):
+            notification.add_error("Invalid email format")
+        if notification.has_errors():
+            errors[index] = notification.get_errors()
+    return errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-user and batch user validation")
+    parser.add_argument('--users', type=int, default=10000, help="Users per batch")
+    parser.add_argument('--repeat', type=int, default=5, help="Measurements per validator, the best one is reported")
+    args = parser.parse_args()
+
+    users = build_users(args.users)
+    if legacy_validate(users) != UserValidator.validate_many(users):
+        raise SystemExit("Validators disagree")
+
+    results = {}
+    for name, validate in (('legacy', legacy_validate), ('batch', UserValidator.validate_many)):
+        best = min(timeit.repeat(lambda: validate(users), number=1, repeat=args.repeat))
+        results[name] = args.users / best
+        print(f"{name:>7}: {results[name]:12.1f} users/s")
+
+    print(f"  batch: {results['batch'] / results['legacy']:.2f}x legacy")
+
+
+if __name__ == '__main__':
+    main()
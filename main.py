@@ -1,10 +1,30 @@
+import uvicorn
+
+from src.infra.api.routes.base_routes import BaseRoutes
 from src.infra.server import app
 from src.infra.config.settings import settings
+from src.infra.db.migrations import MigrationRunner
+from src.infra.db.settings.engine_registry import EngineRegistry
+from src.infra.db.settings.sqlite_pragmas import SqlitePragmas
+from src.infra.production_server import ProductionServer
 
 
 if __name__ == "__main__":
     print(f"Starting {settings.APP_NAME}")
     print(f"Running on port {settings.APP_PORT}")
     print(f"Environment: {settings.APP_ENV}")
-    app.run(host=settings.APP_HOST, port=settings.APP_PORT)
-
+    print(f"Server: {settings.APP_SERVER} ({settings.APP_SERVER_MODE})")
+    print(f"Response encoder: {BaseRoutes.encoder.name}")
+    engine = EngineRegistry.get_engine()
+    if settings.DB_AUTO_MIGRATE:
+        applied = MigrationRunner(engine).upgrade()
+        print(f"Applied {len(applied)} pending migration(s)")
+    if engine.dialect.name == 'sqlite':
+        print(f"SQLite pragmas ({settings.DB_SQLITE_PROFILE}): {SqlitePragmas.effective(engine)}")
+    if settings.APP_SERVER_MODE == 'production':
+        EngineRegistry.dispose_all()
+        ProductionServer(settings.APP_SERVER).run()
+    elif settings.APP_SERVER == 'asgi':
+        uvicorn.run('src.infra.asgi_server:app', host=settings.APP_HOST, port=settings.APP_PORT)
+    else:
+        app.run(host=settings.APP_HOST, port=settings.APP_PORT)
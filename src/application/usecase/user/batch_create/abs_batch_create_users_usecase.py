@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from src.application.shared.usecase import UseCase
+from src.application.usecase.user.batch_create.batch_create_users_input import BatchCreateUsersInput
+from src.application.usecase.user.batch_create.batch_create_users_output import BatchCreateUsersOutput
+
+
+class AbsBatchCreateUsersUseCase(UseCase[BatchCreateUsersInput, BatchCreateUsersOutput], ABC):
+
+    @abstractmethod
+    def execute(self, input_data: BatchCreateUsersInput) -> BatchCreateUsersOutput:
+        pass
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import List
+
+from src.application.usecase.user.create.create_user_input import CreateUserInput
+
+
+@dataclass
+class BatchCreateUsersInput:
+    items: List[CreateUserInput]
+    all_or_nothing: bool = True
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class BatchCreateUserItemOutput:
+    index: int
+    status: str
+    id: Optional[int] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchCreateUsersOutput:
+    all_or_nothing: bool
+    created: int
+    rejected: int
+    items: List[BatchCreateUserItemOutput]
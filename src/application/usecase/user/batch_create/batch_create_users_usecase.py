@@ -0,0 +1,71 @@
+from typing import Dict, List
+
+from src.application.usecase.user.batch_create.abs_batch_create_users_usecase import AbsBatchCreateUsersUseCase
+from src.application.usecase.user.batch_create.batch_create_users_input import BatchCreateUsersInput
+from src.application.usecase.user.batch_create.batch_create_users_output import (
+    BatchCreateUserItemOutput,
+    BatchCreateUsersOutput,
+)
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+from src.domain.validators.user_validator import UserValidator
+
+
+class BatchCreateUsersUseCase(AbsBatchCreateUsersUseCase):
+    CREATED = 'created'
+    REJECTED = 'rejected'
+    SKIPPED = 'skipped'
+
+    def __init__(self, user_gateway: AbsUsersGateway):
+        self.__user_gateway = user_gateway
+
+    def execute(self, input_data: BatchCreateUsersInput) -> BatchCreateUsersOutput:
+        users = [User(a_name=item.name, an_email=item.email) for item in input_data.items]
+        errors = self.__validate(users)
+
+        valid_indexes = [index for index in range(len(users)) if index not in errors]
+        if errors and input_data.all_or_nothing:
+            valid_indexes = []
+
+        results = self.__user_gateway.insert_users(
+            [users[index] for index in valid_indexes],
+            input_data.all_or_nothing
+        ) if valid_indexes else []
+
+        items = [
+            BatchCreateUserItemOutput(index=index, status=self.SKIPPED, name=user.name, email=user.email)
+            for index, user in enumerate(users)
+        ]
+        for index, messages in errors.items():
+            items[index].status = self.REJECTED
+            items[index].errors = messages
+        for index, result in zip(valid_indexes, results):
+            if result.inserted:
+                items[index].status = self.CREATED
+                items[index].id = result.user.id
+            elif result.errors:
+                items[index].status = self.REJECTED
+                items[index].errors = result.errors
+
+        return BatchCreateUsersOutput(
+            all_or_nothing=input_data.all_or_nothing,
+            created=sum(1 for item in items if item.status == self.CREATED),
+            rejected=sum(1 for item in items if item.status == self.REJECTED),
+            items=items
+        )
+
+    @staticmethod
+    def __validate(users: List[User]) -> Dict[int, List[str]]:
+        errors: Dict[int, List[str]] = UserValidator.validate_many(users)
+        seen_names = set()
+        seen_emails = set()
+
+        for index, user in enumerate(users):
+            if user.name and user.name in seen_names:
+                errors.setdefault(index, []).append("Name is duplicated in this batch")
+            if user.email and user.email in seen_emails:
+                errors.setdefault(index, []).append("Email is duplicated in this batch")
+            seen_names.add(user.name)
+            seen_emails.add(user.email)
+
+        return errors
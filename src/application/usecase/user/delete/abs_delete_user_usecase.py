@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 
 from src.application.shared.unit_usecase import UnitUseCase
+from src.application.usecase.user.delete.delete_user_input import DeleteUserInput
 
 
-class AbsDeleteUserUseCase(UnitUseCase[int], ABC):
+class AbsDeleteUserUseCase(UnitUseCase[DeleteUserInput], ABC):
     @abstractmethod
-    def execute(self, an_id: int) -> None:
+    def execute(self, an_input: DeleteUserInput) -> None:
         raise NotImplementedError
\ No newline at end of file
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DeleteUserInput:
+    id: int
+    version: int = None
@@ -1,4 +1,5 @@
 from src.application.usecase.user.delete.abs_delete_user_usecase import AbsDeleteUserUseCase
+from src.application.usecase.user.delete.delete_user_input import DeleteUserInput
 from src.domain.user.abs_user_gateway import AbsUsersGateway
 
 
@@ -7,5 +8,5 @@ class DeleteUserUseCase(AbsDeleteUserUseCase):
     def __init__(self, gateway: AbsUsersGateway):
         self.__gateway = gateway
 
-    def execute(self, an_id: int) -> bool:
-        return self.__gateway.delete_user(an_id)
+    def execute(self, an_input: DeleteUserInput) -> bool:
+        return self.__gateway.delete_user(an_input.id, an_input.version)
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from src.application.shared.nullary_usecase import NullaryUseCase
+from src.domain.user.user import User
+
+
+class AbsExportUsersUseCase(NullaryUseCase[Iterator[User]], ABC):
+
+    @abstractmethod
+    def execute(self) -> Iterator[User]:
+        pass
@@ -0,0 +1,13 @@
+from typing import Iterator
+
+from src.application.usecase.user.export.abs_export_users_usecase import AbsExportUsersUseCase
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+
+
+class ExportUsersUseCase(AbsExportUsersUseCase):
+    def __init__(self, user_gateway: AbsUsersGateway):
+        self.__user_gateway = user_gateway
+
+    def execute(self) -> Iterator[User]:
+        return self.__user_gateway.stream_users()
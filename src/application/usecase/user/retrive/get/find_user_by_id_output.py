@@ -5,4 +5,5 @@ from dataclasses import dataclass
 class FindUserByIdOutput:
     id: int
     name: str
-    email: str
\ No newline at end of file
+    email: str
+    version: int = None
\ No newline at end of file
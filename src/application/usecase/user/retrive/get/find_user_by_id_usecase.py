@@ -12,4 +12,4 @@ class FindUserByIdUseCase(AbsFindUserByIdUseCase):
         if not user:
             return None
 
-        return FindUserByIdOutput(user.id, user.name, user.email)
\ No newline at end of file
+        return FindUserByIdOutput(user.id, user.name, user.email, user.version)
\ No newline at end of file
@@ -9,4 +9,8 @@ class AbsListUserUseCase(UseCase[SearchQuery, Pagination[ListUserOutput]], ABC):
 
     @abstractmethod
     def execute(self, search_query: SearchQuery) -> Pagination[ListUserOutput]:
+        pass
+
+    @abstractmethod
+    def revision(self) -> int:
         pass
\ No newline at end of file
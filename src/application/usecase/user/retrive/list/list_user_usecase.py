@@ -13,3 +13,6 @@ class ListUserUseCase(AbsListUserUseCase):
         response = self.__user_gateway.list_all_users(search_query)
 
         return response
+
+    def revision(self) -> int:
+        return self.__user_gateway.get_users_revision()
\ No newline at end of file
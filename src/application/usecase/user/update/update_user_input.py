@@ -5,3 +5,4 @@ class UpdateUserInput:
     id: int
     name: str
     email: str
+    version: int = None
@@ -5,8 +5,10 @@ class UpdateUserOutput:
     id: int
     name: str
     email: str
+    version: int
 
-    def __init__(self, id=None, name=None, email=None):
+    def __init__(self, id=None, name=None, email=None, version=None):
         self.id = id
         self.name = name
         self.email = email
+        self.version = version
@@ -6,6 +6,7 @@ from src.application.usecase.user.update.update_user_output import UpdateUserOut
 from src.domain.exceptions.types.validation_exception import ValidationException
 from src.domain.notification import Notification
 from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
 
 
 class UpdateUserUseCase(AbsUpdateUserUseCase):
@@ -16,25 +17,22 @@ class UpdateUserUseCase(AbsUpdateUserUseCase):
     def execute(self, an_input: UpdateUserInput) -> UpdateUserOutput | None:
         notification = Notification()
 
-        an_id = an_input.id
+        user_changes = User(an_id=an_input.id, a_name=an_input.name, an_email=an_input.email)
 
-        user_to_update = self.__gateway.get_user(an_id)
-
-        if user_to_update is None:
-            return None
-
-        user_updated = user_to_update.update(a_name=an_input.name, an_email=an_input.email)
-
-        user_updated.validate(notification)
+        user_changes.validate(notification, partial=True)
 
         if notification.has_errors():
             _errors: List[str] = notification.get_errors()
             raise ValidationException(','.join(_errors))
 
-        self.__gateway.update_user(user_updated)
+        user_updated = self.__gateway.update_user(user_changes, an_input.version)
+
+        if user_updated is None:
+            return None
 
         return UpdateUserOutput(
             id=user_updated.id,
             name=user_updated.name,
-            email=user_updated.email
+            email=user_updated.email,
+            version=user_updated.version
         )
\ No newline at end of file
@@ -1,3 +1,5 @@
 from src.domain.exceptions.types.http_bad_request import BadRequestException
 from src.domain.exceptions.types.http_not_found import NotFoundException
-from src.domain.exceptions.types.integrity_exception import IntegrityException
\ No newline at end of file
+from src.domain.exceptions.types.integrity_exception import IntegrityException
+from src.domain.exceptions.types.precondition_failed_exception import PreconditionFailedException
+from src.domain.exceptions.types.payload_too_large_exception import PayloadTooLargeException
\ No newline at end of file
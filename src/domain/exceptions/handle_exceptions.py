@@ -1,17 +1,24 @@
-from src.domain.exceptions import BadRequestException, NotFoundException, IntegrityException
+from src.domain.exceptions import BadRequestException, NotFoundException, IntegrityException, PreconditionFailedException, \
+    PayloadTooLargeException
 from src.domain.exceptions.types.validation_exception import ValidationException
 from src.infra.api.presentation.http_types.http_response import HttpResponse
+from sqlalchemy.exc import IntegrityError as SqlAlchemyIntegrityError
 from sqlite3 import IntegrityError
 import re
 
 
 class HandleException:
+    FIELD_LABELS = {'name': 'nome'}
 
     @staticmethod
     def handle(exception: Exception) -> HttpResponse:
-        if isinstance(exception, (NotFoundException, BadRequestException, IntegrityException, ValidationException)):
+        if isinstance(exception, (NotFoundException, BadRequestException, IntegrityException, ValidationException,
+                                  PreconditionFailedException, PayloadTooLargeException)):
             return HandleException.__handle_domain_exception(exception)
 
+        if isinstance(exception, SqlAlchemyIntegrityError):
+            exception = exception.orig
+
         if isinstance(exception, IntegrityError) and "UNIQUE constraint failed" in str(exception):
             return HandleException.__handle_sqlite_integrity_error(exception)
 
@@ -27,8 +34,11 @@ class HandleException:
     @staticmethod
     def __handle_sqlite_integrity_error(exception: IntegrityError) -> HttpResponse:
         field_match = re.search(r'UNIQUE constraint failed: \w+\.(\w+)', str(exception))
-        field_name = field_match.group(1) if field_match else 'field'
-        raise IntegrityException(f"This {field_name} already exists in the system")
+        field_name = field_match.group(1) if field_match else 'campo'
+        field_label = HandleException.FIELD_LABELS.get(field_name, field_name)
+        return HandleException.__handle_domain_exception(
+            IntegrityException(f"Este {field_label} já está cadastrado no sistema")
+        )
 
     @staticmethod
     def __handle_generic_error(exception: Exception) -> HttpResponse:
@@ -0,0 +1,6 @@
+class PayloadTooLargeException(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+        self.name = "Payload Too Large"
+        self.status_code = 413
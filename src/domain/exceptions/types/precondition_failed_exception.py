@@ -0,0 +1,6 @@
+class PreconditionFailedException(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+        self.name = "Precondition Failed"
+        self.status_code = 412
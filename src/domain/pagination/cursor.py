@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.exceptions import BadRequestException
+
+
+@dataclass(frozen=True)
+class Cursor:
+    sort: str
+    direction: str
+    value: Any = None
+    id: int = None
+    backward: bool = False
+
+    @property
+    def is_first_page(self) -> bool:
+        return self.id is None
+
+    def encode(self) -> str:
+        payload = {'s': self.sort, 'd': self.direction, 'v': self.value, 'i': self.id, 'b': int(self.backward)}
+        raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(a_token: str, a_sort: str = 'id', a_direction: str = 'asc') -> 'Cursor':
+        if not a_token:
+            return Cursor(sort=a_sort, direction=a_direction)
+
+        try:
+            padded = a_token + '=' * (-len(a_token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return Cursor(
+                sort=str(payload['s']),
+                direction=str(payload['d']),
+                value=payload['v'],
+                id=int(payload['i']),
+                backward=bool(payload['b'])
+            )
+        except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+            raise BadRequestException("Invalid pagination cursor")
@@ -1,16 +1,21 @@
 from dataclasses import dataclass
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 
 
 T = TypeVar('T')
 
 @dataclass
 class Pagination(Generic[T]):
-    current_page: int
+    current_page: Optional[int]
     per_page: int
-    total: int
+    total: Optional[int]
     items: List[T]
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+    total_exact: Optional[bool] = None
 
     @staticmethod
-    def of(current_page: int, per_page: int, total: int,items: List[T]):
-        return Pagination(current_page, per_page, total, items)
\ No newline at end of file
+    def of(current_page: Optional[int], per_page: int, total: Optional[int], items: List[T],
+           next_cursor: Optional[str] = None, previous_cursor: Optional[str] = None,
+           total_exact: Optional[bool] = None):
+        return Pagination(current_page, per_page, total, items, next_cursor, previous_cursor, total_exact)
@@ -10,6 +10,12 @@ class SearchQuery:
     terms: str
     sort: str
     direction: str
+    cursor: str = None
+    include_total: bool = True
+
+    @property
+    def is_keyset(self) -> bool:
+        return self.cursor is not None
 
     @staticmethod
     def create(http_request: HttpRequest) -> 'SearchQuery':
@@ -18,15 +24,20 @@ class SearchQuery:
             per_page=http_request.query_params.get("per_page"),
             terms=http_request.query_params.get("terms"),
             sort=http_request.query_params.get("sort"),
-            direction=http_request.query_params.get("direction")
+            direction=http_request.query_params.get("direction"),
+            cursor=http_request.query_params.get("cursor"),
+            include_total=str(http_request.query_params.get("include_total", "true")).lower() not in ("false", "0", "no")
         )
 
     @staticmethod
-    def of(page: int, per_page: int, terms:str = None, sort: str = None, direction: str = None) -> 'SearchQuery':
+    def of(page: int, per_page: int, terms:str = None, sort: str = None, direction: str = None,
+           cursor: str = None, include_total: bool = True) -> 'SearchQuery':
         return SearchQuery(
-            page=int(page),
+            page=int(page) if page is not None else None,
             per_page=int(per_page),
             terms=terms,
             sort=sort,
-            direction=direction
-        )
\ No newline at end of file
+            direction=direction,
+            cursor=cursor,
+            include_total=include_total
+        )
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from src.domain.user.user import User
+
+
+class AbsAsyncUsersGateway(ABC):
+
+    @abstractmethod
+    async def insert_usr(self, an_user: User) -> User: pass
+
+    @abstractmethod
+    async def get_user(self, an_id: int) -> User | None: pass
+
+    @abstractmethod
+    async def update_user(self, an_user: User, an_expected_version: int = None) -> User | None: pass
+
+    @abstractmethod
+    async def delete_user(self, an_id: int, an_expected_version: int = None) -> bool: pass
+
+    @abstractmethod
+    async def get_users_revision(self) -> int: pass
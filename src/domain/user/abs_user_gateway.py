@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, List
 
 from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
 from src.domain.pagination.pagination import Pagination
 from src.domain.pagination.search_query import SearchQuery
 from src.domain.user.user import User
+from src.domain.user.user_insert_result import UserInsertResult
 
 
 class AbsUsersGateway(ABC):
@@ -11,6 +13,9 @@ class AbsUsersGateway(ABC):
     @abstractmethod
     def insert_usr(self, an_user: User) -> User: pass
 
+    @abstractmethod
+    def insert_users(self, an_users: List[User], all_or_nothing: bool = True) -> List[UserInsertResult]: pass
+
     @abstractmethod
     def get_user(self, an_id: int) -> User: pass
 
@@ -18,7 +23,13 @@ class AbsUsersGateway(ABC):
     def list_all_users(self, a_search: SearchQuery) -> Pagination[ListUserOutput]: pass
 
     @abstractmethod
-    def update_user(self, an_user: User) -> None: pass
+    def stream_users(self) -> Iterator[User]: pass
+
+    @abstractmethod
+    def update_user(self, an_user: User, an_expected_version: int = None) -> User | None: pass
+
+    @abstractmethod
+    def delete_user(self, an_id: int, an_expected_version: int = None) -> bool: pass
 
     @abstractmethod
-    def delete_user(self, an_id: int) -> bool: pass
+    def get_users_revision(self) -> int: pass
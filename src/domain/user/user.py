@@ -3,10 +3,11 @@ from src.domain.validators.user_validator import UserValidator
 
 class User:
 
-    def __init__(self, an_id: int=None, a_name: str=None, an_email: str=None) -> None:
+    def __init__(self, an_id: int=None, a_name: str=None, an_email: str=None, a_version: int=None) -> None:
         self._id = an_id
         self._name = a_name
         self._email = an_email
+        self._version = a_version
 
 
     def __repr__(self) -> str:
@@ -24,15 +25,20 @@ class User:
     def email(self) -> str:
         return self._email
 
+    @property
+    def version(self) -> int:
+        return self._version
+
     def update(self, an_id: int = None, a_name: str = None, an_email: str = None) -> 'User':
         return User(
             an_id or self._id,
             a_name or self._name,
-            an_email or self._email
+            an_email or self._email,
+            self._version
         )
 
-    def validate(self, notification: Notification) -> None:
-        UserValidator(self, notification).validate()
+    def validate(self, notification: Notification, partial: bool = False) -> None:
+        UserValidator(self, notification).validate(partial)
 
     def __eq__(self, other):
         if not isinstance(other, User):
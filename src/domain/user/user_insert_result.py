@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.domain.user.user import User
+
+
+@dataclass(frozen=True)
+class UserInsertResult:
+    user: Optional[User] = None
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def inserted(self) -> bool:
+        return self.user is not None
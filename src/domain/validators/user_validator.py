@@ -1,29 +1,65 @@
 import re
+import string
+from typing import Dict, Iterable, List, Optional, Sequence
+
 from src.domain.notification import Notification
 
 
 class UserValidator:
     EMAIL_PATTERN = r'''(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9]))\.){3}(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])'''
+    EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+    EMAIL_FIRST_CHARACTERS = frozenset(string.ascii_lowercase + string.digits + "!#$%&'*+/=?^_`{|}~-\"")
+    NO_ERRORS: Sequence[str] = ()
 
     def __init__(self, user, notification: Notification):
         self._name = user.name
         self._email = user.email
         self._notification = notification
 
-    def validate(self) -> Notification:
+    def validate(self, partial: bool = False) -> Notification:
+        for error in self.errors_for(self._name, self._email, partial):
+            self._notification.add_error(error)
+
+        return self._notification
 
-        if not self._name:
-            self._notification.add_error("Name cannot be empty")
-        elif len(self._name) < 3:
-            self._notification.add_error("Name must have at least 3 characters")
-        elif len(self._name) > 50:
-            self._notification.add_error("Name must have less than 50 characters")
+    @classmethod
+    def validate_many(cls, users: Iterable, partial: bool = False) -> Dict[int, List[str]]:
+        errors: Dict[int, List[str]] = {}
+        errors_for = cls.errors_for
 
-        if not self._email:
-            self._notification.add_error("Email cannot be empty")
-        elif len(self._email) > 120:
-            self._notification.add_error("Email must have less than 120 characters")
-        elif not re.match(UserValidator.EMAIL_PATTERN, self._email):
-            self._notification.add_error("Invalid email format")
+        for index, user in enumerate(users):
+            messages = errors_for(user.name, user.email, partial)
+            if messages:
+                errors[index] = messages
 
-        return self._notification
+        return errors
+
+    @classmethod
+    def errors_for(cls, a_name: Optional[str], an_email: Optional[str], partial: bool = False) -> Sequence[str]:
+        name_error = None
+        if not a_name:
+            if not partial:
+                name_error = "Name cannot be empty"
+        elif len(a_name) < 3:
+            name_error = "Name must have at least 3 characters"
+        elif len(a_name) > 50:
+            name_error = "Name must have less than 50 characters"
+
+        email_error = None
+        if not an_email:
+            if not partial:
+                email_error = "Email cannot be empty"
+        elif len(an_email) > 120:
+            email_error = "Email must have less than 120 characters"
+        elif not cls.is_valid_email(an_email):
+            email_error = "Invalid email format"
+
+        if name_error is None and email_error is None:
+            return cls.NO_ERRORS
+        return [error for error in (name_error, email_error) if error is not None]
+
+    @classmethod
+    def is_valid_email(cls, an_email: str) -> bool:
+        if an_email[0] not in cls.EMAIL_FIRST_CHARACTERS or '@' not in an_email:
+            return False
+        return cls.EMAIL_REGEX.match(an_email) is not None
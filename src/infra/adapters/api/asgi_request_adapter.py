@@ -0,0 +1,52 @@
+from typing import Any
+
+from starlette.requests import Request
+
+from src.infra.adapters.api.request_adapter import _check_content_length, _parse_body, _payload_too_large
+from src.infra.api.presentation.http_types.http_request import HttpRequest
+from src.infra.api.presentation.http_types.http_request_source import HttpRequestSource
+from src.infra.config.settings import settings
+
+
+class AsgiRequestSource(HttpRequestSource):
+    __slots__ = ('__request', '__payload')
+
+    def __init__(self, a_request: Request, a_payload: bytes):
+        self.__request = a_request
+        self.__payload = a_payload
+
+    def body(self) -> Any:
+        mimetype = self.__request.headers.get('content-type', '').split(';')[0].strip().lower()
+        return _parse_body(self.__payload, mimetype)
+
+    def headers(self):
+        return self.__request.headers
+
+    def query_params(self):
+        return self.__request.query_params
+
+    def url(self) -> str:
+        url = self.__request.url
+        return url.path + (f"?{url.query}" if url.query else '')
+
+
+async def asgi_request_adapter(request: Request, a_path_params: dict = None) -> HttpRequest:
+    length = request.headers.get('content-length')
+    _check_content_length(int(length) if length and length.isdigit() else None)
+
+    return HttpRequest.from_source(
+        AsgiRequestSource(request, await _read_payload(request)),
+        a_path_params=a_path_params or dict(request.path_params),
+        an_ipv4=request.client.host if request.client else None,
+    )
+
+
+async def _read_payload(request: Request) -> bytes:
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > settings.REQUEST_MAX_BODY_BYTES:
+            raise _payload_too_large()
+        chunks.append(chunk)
+    return b''.join(chunks)
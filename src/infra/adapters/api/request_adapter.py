@@ -1,23 +1,80 @@
-from typing import Callable
+import json
+from typing import Any, Callable, List, Optional
 
 from flask import request as FlaskRequest
+from werkzeug.exceptions import RequestEntityTooLarge
 
+from src.domain.exceptions import BadRequestException, PayloadTooLargeException
 from src.infra.api.presentation.http_types.http_request import HttpRequest
+from src.infra.api.presentation.http_types.http_request_source import HttpRequestSource
 from src.infra.api.presentation.http_types.http_response import HttpResponse
+from src.infra.config.settings import settings
+
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson')
+
+
+class FlaskRequestSource(HttpRequestSource):
+    __slots__ = ('__request',)
+
+    def __init__(self, a_request: FlaskRequest):
+        self.__request = a_request
+
+    def body(self) -> Any:
+        try:
+            payload = self.__request.get_data(cache=False)
+        except RequestEntityTooLarge:
+            raise _payload_too_large()
+        return _parse_body(payload, self.__request.mimetype)
+
+    def headers(self):
+        return self.__request.headers
+
+    def query_params(self):
+        return self.__request.args
+
+    def url(self) -> str:
+        return self.__request.full_path
 
 
 def request_adapter(request: FlaskRequest, controller: Callable) -> HttpResponse:
-    body = None
-    if request.data:
-        body = request.json
+    _check_content_length(request.content_length)
+    request.max_content_length = settings.REQUEST_MAX_BODY_BYTES
+
+    http_request = HttpRequest.from_source(FlaskRequestSource(request), a_path_params=request.view_args)
+
+    return controller(http_request)
+
+
+def _check_content_length(a_length: Optional[int]) -> None:
+    if a_length is not None and a_length > settings.REQUEST_MAX_BODY_BYTES:
+        raise _payload_too_large()
+
+
+def _payload_too_large() -> PayloadTooLargeException:
+    return PayloadTooLargeException(f"Request body cannot exceed {settings.REQUEST_MAX_BODY_BYTES} bytes")
+
 
+def _parse_body(a_payload: bytes, a_mimetype: str) -> Any:
+    if not a_payload:
+        return None
+    if a_mimetype in NDJSON_MIMETYPES:
+        try:
+            return _parse_ndjson(a_payload.decode('utf-8'))
+        except UnicodeDecodeError as error:
+            raise BadRequestException(f"Invalid NDJSON body: {error}")
+    try:
+        return json.loads(a_payload)
+    except ValueError as error:
+        raise BadRequestException(f"Invalid JSON body: {error}")
 
-    http_request = HttpRequest(
-        a_body=body,
-        a_headers=request.headers,
-        a_query_params=request.args,
-        a_path_params=request.view_args,
-        an_url=request.full_path,
-    )
 
-    return controller(http_request)
\ No newline at end of file
+def _parse_ndjson(a_payload: str) -> List[dict]:
+    items = []
+    for line_number, line in enumerate(a_payload.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            items.append(json.loads(line))
+        except json.JSONDecodeError as error:
+            raise BadRequestException(f"Invalid NDJSON body: {error.msg} at line {line_number}")
+    return items
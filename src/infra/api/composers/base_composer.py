@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Mapping
 from abc import ABC, abstractmethod
 
 
@@ -7,6 +7,10 @@ from src.infra.api.presentation.http_types.http_response import HttpResponse
 
 
 class BaseComposer(ABC):
+    @property
+    @abstractmethod
+    def handlers(self) -> Mapping[str, Callable[[HttpRequest], HttpResponse]]: pass
+
     @abstractmethod
     def list(self) ->  Callable[[HttpRequest], HttpResponse]: pass
 
@@ -16,8 +20,14 @@ class BaseComposer(ABC):
     @abstractmethod
     def create(self) ->  Callable[[HttpRequest], HttpResponse]: pass
 
+    @abstractmethod
+    def batch_create(self) ->  Callable[[HttpRequest], HttpResponse]: pass
+
     @abstractmethod
     def update(self) ->  Callable[[HttpRequest], HttpResponse]: pass
 
+    @abstractmethod
+    def export(self) ->  Callable[[HttpRequest], HttpResponse]: pass
+
     @abstractmethod
     def delete(self) ->  Callable[[HttpRequest], HttpResponse]: pass
@@ -1,42 +1,81 @@
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Mapping
 
+from src.application.usecase.user.batch_create.batch_create_users_usecase import BatchCreateUsersUseCase
 from src.application.usecase.user.create.create_user_usecase import CreateUserUseCase
 from src.application.usecase.user.delete.delete_user_usecase import DeleteUserUseCase
+from src.application.usecase.user.export.export_users_usecase import ExportUsersUseCase
 from src.application.usecase.user.retrive.get.find_user_by_id_usecase import FindUserByIdUseCase
 from src.application.usecase.user.retrive.list.list_user_usecase import ListUserUseCase
 from src.application.usecase.user.update.update_user_usecase import UpdateUserUseCase
+from src.domain.user.abs_user_gateway import AbsUsersGateway
 from src.infra.api.composers.base_composer import BaseComposer
 from src.infra.api.controller.user.user_controller import UserController
 from src.infra.api.presentation.http_types.http_request import HttpRequest
 from src.infra.api.presentation.http_types.http_response import HttpResponse
-from src.infra.persistence.repositories import UsersRepository
+from src.infra.cache.lru_cache import LRUCache
+from src.infra.config.settings import settings
+from src.infra.metrics import CacheMetrics
+from src.infra.persistence.repositories import UsersRepository, CachedUsersRepository
 
 
 class UserComposer(BaseComposer):
-    def __init__(self):
-        self.__repository = UsersRepository()
-        self.__controller = UserController()
+    USE_CASES = {
+        'list': ListUserUseCase,
+        'get': FindUserByIdUseCase,
+        'create': CreateUserUseCase,
+        'batch_create': BatchCreateUsersUseCase,
+        'update': UpdateUserUseCase,
+        'delete': DeleteUserUseCase,
+        'export': ExportUsersUseCase,
+    }
 
-    def list(self) -> Callable[[HttpRequest], HttpResponse]:
-        self.__controller.use_case = ListUserUseCase(self.__repository)
+    def __init__(self, a_gateway: AbsUsersGateway = None):
+        self.__repository = self.__create_repository(a_gateway or UsersRepository())
+        self.__handlers = MappingProxyType({
+            action: UserController(use_case(self.__repository)).handle(action)
+            for action, use_case in self.USE_CASES.items()
+        })
 
-        return self.__controller.handle('list')
+    @staticmethod
+    def __create_repository(a_gateway: AbsUsersGateway):
+        if not settings.USER_CACHE_ENABLED:
+            return a_gateway
 
-    def get(self) -> Callable[[HttpRequest], HttpResponse]:
-        self.__controller.use_case = FindUserByIdUseCase(self.__repository)
+        cache = LRUCache(
+            max_entries=settings.USER_CACHE_MAX_ENTRIES,
+            max_bytes=settings.USER_CACHE_MAX_BYTES,
+            ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+            sizeof=CachedUsersRepository.sizeof
+        )
+        CacheMetrics.register('users', cache)
+        return CachedUsersRepository(a_gateway, cache)
+
+    @property
+    def repository(self):
+        return self.__repository
 
-        return self.__controller.handle('get')
+    @property
+    def handlers(self) -> Mapping[str, Callable[[HttpRequest], HttpResponse]]:
+        return self.__handlers
+
+    def list(self) -> Callable[[HttpRequest], HttpResponse]:
+        return self.__handlers['list']
+
+    def get(self) -> Callable[[HttpRequest], HttpResponse]:
+        return self.__handlers['get']
 
     def create(self) -> Callable[[HttpRequest], HttpResponse]:
-        self.__controller.use_case = CreateUserUseCase(self.__repository)
-        return self.__controller.handle('create')
+        return self.__handlers['create']
 
-    def update(self) -> Callable[[HttpRequest], HttpResponse]:
-        self.__controller.use_case = UpdateUserUseCase(self.__repository)
-        return self.__controller.handle('update')
+    def batch_create(self) -> Callable[[HttpRequest], HttpResponse]:
+        return self.__handlers['batch_create']
 
+    def update(self) -> Callable[[HttpRequest], HttpResponse]:
+        return self.__handlers['update']
 
     def delete(self) -> Callable[[HttpRequest], HttpResponse]:
-        self.__controller.use_case = DeleteUserUseCase(self.__repository)
-        return self.__controller.handle('delete')
+        return self.__handlers['delete']
 
+    def export(self) -> Callable[[HttpRequest], HttpResponse]:
+        return self.__handlers['export']
@@ -1,50 +1,67 @@
+from types import MappingProxyType
 from typing import Any, Optional, Callable
-from src.domain.exceptions import NotFoundException
+from src.domain.exceptions import NotFoundException, BadRequestException
 
+from src.application.usecase.user.batch_create.batch_create_users_input import BatchCreateUsersInput
+from src.application.usecase.user.batch_create.batch_create_users_output import BatchCreateUsersOutput
 from src.application.usecase.user.create.create_user_input import CreateUserInput
+from src.application.usecase.user.delete.delete_user_input import DeleteUserInput
 from src.application.usecase.user.retrive.get.find_user_by_id_output import FindUserByIdOutput
 from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
 from src.application.usecase.user.update.update_user_input import UpdateUserInput
 from src.application.usecase.user.update.update_user_output import UpdateUserOutput
 from src.domain.pagination.pagination import Pagination
 from src.domain.pagination.search_query import SearchQuery
+from src.infra.api.presentation.export import NdjsonUserExportWriter, CsvUserExportWriter
+from src.infra.api.presentation.http_types.entity_tag import EntityTag
 from src.infra.api.presentation.http_types.http_request import HttpRequest
 from src.infra.api.presentation.http_types.http_response import HttpResponse
+from src.infra.config.settings import settings
 
 
 class UserController:
+    EXPORT_WRITERS = {
+        'ndjson': NdjsonUserExportWriter,
+        'csv': CsvUserExportWriter,
+    }
+
     def __init__(self, use_case: Optional[Any] = None):
         self.__use_case = use_case
+        self.__actions = MappingProxyType({
+            'list': self.__handle_list,
+            'create': self.__handle_create,
+            'batch_create': self.__handle_batch_create,
+            'update': self.__handle_update,
+            'delete': self.__handle_delete,
+            'get': self.__handle_get,
+            'export': self.__handle_export
+        })
 
     @property
     def use_case(self) -> Any:
         return self.__use_case
 
-    @use_case.setter
-    def use_case(self, value: Any) -> None:
-        self.__use_case = value
-
     def handle(self, action: str) -> Callable[[HttpRequest], HttpResponse]:
-        actions: dict[str, Callable[[HttpRequest], HttpResponse]] = {
-            'list': self.__handle_list,
-            'create': self.__handle_create,
-            'update': self.__handle_update,
-            'delete': self.__handle_delete,
-            'get': self.__handle_get
-        }
-
-        handler = actions.get(action)
+        handler = self.__actions.get(action)
         if not handler:
-            return lambda _: HttpResponse(a_status_code=400, a_body={"error": "Invalid action"})
+            return self.__handle_invalid_action
 
         return handler
 
+    @staticmethod
+    def __handle_invalid_action(_http_request: HttpRequest) -> HttpResponse:
+        return HttpResponse(a_status_code=400, a_body={"error": "Invalid action"})
+
     def __handle_list(self, http_request: HttpRequest) -> HttpResponse:
+        etag = EntityTag.for_collection('users', self.__use_case.revision())
+        if EntityTag.none_match(self.__header(http_request, 'If-None-Match'), etag):
+            return HttpResponse(a_status_code=304, a_headers={'ETag': etag})
+
         query = SearchQuery.create(http_request)
 
         output: Pagination[ListUserOutput] = self.__use_case.execute(query)
 
-        return HttpResponse(a_status_code=206, a_body=output)
+        return HttpResponse(a_status_code=206, a_body=output, a_headers={'ETag': etag})
 
     def __handle_create(self, http_request: HttpRequest) -> HttpResponse:
         a_name = http_request.body["name"]
@@ -56,11 +73,45 @@ class UserController:
 
         return HttpResponse(a_status_code=201, a_body=output)
 
+    def __handle_batch_create(self, http_request: HttpRequest) -> HttpResponse:
+        items = http_request.body
+        mode = (http_request.query_params or {}).get("mode", "atomic")
+
+        if isinstance(items, dict):
+            mode = items.get("mode", mode)
+            items = items.get("items")
+
+        if not isinstance(items, list) or not items:
+            raise BadRequestException("Batch body must be a non-empty array of users")
+        if len(items) > settings.BATCH_MAX_ITEMS:
+            raise BadRequestException(f"Batch cannot have more than {settings.BATCH_MAX_ITEMS} users")
+        if mode not in ("atomic", "partial"):
+            raise BadRequestException("Batch mode must be 'atomic' or 'partial'")
+
+        an_input_data = BatchCreateUsersInput(
+            items=[
+                CreateUserInput(item.get("name"), item.get("email")) if isinstance(item, dict)
+                else CreateUserInput(None, None)
+                for item in items
+            ],
+            all_or_nothing=mode == "atomic"
+        )
+
+        output: BatchCreateUsersOutput = self.__use_case.execute(an_input_data)
+
+        if not output.rejected:
+            return HttpResponse(a_status_code=201, a_body=output)
+        if output.all_or_nothing:
+            return HttpResponse(a_status_code=422, a_body=output)
+        return HttpResponse(a_status_code=207, a_body=output)
+
     def __handle_update(self, http_request: HttpRequest) -> HttpResponse:
+        an_id = http_request.path_params["id"]
         data = UpdateUserInput(
-            id=http_request.path_params["id"],
+            id=an_id,
             name=http_request.body["name"],
             email=http_request.body["email"],
+            version=EntityTag.match_user_version(self.__header(http_request, 'If-Match'), an_id),
         )
 
         output: UpdateUserOutput | None = self.__use_case.execute(data)
@@ -68,10 +119,18 @@ class UserController:
         if output is None:
             raise NotFoundException("User not found")
 
-        return HttpResponse(a_status_code=200, a_body=output)
+        return HttpResponse(
+            a_status_code=200,
+            a_body=output,
+            a_headers={'ETag': EntityTag.for_user(output.id, output.version)}
+        )
 
     def __handle_delete(self, http_request: HttpRequest) -> HttpResponse:
-        output = self.__use_case.execute(int(http_request.path_params["id"]))
+        an_id = int(http_request.path_params["id"])
+        output = self.__use_case.execute(DeleteUserInput(
+            id=an_id,
+            version=EntityTag.match_user_version(self.__header(http_request, 'If-Match'), an_id)
+        ))
 
         if not output:
             return HttpResponse(a_status_code=404, a_body="User not found")
@@ -86,4 +145,30 @@ class UserController:
         if output is None:
             return HttpResponse(a_status_code=404, a_body="User not found")
 
-        return HttpResponse(a_status_code=200, a_body=output)
+        etag = EntityTag.for_user(output.id, output.version)
+        if EntityTag.none_match(self.__header(http_request, 'If-None-Match'), etag):
+            return HttpResponse(a_status_code=304, a_headers={'ETag': etag})
+
+        return HttpResponse(a_status_code=200, a_body=output, a_headers={'ETag': etag})
+
+    def __handle_export(self, http_request: HttpRequest) -> HttpResponse:
+        export_format = (http_request.query_params or {}).get("format", "ndjson")
+        writer_class = self.EXPORT_WRITERS.get(export_format)
+        if writer_class is None:
+            raise BadRequestException("Export format must be 'ndjson' or 'csv'")
+
+        writer = writer_class(settings.EXPORT_CHUNK_BYTES)
+        users = self.__use_case.execute()
+
+        return HttpResponse(
+            a_status_code=200,
+            a_body=writer.write(users),
+            a_headers={
+                'Content-Type': writer.content_type,
+                'Content-Disposition': f'attachment; filename=users.{writer.extension}',
+            }
+        )
+
+    @staticmethod
+    def __header(http_request: HttpRequest, a_name: str) -> Optional[str]:
+        return (http_request.headers or {}).get(a_name)
\ No newline at end of file
@@ -0,0 +1 @@
+from src.infra.api.presentation.compression.response_compressor import ResponseCompressor
@@ -0,0 +1,91 @@
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class ResponseCompressor:
+    DEFAULT_LEVELS = {'gzip': 6, 'br': 4, 'zstd': 3}
+
+    def __init__(self, encodings: Iterable[str], min_bytes: int = 1024, levels: Optional[Dict[str, int]] = None) -> None:
+        available = self.available_encodings()
+        self.__encodings = [encoding for encoding in encodings if encoding in available]
+        self.__min_bytes = min_bytes
+        self.__levels = {**self.DEFAULT_LEVELS, **(levels or {})}
+
+    @property
+    def encodings(self) -> List[str]:
+        return list(self.__encodings)
+
+    @staticmethod
+    def available_encodings() -> List[str]:
+        encodings = ['gzip']
+        if brotli is not None:
+            encodings.append('br')
+        if zstandard is not None:
+            encodings.append('zstd')
+        return encodings
+
+    def negotiate(self, an_accept_encoding: Optional[str]) -> Optional[str]:
+        accepted = self.__parse_accept_encoding(an_accept_encoding)
+        selected, selected_quality = None, 0.0
+        for encoding in self.__encodings:
+            quality = accepted.get(encoding, accepted.get('*', 0.0))
+            if quality > selected_quality:
+                selected, selected_quality = encoding, quality
+        return selected
+
+    def should_compress(self, a_size: int) -> bool:
+        return a_size >= self.__min_bytes
+
+    def compress(self, data: bytes, an_encoding: str) -> bytes:
+        compress, finish = self.__compressor(an_encoding)
+        return compress(data) + finish()
+
+    def compress_stream(self, chunks: Iterable[bytes], an_encoding: str) -> Iterator[bytes]:
+        compress, finish = self.__compressor(an_encoding)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            compressed = compress(chunk)
+            if compressed:
+                yield compressed
+        yield finish()
+
+    def __compressor(self, an_encoding: str) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        level = self.__levels[an_encoding]
+        if an_encoding == 'gzip':
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            return compressor.compress, compressor.flush
+        if an_encoding == 'br':
+            compressor = brotli.Compressor(quality=level)
+            return compressor.process, compressor.finish
+        if an_encoding == 'zstd':
+            compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            return compressor.compress, compressor.flush
+        raise ValueError(f"Unsupported content encoding: {an_encoding}")
+
+    @staticmethod
+    def __parse_accept_encoding(an_accept_encoding: Optional[str]) -> Dict[str, float]:
+        accepted = {}
+        for part in (an_accept_encoding or '').split(','):
+            coding, _, params = part.strip().partition(';')
+            if not coding:
+                continue
+            quality = 1.0
+            name, _, value = params.strip().partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+            accepted[coding.strip().lower()] = quality
+        return accepted
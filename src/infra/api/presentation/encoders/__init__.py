@@ -0,0 +1,4 @@
+from src.infra.api.presentation.encoders.response_encoder import ResponseEncoder
+from src.infra.api.presentation.encoders.jsonify_response_encoder import JsonifyResponseEncoder
+from src.infra.api.presentation.encoders.orjson_response_encoder import OrjsonResponseEncoder
+from src.infra.api.presentation.encoders.response_encoders import ResponseEncoders
@@ -0,0 +1,12 @@
+from typing import Any
+
+from flask import json
+
+from src.infra.api.presentation.encoders.response_encoder import ResponseEncoder
+
+
+class JsonifyResponseEncoder(ResponseEncoder):
+    name = 'jsonify'
+
+    def encode(self, a_body: Any) -> bytes:
+        return f"{json.dumps(a_body)}\n".encode('utf-8')
@@ -0,0 +1,31 @@
+from decimal import Decimal
+from typing import Any
+
+from src.infra.api.presentation.encoders.response_encoder import ResponseEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonResponseEncoder(ResponseEncoder):
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ValueError("The orjson response encoder requires the orjson package")
+        self.__options = orjson.OPT_NON_STR_KEYS
+
+    def encode(self, a_body: Any) -> bytes:
+        return orjson.dumps(a_body, default=self.__default, option=self.__options)
+
+    @staticmethod
+    def __default(a_value: Any) -> Any:
+        if hasattr(a_value, '_mapping'):
+            return dict(a_value._mapping)
+        if isinstance(a_value, (set, frozenset)):
+            return list(a_value)
+        if isinstance(a_value, Decimal):
+            return str(a_value)
+        raise TypeError(f"Object of type {type(a_value).__name__} is not JSON serializable")
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ResponseEncoder(ABC):
+    name: str
+    mimetype = 'application/json'
+
+    @abstractmethod
+    def encode(self, a_body: Any) -> bytes: pass
@@ -0,0 +1,21 @@
+from src.infra.api.presentation.encoders import orjson_response_encoder
+from src.infra.api.presentation.encoders.jsonify_response_encoder import JsonifyResponseEncoder
+from src.infra.api.presentation.encoders.orjson_response_encoder import OrjsonResponseEncoder
+from src.infra.api.presentation.encoders.response_encoder import ResponseEncoder
+
+
+class ResponseEncoders:
+    ENCODERS = {
+        JsonifyResponseEncoder.name: JsonifyResponseEncoder,
+        OrjsonResponseEncoder.name: OrjsonResponseEncoder,
+    }
+
+    @classmethod
+    def create(cls, a_name: str = 'auto') -> ResponseEncoder:
+        if a_name == 'auto':
+            a_name = OrjsonResponseEncoder.name if orjson_response_encoder.orjson else JsonifyResponseEncoder.name
+
+        encoder_class = cls.ENCODERS.get(a_name)
+        if encoder_class is None:
+            raise ValueError(f"Unknown response encoder '{a_name}', expected one of {sorted(cls.ENCODERS)} or 'auto'")
+        return encoder_class()
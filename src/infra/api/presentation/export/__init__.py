@@ -0,0 +1,5 @@
+from src.infra.api.presentation.export.user_export_writer import (
+    UserExportWriter,
+    NdjsonUserExportWriter,
+    CsvUserExportWriter,
+)
@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+from src.domain.user.user import User
+
+
+class UserExportWriter(ABC):
+    content_type: str
+    extension: str
+
+    def __init__(self, a_chunk_bytes: int) -> None:
+        self._chunk_bytes = a_chunk_bytes
+
+    def write(self, users: Iterable[User]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        self._begin(buffer)
+        for user in users:
+            self._write_user(buffer, user)
+            if buffer.tell() >= self._chunk_bytes:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    def _begin(self, buffer: io.StringIO) -> None:
+        pass
+
+    @abstractmethod
+    def _write_user(self, buffer: io.StringIO, an_user: User) -> None: pass
+
+
+class NdjsonUserExportWriter(UserExportWriter):
+    content_type = 'application/x-ndjson'
+    extension = 'ndjson'
+
+    def _write_user(self, buffer: io.StringIO, an_user: User) -> None:
+        buffer.write(json.dumps({'id': an_user.id, 'name': an_user.name, 'email': an_user.email}, ensure_ascii=False))
+        buffer.write('\n')
+
+
+class CsvUserExportWriter(UserExportWriter):
+    content_type = 'text/csv; charset=utf-8'
+    extension = 'csv'
+
+    def _begin(self, buffer: io.StringIO) -> None:
+        self.__writer = csv.writer(buffer, lineterminator='\n')
+        self.__writer.writerow(('id', 'name', 'email'))
+
+    def _write_user(self, buffer: io.StringIO, an_user: User) -> None:
+        self.__writer.writerow((an_user.id, an_user.name, an_user.email))
@@ -0,0 +1,60 @@
+import re
+from typing import List, Optional
+
+from src.domain.exceptions import PreconditionFailedException
+
+
+class EntityTag:
+    USER_TAG_PATTERN = re.compile(r'^"u(\d+)-v(\d+)(?:-(?:gzip|br|zstd))?"$')
+    ENCODING_SUFFIX_PATTERN = re.compile(r'-(?:gzip|br|zstd)"$')
+
+    @staticmethod
+    def for_user(an_id: int, a_version: int) -> str:
+        return f'"u{an_id}-v{a_version}"'
+
+    @staticmethod
+    def for_collection(a_name: str, a_revision: int) -> str:
+        return f'W/"{a_name}-r{a_revision}"'
+
+    @staticmethod
+    def with_encoding(an_etag: str, an_encoding: str) -> str:
+        if an_etag.startswith('W/'):
+            return an_etag
+        return f'{an_etag[:-1]}-{an_encoding}"'
+
+    @staticmethod
+    def for_not_modified(an_etag: str, an_if_none_match: Optional[str], an_encoding: Optional[str]) -> str:
+        if an_encoding is None:
+            return an_etag
+        encoded = EntityTag.with_encoding(an_etag, an_encoding)
+        held = [tag[2:] if tag.startswith('W/') else tag for tag in EntityTag.parse(an_if_none_match)]
+        return encoded if encoded in held else an_etag
+
+    @staticmethod
+    def parse(a_header: Optional[str]) -> List[str]:
+        if not a_header:
+            return []
+        return [tag.strip() for tag in a_header.split(',') if tag.strip()]
+
+    @staticmethod
+    def none_match(a_header: Optional[str], an_etag: str) -> bool:
+        opaque_tag = EntityTag.__opaque(an_etag)
+        return any(tag == '*' or EntityTag.__opaque(tag) == opaque_tag for tag in EntityTag.parse(a_header))
+
+    @staticmethod
+    def match_user_version(a_header: Optional[str], an_id: int) -> Optional[int]:
+        tags = EntityTag.parse(a_header)
+        if not tags or '*' in tags:
+            return None
+
+        for tag in tags:
+            match = EntityTag.USER_TAG_PATTERN.match(tag)
+            if match and int(match.group(1)) == int(an_id):
+                return int(match.group(2))
+
+        raise PreconditionFailedException("If-Match does not reference this user")
+
+    @staticmethod
+    def __opaque(a_tag: str) -> str:
+        a_tag = a_tag[2:] if a_tag.startswith('W/') else a_tag
+        return EntityTag.ENCODING_SUFFIX_PATTERN.sub('"', a_tag)
@@ -1,4 +1,13 @@
+from typing import Any, Mapping, Optional
+
+from src.infra.api.presentation.http_types.http_request_source import HttpRequestSource
+
+_PENDING = object()
+
+
 class HttpRequest:
+    __slots__ = ('_headers', '_body', '_query_params', '_url', 'path_params', 'ipv4', '_source')
+
     def __init__(self,
                  a_headers=None,
                  a_body=None,
@@ -6,10 +15,56 @@ class HttpRequest:
                  a_path_params=None,
                  an_url=None,
                  an_ipv4=None):
-      self.headers = a_headers
-      self.body = a_body
-      self.query_params = a_query_params
-      self.path_params = a_path_params
-      self.url = an_url
-      self.ipv4 = an_ipv4
+        self._headers = a_headers
+        self._body = a_body
+        self._query_params = a_query_params
+        self._url = an_url
+        self.path_params = a_path_params
+        self.ipv4 = an_ipv4
+        self._source: Optional[HttpRequestSource] = None
+
+    @classmethod
+    def from_source(cls, a_source: HttpRequestSource, a_path_params=None, an_ipv4=None) -> 'HttpRequest':
+        http_request = cls(_PENDING, _PENDING, _PENDING, a_path_params, _PENDING, an_ipv4)
+        http_request._source = a_source
+        return http_request
+
+    @property
+    def headers(self) -> Optional[Mapping[str, str]]:
+        if self._headers is _PENDING:
+            self._headers = self._source.headers()
+        return self._headers
+
+    @headers.setter
+    def headers(self, value) -> None:
+        self._headers = value
+
+    @property
+    def body(self) -> Any:
+        if self._body is _PENDING:
+            self._body = self._source.body()
+        return self._body
+
+    @body.setter
+    def body(self, value) -> None:
+        self._body = value
+
+    @property
+    def query_params(self) -> Optional[Mapping[str, str]]:
+        if self._query_params is _PENDING:
+            self._query_params = self._source.query_params()
+        return self._query_params
+
+    @query_params.setter
+    def query_params(self, value) -> None:
+        self._query_params = value
+
+    @property
+    def url(self) -> Optional[str]:
+        if self._url is _PENDING:
+            self._url = self._source.url()
+        return self._url
 
+    @url.setter
+    def url(self, value) -> None:
+        self._url = value
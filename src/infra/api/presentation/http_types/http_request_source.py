@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Any, Mapping
+
+
+class HttpRequestSource(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def body(self) -> Any: pass
+
+    @abstractmethod
+    def headers(self) -> Mapping[str, str]: pass
+
+    @abstractmethod
+    def query_params(self) -> Mapping[str, str]: pass
+
+    @abstractmethod
+    def url(self) -> str: pass
@@ -1,7 +1,11 @@
 class HttpResponse:
+    __slots__ = ('status_code', 'body', 'headers')
+
     def __init__(self,
                  a_status_code=None,
                  a_body=None,
+                 a_headers=None,
               ):
       self.status_code = a_status_code
       self.body = a_body
+      self.headers = a_headers or {}
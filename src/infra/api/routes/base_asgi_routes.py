@@ -0,0 +1,135 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from functools import partial
+from typing import Callable
+
+import anyio
+from fastapi import APIRouter
+from starlette.requests import Request
+from starlette.background import BackgroundTask
+from sqlalchemy.util.concurrency import greenlet_spawn
+from starlette.responses import Response, StreamingResponse
+
+from src.domain.exceptions.handle_exceptions import HandleException
+from src.infra.adapters.api.asgi_request_adapter import asgi_request_adapter
+from src.infra.api.presentation.http_types.entity_tag import EntityTag
+from src.infra.api.presentation.http_types.http_request import HttpRequest
+from src.infra.api.presentation.http_types.http_response import HttpResponse
+from src.infra.api.routes.base_routes import BaseRoutes
+from src.infra.config.settings import settings
+from src.infra.metrics import TrackedStream
+
+
+class BaseAsgiRoutes(ABC):
+    compressor = BaseRoutes.compressor
+    encoder = BaseRoutes.encoder
+    metrics = BaseRoutes.metrics
+    queries = BaseRoutes.queries
+
+    def __new__(cls, *args, **kwargs):
+        instance = super().__new__(cls)
+        instance.router = APIRouter()
+        instance._limiter = None
+        return instance
+
+    @abstractmethod
+    def _register_routes(self):
+        pass
+
+    @abstractmethod
+    def get_base_path(cls) -> str:
+        pass
+
+    async def _handle_request(self, request: Request, handler: Callable, resource_id=None, on_loop=False) -> Response:
+        route = request.scope['route'].path if 'route' in request.scope else request.url.path
+        method = request.method
+        tracked = self.metrics.begin(route, method) if settings.METRICS_ENABLED else None
+        queries = self.queries.begin()
+        try:
+            response = await self._respond(request, handler, resource_id, on_loop)
+        except Exception:
+            self.__finish(tracked, 500, route, method, self.queries.detach(queries))
+            raise
+
+        stats = self.queries.detach(queries)
+        finish = partial(self.__finish, tracked, response.status_code, route, method, stats)
+        if isinstance(response, StreamingResponse):
+            response.body_iterator = TrackedStream(response.body_iterator, stats, finish)
+            response.background = BackgroundTask(response.body_iterator.close)
+            return response
+
+        if settings.DB_QUERY_HEADER_ENABLED:
+            response.headers['Server-Timing'] = self.queries.server_timing(stats)
+        finish()
+        return response
+
+    def __finish(self, tracked, status, route, method, stats):
+        self.queries.end(stats, route, method)
+        if tracked is not None:
+            self.metrics.end(tracked, status, stats.seconds)
+
+    async def _respond(self, request: Request, handler: Callable, resource_id=None, on_loop=False) -> Response:
+        try:
+            http_request = await asgi_request_adapter(request, {'id': resource_id} if resource_id else None)
+            if on_loop:
+                http_response = await greenlet_spawn(self.__dispatch, handler, http_request)
+            else:
+                http_response = await anyio.to_thread.run_sync(
+                    self.__dispatch, handler, http_request, limiter=self.__get_limiter()
+                )
+        except Exception as exception:
+            http_response = HandleException.handle(exception)
+
+        return self._to_response(request, http_response)
+
+    def _to_response(self, request: Request, http_response: HttpResponse) -> Response:
+        headers = dict(http_response.headers)
+        status_code = http_response.status_code
+        if status_code == 204:
+            return Response(status_code=status_code, headers=headers)
+
+        encoding = None
+        if settings.COMPRESSION_ENABLED:
+            headers['Vary'] = 'Accept-Encoding'
+            encoding = self.compressor.negotiate(request.headers.get('accept-encoding'))
+
+        if status_code == 304:
+            if 'ETag' in headers:
+                headers['ETag'] = EntityTag.for_not_modified(
+                    headers['ETag'], request.headers.get('if-none-match'), encoding
+                )
+            return Response(status_code=status_code, headers=headers)
+
+        if isinstance(http_response.body, Iterator):
+            body = http_response.body
+            if encoding:
+                body = self.compressor.compress_stream(body, encoding)
+                self.__mark_encoded(headers, encoding)
+            return StreamingResponse(body, status_code=status_code, headers=headers)
+
+        content = self.encoder.encode(http_response.body)
+        if encoding and self.compressor.should_compress(len(content)):
+            content = self.compressor.compress(content, encoding)
+            self.__mark_encoded(headers, encoding)
+        return Response(content, status_code=status_code, headers=headers, media_type=self.encoder.mimetype)
+
+    def get_router(self) -> APIRouter:
+        return self.router
+
+    def __get_limiter(self) -> anyio.CapacityLimiter:
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(settings.ASGI_THREAD_LIMIT)
+        return self._limiter
+
+    @staticmethod
+    def __dispatch(handler: Callable, http_request: HttpRequest) -> HttpResponse:
+        try:
+            return handler(http_request)
+        except Exception as exception:
+            return HandleException.handle(exception)
+
+    @staticmethod
+    def __mark_encoded(headers: dict, an_encoding: str) -> None:
+        headers['Content-Encoding'] = an_encoding
+        if 'ETag' in headers:
+            headers['ETag'] = EntityTag.with_encoding(headers['ETag'], an_encoding)
@@ -1,11 +1,38 @@
 from abc import ABC, abstractmethod
-from flask import Blueprint, request, jsonify
+from collections.abc import Iterator
+from functools import partial
+from flask import Blueprint, Response, request, stream_with_context
 
 from src.domain.exceptions.handle_exceptions import HandleException
 from src.infra.adapters.api.request_adapter import request_adapter
+from src.infra.api.presentation.compression import ResponseCompressor
+from src.infra.api.presentation.encoders import ResponseEncoders
+from src.infra.api.presentation.http_types.entity_tag import EntityTag
+from src.infra.config.settings import settings
+from src.infra.metrics import QueryInstrumentation, QueryPatternDetector, RequestMetrics, SlowQueryLog, TrackedStream
 
 
 class BaseRoutes(ABC):
+    encoder = ResponseEncoders.create(settings.RESPONSE_ENCODER)
+    compressor = ResponseCompressor(
+        settings.COMPRESSION_ENCODINGS,
+        min_bytes=settings.COMPRESSION_MIN_BYTES,
+        levels={
+            'gzip': settings.COMPRESSION_GZIP_LEVEL,
+            'br': settings.COMPRESSION_BROTLI_QUALITY,
+            'zstd': settings.COMPRESSION_ZSTD_LEVEL,
+        }
+    )
+    metrics = RequestMetrics(settings.METRICS_LATENCY_BUCKETS)
+    queries = QueryInstrumentation(
+        QueryPatternDetector(settings.DB_REPEATED_QUERY_THRESHOLD),
+        SlowQueryLog(
+            settings.DB_SLOW_QUERY_MS / 1000,
+            explain=settings.DB_SLOW_QUERY_EXPLAIN,
+            a_path=settings.DB_SLOW_QUERY_LOG_PATH
+        ) if settings.DB_SLOW_QUERY_MS > 0 else None
+    )
+
     def __new__(cls):
         instance = super().__new__(cls)
         instance.blueprint = Blueprint(cls.get_blueprint_name(), __name__)
@@ -24,15 +51,86 @@ class BaseRoutes(ABC):
     def get_base_path(cls) -> str:
         pass
 
-    def _handle_request(self, composer_method, resource_id=None):
+    def _handle_request(self, handler, resource_id=None):
+        route = request.url_rule.rule if request.url_rule else request.path
+        method = request.method
+        tracked = self.metrics.begin(route, method) if settings.METRICS_ENABLED else None
+        queries = self.queries.begin()
+        try:
+            response = self._respond(handler, resource_id)
+        except Exception:
+            self.__finish(tracked, 500, route, method, self.queries.detach(queries))
+            raise
+
+        stats = self.queries.detach(queries)
+        finish = partial(self.__finish, tracked, response.status_code, route, method, stats)
+        if response.is_streamed:
+            response.response = TrackedStream(iter(response.response), stats, finish)
+            response.call_on_close(response.response.close)
+            return response
+
+        if settings.DB_QUERY_HEADER_ENABLED:
+            response.headers['Server-Timing'] = self.queries.server_timing(stats)
+        finish()
+        return response
+
+    def __finish(self, tracked, status, route, method, stats):
+        self.queries.end(stats, route, method)
+        if tracked is not None:
+            self.metrics.end(tracked, status, stats.seconds)
+
+    def _respond(self, handler, resource_id=None):
         try:
             if resource_id:
                 request.view_args = {'id': resource_id}
-            http_response = request_adapter(request, composer_method)
+            http_response = request_adapter(request, handler)
         except Exception as exception:
             http_response = HandleException.handle(exception)
 
-        return jsonify(http_response.body), http_response.status_code
+        if isinstance(http_response.body, Iterator):
+            response = Response(
+                stream_with_context(http_response.body),
+                status=http_response.status_code,
+                headers=http_response.headers
+            )
+        else:
+            response = Response(
+                self.encoder.encode(http_response.body),
+                status=http_response.status_code,
+                headers=http_response.headers,
+                mimetype=self.encoder.mimetype
+            )
+
+        return self._compress(response)
+
+    def _compress(self, response: Response) -> Response:
+        if not settings.COMPRESSION_ENABLED or response.status_code == 204 \
+                or 'Content-Encoding' in response.headers:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = self.compressor.negotiate(request.headers.get('Accept-Encoding'))
+        if response.status_code == 304:
+            if 'ETag' in response.headers:
+                response.headers['ETag'] = EntityTag.for_not_modified(
+                    response.headers['ETag'], request.headers.get('If-None-Match'), encoding
+                )
+            return response
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = self.compressor.compress_stream(response.response, encoding)
+        else:
+            data = response.get_data()
+            if not self.compressor.should_compress(len(data)):
+                return response
+            response.set_data(self.compressor.compress(data, encoding))
+
+        response.headers['Content-Encoding'] = encoding
+        if 'ETag' in response.headers:
+            response.headers['ETag'] = EntityTag.with_encoding(response.headers['ETag'], encoding)
+        return response
 
     def get_blueprint(self):
         return self.blueprint
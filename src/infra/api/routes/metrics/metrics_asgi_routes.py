@@ -0,0 +1,22 @@
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.infra.api.routes.base_asgi_routes import BaseAsgiRoutes
+from src.infra.config.settings import settings
+from src.infra.metrics import CacheMetrics, RequestMetrics
+
+
+class MetricsAsgiRoutes(BaseAsgiRoutes):
+    def __init__(self):
+        self._register_routes()
+
+    @classmethod
+    def get_base_path(cls) -> str:
+        return settings.METRICS_PATH
+
+    def _register_routes(self):
+        self.router.add_api_route(self.get_base_path(), self.scrape, methods=['GET'])
+        return self
+
+    async def scrape(self, request: Request) -> Response:
+        return Response(self.metrics.render() + CacheMetrics.render(), headers={'Content-Type': RequestMetrics.CONTENT_TYPE})
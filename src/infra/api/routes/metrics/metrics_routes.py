@@ -0,0 +1,22 @@
+from flask import Response
+
+from src.infra.api.routes.base_routes import BaseRoutes
+from src.infra.config.settings import settings
+from src.infra.metrics import CacheMetrics, RequestMetrics
+
+
+class MetricsRoutes(BaseRoutes):
+    @classmethod
+    def get_blueprint_name(cls) -> str:
+        return 'metrics_routes'
+
+    @classmethod
+    def get_base_path(cls) -> str:
+        return settings.METRICS_PATH
+
+    def _register_routes(self):
+        self.blueprint.route(self.get_base_path(), methods=['GET'])(self.scrape)
+        return self
+
+    def scrape(self):
+        return self._compress(Response(self.metrics.render() + CacheMetrics.render(), content_type=RequestMetrics.CONTENT_TYPE))
@@ -0,0 +1,51 @@
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.infra.api.composers.user.user_composer import UserComposer
+from src.infra.api.routes.base_asgi_routes import BaseAsgiRoutes
+from src.infra.persistence.repositories import AsyncBridgeUsersRepository, AsyncUsersRepository, UsersRepository
+
+
+class UserAsgiRoutes(BaseAsgiRoutes):
+    def __init__(self, a_composer: UserComposer = None):
+        self.user_composer = a_composer or UserComposer(
+            AsyncBridgeUsersRepository(AsyncUsersRepository(), UsersRepository())
+        )
+        self.handlers = self.user_composer.handlers
+        self._register_routes()
+
+    @classmethod
+    def get_base_path(cls) -> str:
+        return '/api/v1/users'
+
+    def _register_routes(self):
+        base_path = self.get_base_path()
+        self.router.add_api_route(f'{base_path}', self.list, methods=['GET'])
+        self.router.add_api_route(f'{base_path}/export', self.export, methods=['GET'])
+        self.router.add_api_route(f'{base_path}/{{id}}', self.get_by_id, methods=['GET'])
+        self.router.add_api_route(f'{base_path}', self.create, methods=['POST'])
+        self.router.add_api_route(f'{base_path}:batch', self.batch_create, methods=['POST'])
+        self.router.add_api_route(f'{base_path}/{{id}}', self.update, methods=['PUT'])
+        self.router.add_api_route(f'{base_path}/{{id}}', self.delete, methods=['DELETE'])
+        return self
+
+    async def list(self, request: Request) -> Response:
+        return await self._handle_request(request, self.handlers['list'])
+
+    async def export(self, request: Request) -> Response:
+        return await self._handle_request(request, self.handlers['export'])
+
+    async def get_by_id(self, request: Request, id: str) -> Response:
+        return await self._handle_request(request, self.handlers['get'], id, on_loop=True)
+
+    async def create(self, request: Request) -> Response:
+        return await self._handle_request(request, self.handlers['create'], on_loop=True)
+
+    async def batch_create(self, request: Request) -> Response:
+        return await self._handle_request(request, self.handlers['batch_create'])
+
+    async def update(self, request: Request, id: str) -> Response:
+        return await self._handle_request(request, self.handlers['update'], id, on_loop=True)
+
+    async def delete(self, request: Request, id: str) -> Response:
+        return await self._handle_request(request, self.handlers['delete'], id, on_loop=True)
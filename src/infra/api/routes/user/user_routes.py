@@ -5,6 +5,7 @@ from src.infra.api.routes.base_routes import BaseRoutes
 class UserRoutes(BaseRoutes):
     def __init__(self):
         self.user_composer = UserComposer()
+        self.handlers = self.user_composer.handlers
 
     @classmethod
     def get_blueprint_name(cls) -> str:
@@ -17,23 +18,31 @@ class UserRoutes(BaseRoutes):
     def _register_routes(self):
         base_path = self.get_base_path()
         self.blueprint.route(f'{base_path}', methods=['GET'])(self.list)
+        self.blueprint.route(f'{base_path}/export', methods=['GET'])(self.export)
         self.blueprint.route(f'{base_path}/<id>', methods=['GET'])(self.get_by_id)
         self.blueprint.route(f'{base_path}', methods=['POST'])(self.create)
+        self.blueprint.route(f'{base_path}:batch', methods=['POST'])(self.batch_create)
         self.blueprint.route(f'{base_path}/<id>', methods=['PUT'])(self.update)
         self.blueprint.route(f'{base_path}/<id>', methods=['DELETE'])(self.delete)
         return self
 
     def list(self):
-        return self._handle_request(self.user_composer.list())
+        return self._handle_request(self.handlers['list'])
+
+    def export(self):
+        return self._handle_request(self.handlers['export'])
 
     def get_by_id(self, id: int):
-        return self._handle_request(self.user_composer.get(), id)
+        return self._handle_request(self.handlers['get'], id)
 
     def create(self):
-        return self._handle_request(self.user_composer.create())
+        return self._handle_request(self.handlers['create'])
+
+    def batch_create(self):
+        return self._handle_request(self.handlers['batch_create'])
 
     def update(self, id: int):
-        return self._handle_request(self.user_composer.update(), id)
+        return self._handle_request(self.handlers['update'], id)
 
     def delete(self, id: int):
-        return self._handle_request(self.user_composer.delete(), id)
+        return self._handle_request(self.handlers['delete'], id)
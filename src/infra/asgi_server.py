@@ -0,0 +1,21 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from src.infra.api.routes.metrics.metrics_asgi_routes import MetricsAsgiRoutes
+from src.infra.api.routes.user.user_asgi_routes import UserAsgiRoutes
+from src.infra.config.settings import settings
+from src.infra.db.settings.async_engine_registry import AsyncEngineRegistry
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    await AsyncEngineRegistry.dispose_all()
+
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
+
+app.include_router(UserAsgiRoutes().get_router())
+
+if settings.METRICS_ENABLED:
+    app.include_router(MetricsAsgiRoutes().get_router())
@@ -0,0 +1,3 @@
+from src.infra.cache.cache_statistics import CacheStatistics
+from src.infra.cache.lru_cache import LRUCache
+from src.infra.cache.ttl_cache import TTLCache
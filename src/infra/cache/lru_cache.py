@@ -0,0 +1,99 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from src.infra.cache.cache_statistics import CacheStatistics
+
+
+class LRUCache:
+    INVALIDATION_STRIPES = 1024
+
+    def __init__(self,
+                 max_entries: int,
+                 max_bytes: int = 0,
+                 ttl_seconds: float = 0,
+                 sizeof: Callable[[Any], int] = sys.getsizeof) -> None:
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__ttl_seconds = ttl_seconds
+        self.__sizeof = sizeof
+        self.__entries: OrderedDict = OrderedDict()
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__generations = [0] * self.INVALIDATION_STRIPES
+        self.__lock = threading.Lock()
+
+    def get(self, a_key: Hashable) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(a_key)
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            expires_at, size, value = entry
+            if expires_at and expires_at <= time.monotonic():
+                self.__remove(a_key)
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(a_key)
+            self.__hits += 1
+            return value
+
+    def generation(self, a_key: Hashable) -> int:
+        with self.__lock:
+            return self.__generations[self.__stripe(a_key)]
+
+    def set(self, a_key: Hashable, a_value: Any, a_generation: int = None) -> None:
+        size = self.__sizeof(a_value)
+        if self.__max_entries <= 0 or (self.__max_bytes and size > self.__max_bytes):
+            return
+
+        expires_at = time.monotonic() + self.__ttl_seconds if self.__ttl_seconds else 0
+        with self.__lock:
+            if a_generation is not None and self.__generations[self.__stripe(a_key)] != a_generation:
+                return
+
+            if a_key in self.__entries:
+                self.__remove(a_key)
+
+            self.__entries[a_key] = (expires_at, size, a_value)
+            self.__bytes += size
+
+            while len(self.__entries) > self.__max_entries or (self.__max_bytes and self.__bytes > self.__max_bytes):
+                oldest_key = next(iter(self.__entries))
+                self.__remove(oldest_key)
+                self.__evictions += 1
+
+    def delete(self, a_key: Hashable) -> None:
+        with self.__lock:
+            self.__generations[self.__stripe(a_key)] += 1
+            if a_key in self.__entries:
+                self.__remove(a_key)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__generations = [generation + 1 for generation in self.__generations]
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def stats(self) -> CacheStatistics:
+        with self.__lock:
+            return CacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                entries=len(self.__entries),
+                bytes=self.__bytes
+            )
+
+    def __stripe(self, a_key: Hashable) -> int:
+        return hash(a_key) % self.INVALIDATION_STRIPES
+
+    def __remove(self, a_key: Hashable) -> None:
+        _, size, _ = self.__entries.pop(a_key)
+        self.__bytes -= size
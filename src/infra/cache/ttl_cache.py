@@ -0,0 +1,41 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.__max_entries = max_entries
+        self.__ttl_seconds = ttl_seconds
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, a_key: Hashable) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(a_key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[a_key]
+                return None
+            return value
+
+    def set(self, a_key: Hashable, a_value: Any) -> None:
+        if self.__max_entries <= 0 or self.__ttl_seconds <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[a_key] = (time.monotonic() + self.__ttl_seconds, a_value)
+            self.__entries.move_to_end(a_key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
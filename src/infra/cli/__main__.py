@@ -0,0 +1,23 @@
+import argparse
+import logging
+import sys
+
+from src.infra.cli.commands import COMMANDS
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.infra.cli')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    handlers = {}
+    for command in COMMANDS:
+        command.register(subparsers.add_parser(command.name))
+        handlers[command.name] = command.handle
+
+    args = parser.parse_args(argv)
+    return handlers[args.command](args)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,9 @@
+from src.infra.cli.commands.import_command import ImportCommand
+from src.infra.cli.commands.migrate_command import MigrateCommand
+from src.infra.cli.commands.replay_command import ReplayCommand
+
+COMMANDS = [
+    MigrateCommand,
+    ImportCommand,
+    ReplayCommand,
+]
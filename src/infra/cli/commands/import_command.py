@@ -0,0 +1,42 @@
+import os
+from argparse import ArgumentParser, Namespace
+
+from src.infra.db.settings.engine_registry import EngineRegistry
+from src.infra.persistence.importers import UserBulkImporter, UserRecordReader
+
+
+class ImportCommand:
+    name = 'import'
+
+    @staticmethod
+    def register(parser: ArgumentParser) -> None:
+        parser.add_argument('path', help='NDJSON or CSV file with name and email fields')
+        parser.add_argument('--format', choices=UserRecordReader.FORMATS, default=None,
+                            help='Input format, detected from the file extension by default')
+        parser.add_argument('--chunk-size', type=int, default=50000, help='Rows per insert transaction')
+        parser.add_argument('--drop-indexes', action='store_true',
+                            help='Drop secondary indexes and search triggers during the load and rebuild them after '
+                                 '(SQLite only, ignored on other databases)')
+        parser.add_argument('--rejects', default=None,
+                            help='Where to write rejected rows (default: <path>.rejects.ndjson)')
+
+    @staticmethod
+    def handle(args: Namespace) -> int:
+        import_format = args.format or UserRecordReader.detect_format(args.path)
+        rejects_path = args.rejects or f"{os.path.splitext(args.path)[0]}.rejects.ndjson"
+
+        with open(args.path, encoding='utf-8', newline='') as source, \
+                open(rejects_path, 'w', encoding='utf-8') as rejects:
+            importer = UserBulkImporter(
+                EngineRegistry.get_engine(),
+                chunk_size=args.chunk_size,
+                drop_indexes=args.drop_indexes,
+                rejects=rejects
+            )
+            report = importer.run(UserRecordReader.read(source, import_format))
+
+        print(f"Read: {report.read}")
+        print(f"Inserted: {report.inserted}")
+        print(f"Rejected: {report.rejected} (written to {rejects_path})")
+        print(f"Elapsed: {report.elapsed_seconds:.2f}s ({report.rows_per_second:.0f} rows/s)")
+        return 0
@@ -0,0 +1,29 @@
+from argparse import ArgumentParser, Namespace
+
+from src.infra.db.migrations import MigrationRunner
+from src.infra.db.settings.engine_registry import EngineRegistry
+
+
+class MigrateCommand:
+    name = 'migrate'
+
+    @staticmethod
+    def register(parser: ArgumentParser) -> None:
+        parser.add_argument('--target', type=int, default=None, help='Apply migrations up to this version')
+        parser.add_argument('--status', action='store_true', help='Only show the current and pending versions')
+
+    @staticmethod
+    def handle(args: Namespace) -> int:
+        runner = MigrationRunner(EngineRegistry.get_engine())
+
+        if args.status:
+            print(f"Current schema version: {runner.current_version()}")
+            for migration in runner.pending():
+                print(f"Pending: {migration.version:04d}_{migration.name}")
+            return 0
+
+        applied = runner.upgrade(args.target)
+        for migration in applied:
+            print(f"Applied: {migration.version:04d}_{migration.name}")
+        print(f"Schema version: {runner.current_version()}")
+        return 0
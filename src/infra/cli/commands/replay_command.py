@@ -0,0 +1,43 @@
+import json
+from argparse import ArgumentParser, Namespace
+
+from src.infra.config.settings import settings
+from src.infra.traffic import TrafficReplayer
+
+
+class ReplayCommand:
+    name = 'replay'
+
+    @staticmethod
+    def register(parser: ArgumentParser) -> None:
+        parser.add_argument('path', nargs='?', default=settings.TRAFFIC_CAPTURE_PATH,
+                            help='JSONL capture written by the traffic capture middleware')
+        parser.add_argument('--target', default=f'http://127.0.0.1:{settings.APP_PORT}',
+                            help='Base URL of the instance to replay against')
+        parser.add_argument('--speed', default='1',
+                            help="Playback speed multiplier (1 = original pacing) or 'max' for as fast as possible")
+        parser.add_argument('--concurrency', type=int, default=4, help='Concurrent connections to the target')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    @staticmethod
+    def handle(args: Namespace) -> int:
+        speed = None if args.speed == 'max' else float(args.speed)
+        replayer = TrafficReplayer(args.target, speed=speed, concurrency=args.concurrency)
+
+        with open(args.path, encoding='utf-8') as capture:
+            report = replayer.run(TrafficReplayer.read(capture))
+
+        if args.json:
+            print(json.dumps(report.to_dict(), indent=2))
+            return 0
+
+        latency = report.latency_percentiles()
+        print(f"Sent: {report.sent} ({report.requests_per_second:.1f} req/s over {report.elapsed_seconds:.2f}s)")
+        print(f"Failed: {report.failed}")
+        print(f"Latency: p50 {latency['p50']:.2f} ms, p95 {latency['p95']:.2f} ms, "
+              f"p99 {latency['p99']:.2f} ms, max {latency['max']:.2f} ms")
+        print(f"Statuses: {', '.join(f'{status}={count}' for status, count in sorted(report.statuses.items()))}")
+        print(f"Mismatched statuses: {report.mismatched}")
+        for (request, expected, actual), count in report.mismatches.most_common(20):
+            print(f"  {request}: expected {expected}, got {actual} ({count}x)")
+        return 0
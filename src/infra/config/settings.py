@@ -14,17 +14,118 @@ class Settings:
     APP_DEBUG = os.getenv('APP_DEBUG', 'True').lower() == 'true'
     APP_PORT = int(os.getenv('APP_PORT', 8000))
     APP_HOST = os.getenv('APP_HOST', '0.0.0.0')
+    APP_SERVER = os.getenv('APP_SERVER', 'flask')
+    ASGI_THREAD_LIMIT = int(os.getenv('ASGI_THREAD_LIMIT', 40))
+    APP_SERVER_MODE = os.getenv('APP_SERVER_MODE', 'development')
+    # Production server
+    SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', (os.cpu_count() or 1) * 2 + 1))
+    SERVER_THREADS = int(os.getenv('SERVER_THREADS', 4))
+    SERVER_KEEPALIVE = int(os.getenv('SERVER_KEEPALIVE', 5))
+    SERVER_TIMEOUT = int(os.getenv('SERVER_TIMEOUT', 30))
+    SERVER_GRACEFUL_TIMEOUT = int(os.getenv('SERVER_GRACEFUL_TIMEOUT', 30))
+    SERVER_MAX_REQUESTS = int(os.getenv('SERVER_MAX_REQUESTS', 10000))
+    SERVER_MAX_REQUESTS_JITTER = int(os.getenv('SERVER_MAX_REQUESTS_JITTER', 1000))
     # Database
     DATABASE_URL = os.getenv('DATABASE_URL', __database_host)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', -1))
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'True').lower() == 'true'
+    DB_AUTO_MIGRATE = os.getenv('DB_AUTO_MIGRATE', 'True').lower() == 'true'
+
+    # SQLite
+    SQLITE_PROFILES = {
+        'default': {},
+        'durable': {
+            'journal_mode': 'WAL',
+            'synchronous': 'FULL',
+            'busy_timeout': 5000,
+        },
+        'performance': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -64000,
+            'mmap_size': 268435456,
+            'temp_store': 'MEMORY',
+            'busy_timeout': 5000,
+        },
+    }
+    DB_SQLITE_PROFILE = os.getenv('DB_SQLITE_PROFILE', 'performance')
+
+    # Listing
+    LIST_COUNT_CACHE_TTL_SECONDS = float(os.getenv('LIST_COUNT_CACHE_TTL_SECONDS', 30))
+    LIST_COUNT_CACHE_MAX_ENTRIES = int(os.getenv('LIST_COUNT_CACHE_MAX_ENTRIES', 1024))
+
+    # Batch
+    BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', 10000))
+    BATCH_CHUNK_SIZE = int(os.getenv('BATCH_CHUNK_SIZE', 500))
+
+    # Export
+    EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+    EXPORT_CHUNK_BYTES = int(os.getenv('EXPORT_CHUNK_BYTES', 64 * 1024))
+
+    # Cache
+    USER_CACHE_ENABLED = os.getenv('USER_CACHE_ENABLED', str(APP_SERVER_MODE != 'production')).lower() == 'true'
+    USER_CACHE_MAX_ENTRIES = int(os.getenv('USER_CACHE_MAX_ENTRIES', 10000))
+    USER_CACHE_MAX_BYTES = int(os.getenv('USER_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+    USER_CACHE_TTL_SECONDS = float(os.getenv('USER_CACHE_TTL_SECONDS', 30))
+
+    # Compression
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'True').lower() == 'true'
+    COMPRESSION_ENCODINGS = [
+        encoding.strip() for encoding in os.getenv('COMPRESSION_ENCODINGS', 'br,zstd,gzip').split(',') if encoding.strip()
+    ]
+    COMPRESSION_MIN_BYTES = int(os.getenv('COMPRESSION_MIN_BYTES', 1024))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 4))
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv('COMPRESSION_ZSTD_LEVEL', 3))
+
+    # Serialization
+    RESPONSE_ENCODER = os.getenv('RESPONSE_ENCODER', 'auto')
 
     # API
     API_VERSION = os.getenv('API_VERSION', 'v1')
     API_PREFIX = os.getenv('API_PREFIX', '/api')
+    REQUEST_MAX_BODY_BYTES = int(os.getenv('REQUEST_MAX_BODY_BYTES', 1024 * 1024))
+
+    # Traffic capture
+    TRAFFIC_CAPTURE_ENABLED = os.getenv('TRAFFIC_CAPTURE_ENABLED', 'false').lower() == 'true'
+    TRAFFIC_CAPTURE_PATH = os.getenv('TRAFFIC_CAPTURE_PATH', 'captures/traffic.jsonl')
+
+    # Metrics
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_PATH = os.getenv('METRICS_PATH', '/metrics')
+    METRICS_LATENCY_BUCKETS = [
+        float(bucket) for bucket in
+        os.getenv('METRICS_LATENCY_BUCKETS', '0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10').split(',')
+        if bucket.strip()
+    ]
+
+    # Query instrumentation
+    DB_SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', 200))
+    DB_SLOW_QUERY_EXPLAIN = os.getenv('DB_SLOW_QUERY_EXPLAIN', 'true').lower() == 'true'
+    DB_SLOW_QUERY_LOG_PATH = os.getenv('DB_SLOW_QUERY_LOG_PATH', '')
+    DB_REPEATED_QUERY_THRESHOLD = int(os.getenv('DB_REPEATED_QUERY_THRESHOLD', 5))
+    DB_QUERY_HEADER_ENABLED = os.getenv(
+        'DB_QUERY_HEADER_ENABLED', str(APP_ENV != 'production' and APP_SERVER_MODE != 'production')
+    ).lower() == 'true'
 
     # Security
     SECRET_KEY = os.getenv('SECRET_KEY', 'your-super-secret-key-here')
     JWT_EXPIRATION_MINUTES = int(os.getenv('JWT_EXPIRATION_MINUTES', 60))
 
+    def sqlite_pragmas(self) -> dict:
+        if self.DB_SQLITE_PROFILE not in self.SQLITE_PROFILES:
+            raise ValueError(f"Unknown SQLite profile: {self.DB_SQLITE_PROFILE}")
+
+        pragmas = dict(self.SQLITE_PROFILES[self.DB_SQLITE_PROFILE])
+        for name in ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'busy_timeout'):
+            value = os.getenv(f'DB_SQLITE_{name.upper()}')
+            if value:
+                pragmas[name] = value
+        return pragmas
+
     def set_test_database(self):
         root_dir = pathlib.Path(__file__).parent.parent.parent.parent
         db_path = root_dir / "database" /  "test"
@@ -1,2 +1,3 @@
 from src.infra.db.settings.base import Base
 from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.db.settings.engine_registry import EngineRegistry
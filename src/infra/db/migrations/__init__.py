@@ -0,0 +1,2 @@
+from src.infra.db.migrations.migration import Migration
+from src.infra.db.migrations.migration_runner import MigrationRunner
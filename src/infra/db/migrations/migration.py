@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+    @staticmethod
+    def of_statements(version: int, name: str, statements: Sequence[str]) -> 'Migration':
+        def upgrade(connection: Connection) -> None:
+            for statement in statements:
+                connection.execute(text(statement))
+
+        return Migration(version, name, upgrade)
@@ -0,0 +1,69 @@
+import logging
+from datetime import datetime, timezone
+from typing import List, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from src.infra.db.migrations.migration import Migration
+from src.infra.db.migrations.versions import MIGRATIONS
+from src.infra.persistence.search.user_full_text_search import UserFullTextSearch
+
+logger = logging.getLogger(__name__)
+
+
+class MigrationRunner:
+    VERSION_TABLE = 'schema_version'
+
+    def __init__(self, an_engine: Engine, migrations: Sequence[Migration] = None) -> None:
+        self.__engine = an_engine
+        self.__migrations = sorted(migrations if migrations is not None else MIGRATIONS, key=lambda m: m.version)
+        self.__check_versions()
+
+    def current_version(self) -> int:
+        self.__ensure_version_table()
+        with self.__engine.connect() as connection:
+            version = connection.execute(text(f"SELECT MAX(version) FROM {self.VERSION_TABLE}")).scalar()
+        return version or 0
+
+    def pending(self) -> List[Migration]:
+        current = self.current_version()
+        return [migration for migration in self.__migrations if migration.version > current]
+
+    def upgrade(self, a_target: int = None) -> List[Migration]:
+        applied = []
+        for migration in self.pending():
+            if a_target is not None and migration.version > a_target:
+                break
+
+            with self.__engine.begin() as connection:
+                migration.upgrade(connection)
+                connection.execute(
+                    text(f"INSERT INTO {self.VERSION_TABLE} (version, name, applied_at) VALUES (:version, :name, :applied_at)"),
+                    {
+                        'version': migration.version,
+                        'name': migration.name,
+                        'applied_at': datetime.now(timezone.utc).isoformat(),
+                    }
+                )
+
+            logger.info("Applied migration %04d_%s", migration.version, migration.name)
+            applied.append(migration)
+
+        if applied:
+            UserFullTextSearch.reset()
+        return applied
+
+    def __ensure_version_table(self) -> None:
+        with self.__engine.begin() as connection:
+            connection.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {self.VERSION_TABLE} ("
+                "version INTEGER NOT NULL PRIMARY KEY, "
+                "name VARCHAR(120) NOT NULL, "
+                "applied_at VARCHAR(40) NOT NULL)"
+            ))
+
+    def __check_versions(self) -> None:
+        versions = [migration.version for migration in self.__migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"Duplicated migration versions: {versions}")
@@ -0,0 +1,15 @@
+from src.infra.db.migrations.versions import (
+    v0001_create_users_table,
+    v0002_add_users_keyset_indexes,
+    v0003_add_table_counters,
+    v0004_add_users_full_text_index,
+    v0005_add_users_version,
+)
+
+MIGRATIONS = [
+    v0001_create_users_table.migration,
+    v0002_add_users_keyset_indexes.migration,
+    v0003_add_table_counters.migration,
+    v0004_add_users_full_text_index.migration,
+    v0005_add_users_version.migration,
+]
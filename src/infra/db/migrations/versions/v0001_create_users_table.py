@@ -0,0 +1,15 @@
+from src.infra.db.migrations.migration import Migration
+
+migration = Migration.of_statements(1, 'create_users_table', [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER NOT NULL,
+        name VARCHAR(50) NOT NULL,
+        email VARCHAR(120) NOT NULL,
+        PRIMARY KEY (id),
+        UNIQUE (name),
+        UNIQUE (email)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_users_id ON users (id)",
+])
@@ -0,0 +1,6 @@
+from src.infra.db.migrations.migration import Migration
+
+migration = Migration.of_statements(2, 'add_users_keyset_indexes', [
+    "CREATE INDEX IF NOT EXISTS ix_users_name_id ON users (name, id)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_id ON users (email, id)",
+])
@@ -0,0 +1,26 @@
+from src.infra.db.migrations.migration import Migration
+
+migration = Migration.of_statements(3, 'add_table_counters', [
+    """
+    CREATE TABLE IF NOT EXISTS table_counters (
+        table_name VARCHAR(64) NOT NULL PRIMARY KEY,
+        row_count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    INSERT OR REPLACE INTO table_counters (table_name, row_count)
+    SELECT 'users', COUNT(*) FROM users
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_users_count_insert AFTER INSERT ON users
+    BEGIN
+        UPDATE table_counters SET row_count = row_count + 1 WHERE table_name = 'users';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_users_count_delete AFTER DELETE ON users
+    BEGIN
+        UPDATE table_counters SET row_count = row_count - 1 WHERE table_name = 'users';
+    END
+    """,
+])
@@ -0,0 +1,57 @@
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+from src.infra.db.migrations.migration import Migration
+
+logger = logging.getLogger(__name__)
+
+
+def _supports_fts5_trigram(connection: Connection) -> bool:
+    try:
+        connection.execute(text("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(value, tokenize='trigram')"))
+        connection.execute(text("DROP TABLE temp.fts5_probe"))
+        return True
+    except OperationalError:
+        return False
+
+
+def _upgrade(connection: Connection) -> None:
+    if connection.dialect.name != 'sqlite' or not _supports_fts5_trigram(connection):
+        logger.warning("FTS5 trigram tokenizer not available, user search keeps using LIKE")
+        return
+
+    statements = [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+            name, email, content='users', content_rowid='id', tokenize='trigram'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_users_fts_insert AFTER INSERT ON users
+        BEGIN
+            INSERT INTO users_fts (rowid, name, email) VALUES (new.id, new.name, new.email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_users_fts_delete AFTER DELETE ON users
+        BEGIN
+            INSERT INTO users_fts (users_fts, rowid, name, email) VALUES ('delete', old.id, old.name, old.email);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_users_fts_update AFTER UPDATE OF name, email ON users
+        BEGIN
+            INSERT INTO users_fts (users_fts, rowid, name, email) VALUES ('delete', old.id, old.name, old.email);
+            INSERT INTO users_fts (rowid, name, email) VALUES (new.id, new.name, new.email);
+        END
+        """,
+        "INSERT INTO users_fts (users_fts) VALUES ('rebuild')",
+    ]
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+migration = Migration(4, 'add_users_full_text_index', _upgrade)
@@ -0,0 +1,26 @@
+from src.infra.db.migrations.migration import Migration
+
+migration = Migration.of_statements(5, 'add_users_version', [
+    "ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 1",
+    "ALTER TABLE table_counters ADD COLUMN revision INTEGER NOT NULL DEFAULT 0",
+    "DROP TRIGGER IF EXISTS trg_users_count_insert",
+    "DROP TRIGGER IF EXISTS trg_users_count_delete",
+    """
+    CREATE TRIGGER trg_users_count_insert AFTER INSERT ON users
+    BEGIN
+        UPDATE table_counters SET row_count = row_count + 1, revision = revision + 1 WHERE table_name = 'users';
+    END
+    """,
+    """
+    CREATE TRIGGER trg_users_count_delete AFTER DELETE ON users
+    BEGIN
+        UPDATE table_counters SET row_count = row_count - 1, revision = revision + 1 WHERE table_name = 'users';
+    END
+    """,
+    """
+    CREATE TRIGGER trg_users_revision_update AFTER UPDATE ON users
+    BEGIN
+        UPDATE table_counters SET revision = revision + 1 WHERE table_name = 'users';
+    END
+    """,
+])
@@ -0,0 +1,72 @@
+import threading
+from typing import Dict
+
+from sqlalchemy.engine import make_url, URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.infra.config.settings import settings
+from src.infra.db.settings.sqlite_pragmas import SqlitePragmas
+
+
+class AsyncEngineRegistry:
+    ASYNC_DRIVERS = {'sqlite': 'sqlite+aiosqlite'}
+    __lock = threading.Lock()
+    __engines: Dict[str, AsyncEngine] = {}
+
+    @classmethod
+    def get_engine(cls, a_connection_string: str = None) -> AsyncEngine:
+        connection_string = a_connection_string or settings.DATABASE_URL
+        engine = cls.__engines.get(connection_string)
+        if engine is not None:
+            return engine
+
+        with cls.__lock:
+            engine = cls.__engines.get(connection_string)
+            if engine is None:
+                engine = cls.__create_engine(connection_string)
+                cls.__engines[connection_string] = engine
+            return engine
+
+    @classmethod
+    async def dispose_all(cls) -> None:
+        with cls.__lock:
+            engines = list(cls.__engines.values())
+            cls.__engines.clear()
+        for engine in engines:
+            await engine.dispose()
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__lock:
+            for engine in cls.__engines.values():
+                engine.sync_engine.dispose(close=False)
+            cls.__engines.clear()
+
+    @classmethod
+    def async_url(cls, a_connection_string: str) -> URL:
+        url = make_url(a_connection_string)
+        driver = cls.ASYNC_DRIVERS.get(url.drivername)
+        return url.set(drivername=driver) if driver else url
+
+    @classmethod
+    def __create_engine(cls, a_connection_string: str) -> AsyncEngine:
+        url = cls.async_url(a_connection_string)
+        options = {'pool_pre_ping': settings.DB_POOL_PRE_PING}
+
+        if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+            engine = create_async_engine(url, poolclass=StaticPool, **options)
+        else:
+            engine = create_async_engine(
+                url,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                **options
+            )
+
+        if url.get_backend_name() == 'sqlite':
+            SqlitePragmas.install(engine.sync_engine, settings.sqlite_pragmas())
+
+        return engine
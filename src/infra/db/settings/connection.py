@@ -1,31 +1,20 @@
-import os
 from src.infra.config.settings import settings
-
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from src.infra.db.settings.base import Base
+from src.infra.db.settings.engine_registry import EngineRegistry
 
 
 class DBConnectionHandler:
-    def __init__(self) -> None:
-        self.__connection_string = settings.DATABASE_URL
-        self.__engine = self.__create_database_engine()
-        Base.metadata.create_all(self.__engine)
-
-    def __create_database_engine(self):
-        engine = create_engine(
-            self.__connection_string,
-            connect_args={'check_same_thread': False}
-        )
-        return engine
+    def __init__(self, a_connection_string: str = None) -> None:
+        self.__connection_string = a_connection_string or settings.DATABASE_URL
+        self.__engine = EngineRegistry.get_engine(self.__connection_string)
+        self.session = None
 
     def get_engine(self):
         return self.__engine
 
     def __enter__(self):
-        session_make = sessionmaker(bind=self.__engine)
+        session_make = EngineRegistry.get_session_factory(self.__connection_string)
         self.session = session_make()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.session.close()
\ No newline at end of file
+        self.session.close()
@@ -0,0 +1,85 @@
+import threading
+from typing import Dict
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infra.config.settings import settings
+from src.infra.db.settings.instrumented_pool import InstrumentedQueuePool
+from src.infra.db.settings.pool_statistics import PoolStatistics, PoolMonitor
+from src.infra.db.settings.sqlite_pragmas import SqlitePragmas
+
+
+class EngineRegistry:
+    __lock = threading.Lock()
+    __engines: Dict[str, Engine] = {}
+    __session_factories: Dict[str, sessionmaker] = {}
+
+    @classmethod
+    def get_engine(cls, a_connection_string: str = None) -> Engine:
+        connection_string = a_connection_string or settings.DATABASE_URL
+        engine = cls.__engines.get(connection_string)
+        if engine is not None:
+            return engine
+
+        with cls.__lock:
+            engine = cls.__engines.get(connection_string)
+            if engine is None:
+                engine = cls.__create_engine(connection_string)
+                cls.__session_factories[connection_string] = sessionmaker(bind=engine)
+                cls.__engines[connection_string] = engine
+            return engine
+
+    @classmethod
+    def get_session_factory(cls, a_connection_string: str = None) -> sessionmaker:
+        connection_string = a_connection_string or settings.DATABASE_URL
+        cls.get_engine(connection_string)
+        return cls.__session_factories[connection_string]
+
+    @classmethod
+    def get_pool_statistics(cls, a_connection_string: str = None) -> PoolStatistics:
+        pool = cls.get_engine(a_connection_string).pool
+        if isinstance(pool, InstrumentedQueuePool):
+            return pool.statistics()
+        return PoolMonitor().snapshot()
+
+    @classmethod
+    def dispose_all(cls, close: bool = True) -> None:
+        with cls.__lock:
+            for engine in cls.__engines.values():
+                engine.dispose(close=close)
+            cls.__engines.clear()
+            cls.__session_factories.clear()
+
+    @classmethod
+    def __create_engine(cls, a_connection_string: str) -> Engine:
+        url = make_url(a_connection_string)
+        engine = cls.__build_engine(url)
+
+        if url.get_backend_name() == 'sqlite':
+            SqlitePragmas.install(engine, settings.sqlite_pragmas())
+
+        return engine
+
+    @staticmethod
+    def __build_engine(url) -> Engine:
+        options = {'pool_pre_ping': settings.DB_POOL_PRE_PING}
+
+        if url.get_backend_name() == 'sqlite':
+            options['connect_args'] = {'check_same_thread': False}
+
+        if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+            options['poolclass'] = StaticPool
+            return create_engine(url, **options)
+
+        return create_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            **options
+        )
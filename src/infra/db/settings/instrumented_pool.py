@@ -0,0 +1,34 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from src.infra.db.settings.pool_statistics import PoolMonitor, PoolStatistics
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.monitor = PoolMonitor()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.monitor.record_timeout()
+            raise
+        self.monitor.record_checkout((time.perf_counter() - started) * 1000)
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self.monitor.record_checkin()
+
+    def recreate(self) -> 'InstrumentedQueuePool':
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+    def statistics(self) -> PoolStatistics:
+        return self.monitor.snapshot(self.size(), self.checkedout(), max(self.overflow(), 0))
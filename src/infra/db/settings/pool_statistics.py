@@ -0,0 +1,58 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolStatistics:
+    pool_size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkins: int
+    timeouts: int
+    total_wait_ms: float
+    max_wait_ms: float
+
+    @property
+    def average_wait_ms(self) -> float:
+        if not self.checkouts:
+            return 0.0
+        return self.total_wait_ms / self.checkouts
+
+
+class PoolMonitor:
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__checkouts = 0
+        self.__checkins = 0
+        self.__timeouts = 0
+        self.__total_wait_ms = 0.0
+        self.__max_wait_ms = 0.0
+
+    def record_checkout(self, a_wait_ms: float) -> None:
+        with self.__lock:
+            self.__checkouts += 1
+            self.__total_wait_ms += a_wait_ms
+            if a_wait_ms > self.__max_wait_ms:
+                self.__max_wait_ms = a_wait_ms
+
+    def record_checkin(self) -> None:
+        with self.__lock:
+            self.__checkins += 1
+
+    def record_timeout(self) -> None:
+        with self.__lock:
+            self.__timeouts += 1
+
+    def snapshot(self, a_pool_size: int = 0, a_checked_out: int = 0, an_overflow: int = 0) -> PoolStatistics:
+        with self.__lock:
+            return PoolStatistics(
+                pool_size=a_pool_size,
+                checked_out=a_checked_out,
+                overflow=an_overflow,
+                checkouts=self.__checkouts,
+                checkins=self.__checkins,
+                timeouts=self.__timeouts,
+                total_wait_ms=self.__total_wait_ms,
+                max_wait_ms=self.__max_wait_ms,
+            )
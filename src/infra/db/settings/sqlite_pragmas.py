@@ -0,0 +1,39 @@
+import re
+from typing import Dict
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+
+class SqlitePragmas:
+    SUPPORTED = ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'busy_timeout')
+    __VALUE_PATTERN = re.compile(r'^-?\w+$')
+
+    @classmethod
+    def install(cls, an_engine: Engine, pragmas: Dict[str, object]) -> None:
+        statements = [cls.__statement(name, value) for name, value in pragmas.items()]
+
+        @event.listens_for(an_engine, 'connect')
+        def apply_pragmas(dbapi_connection, _connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+
+    @classmethod
+    def effective(cls, an_engine: Engine) -> Dict[str, object]:
+        with an_engine.connect() as connection:
+            return {
+                name: connection.execute(text(f"PRAGMA {name}")).scalar()
+                for name in cls.SUPPORTED
+            }
+
+    @classmethod
+    def __statement(cls, a_name: str, a_value: object) -> str:
+        if a_name not in cls.SUPPORTED:
+            raise ValueError(f"Unsupported SQLite pragma: {a_name}")
+        if not cls.__VALUE_PATTERN.match(str(a_value)):
+            raise ValueError(f"Invalid value for SQLite pragma {a_name}: {a_value}")
+        return f"PRAGMA {a_name} = {a_value}"
@@ -0,0 +1,8 @@
+from src.infra.metrics.cache_metrics import CacheMetrics
+from src.infra.metrics.query_instrumentation import QueryInstrumentation
+from src.infra.metrics.query_pattern_detector import QueryPatternDetector
+from src.infra.metrics.query_stats import QueryStats
+from src.infra.metrics.query_tracker import QueryTracker
+from src.infra.metrics.request_metrics import RequestMetrics
+from src.infra.metrics.slow_query_log import SlowQueryLog
+from src.infra.metrics.tracked_stream import TrackedStream
@@ -0,0 +1,46 @@
+import threading
+import weakref
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from src.infra.cache.cache_statistics import CacheStatistics
+
+
+class CacheMetrics:
+    FIELDS = (
+        ('hits', 'cache_hits_total', 'counter', 'Cache lookups served from memory.'),
+        ('misses', 'cache_misses_total', 'counter', 'Cache lookups that fell through to the database.'),
+        ('evictions', 'cache_evictions_total', 'counter', 'Entries evicted to respect the entry or byte budget.'),
+        ('entries', 'cache_entries', 'gauge', 'Entries currently cached.'),
+        ('bytes', 'cache_bytes', 'gauge', 'Estimated bytes currently cached.'),
+    )
+
+    __caches: List[Tuple[str, weakref.ref]] = []
+    __lock = threading.Lock()
+
+    @classmethod
+    def register(cls, a_name: str, a_cache) -> None:
+        with cls.__lock:
+            cls.__caches.append((a_name, weakref.ref(a_cache)))
+
+    @classmethod
+    def render(cls) -> str:
+        with cls.__lock:
+            cls.__caches = [(name, reference) for name, reference in cls.__caches if reference() is not None]
+            caches = list(cls.__caches)
+
+        totals: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for name, reference in caches:
+            cache = reference()
+            if cache is None:
+                continue
+            statistics: CacheStatistics = cache.stats()
+            for field, *_ in cls.FIELDS:
+                totals[name][field] += getattr(statistics, field)
+
+        lines = []
+        for field, metric, kind, description in cls.FIELDS:
+            lines += [f'# HELP {metric} {description}', f'# TYPE {metric} {kind}']
+            for name in sorted(totals):
+                lines.append(f'{metric}{{cache="{name}"}} {totals[name][field]}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,29 @@
+from contextvars import Token
+from typing import Optional
+
+from src.infra.metrics.query_pattern_detector import QueryPatternDetector
+from src.infra.metrics.query_stats import QueryStats
+from src.infra.metrics.query_tracker import QueryTracker
+from src.infra.metrics.slow_query_log import SlowQueryLog
+
+
+class QueryInstrumentation:
+    def __init__(self, a_detector: QueryPatternDetector, a_slow_query_log: Optional[SlowQueryLog] = None) -> None:
+        self.__detector = a_detector
+        QueryTracker.install(a_slow_query_log)
+
+    @staticmethod
+    def begin() -> Token:
+        return QueryTracker.start()
+
+    @staticmethod
+    def detach(a_token: Token) -> QueryStats:
+        return QueryTracker.stop(a_token)
+
+    def end(self, a_stats: QueryStats, a_route: str, a_method: str) -> QueryStats:
+        self.__detector.inspect(a_route, a_method, a_stats)
+        return a_stats
+
+    @staticmethod
+    def server_timing(a_stats: QueryStats) -> str:
+        return f'db;dur={a_stats.milliseconds:.3f};desc="{a_stats.count} queries"'
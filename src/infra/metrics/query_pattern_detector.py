@@ -0,0 +1,47 @@
+import logging
+import re
+from collections import defaultdict
+from typing import Dict, List
+
+from src.infra.metrics.query_stats import QueryStats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryPatternDetector:
+    PLACEHOLDER_LIST = re.compile(r'(?:\?|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+))+')
+    READ_TABLE = re.compile(r'^\s*SELECT\b.*?\bFROM\s+"?(\w+)', re.IGNORECASE | re.DOTALL)
+    WRITE_TABLE = re.compile(r'^\s*(?:UPDATE|DELETE\s+FROM)\s+"?(\w+)', re.IGNORECASE)
+
+    def __init__(self, a_repeat_threshold: int) -> None:
+        self.__repeat_threshold = a_repeat_threshold
+
+    def detect(self, a_stats: QueryStats) -> List[str]:
+        shapes: Dict[str, int] = defaultdict(int)
+        for statement, count in a_stats.statements.items():
+            shapes[self.__normalize(statement)] += count
+
+        findings = [
+            f'{count} executions of: {statement}'
+            for statement, count in shapes.items() if count >= self.__repeat_threshold
+        ]
+
+        read_tables = set()
+        for statement in shapes:
+            read = self.READ_TABLE.match(statement)
+            if read:
+                read_tables.add(read.group(1).lower())
+                continue
+            write = self.WRITE_TABLE.match(statement)
+            if write and write.group(1).lower() in read_tables:
+                findings.append(f'{write.group(1)} read before being written by: {statement}')
+        return findings
+
+    def inspect(self, a_route: str, a_method: str, a_stats: QueryStats) -> List[str]:
+        findings = self.detect(a_stats)
+        for finding in findings:
+            logger.warning("Possible N+1 on %s %s: %s", a_method, a_route, finding)
+        return findings
+
+    def __normalize(self, a_statement: str) -> str:
+        return self.PLACEHOLDER_LIST.sub('?', ' '.join(a_statement.split()))
@@ -0,0 +1,19 @@
+from typing import Dict
+
+
+class QueryStats:
+    __slots__ = ('count', 'seconds', 'statements')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def record(self, a_statement: str, an_elapsed: float) -> None:
+        self.count += 1
+        self.seconds += an_elapsed
+        self.statements[a_statement] = self.statements.get(a_statement, 0) + 1
+
+    @property
+    def milliseconds(self) -> float:
+        return self.seconds * 1000
@@ -0,0 +1,66 @@
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.infra.metrics.query_stats import QueryStats
+from src.infra.metrics.slow_query_log import SlowQueryLog
+
+
+class QueryTracker:
+    __current: ContextVar[Optional[QueryStats]] = ContextVar('query_stats', default=None)
+    __lock = threading.Lock()
+    __installed = False
+    __slow_query_log: Optional[SlowQueryLog] = None
+
+    @classmethod
+    def install(cls, a_slow_query_log: SlowQueryLog = None) -> None:
+        with cls.__lock:
+            if a_slow_query_log is not None:
+                cls.__slow_query_log = a_slow_query_log
+            if cls.__installed:
+                return
+            event.listen(Engine, 'before_cursor_execute', cls.__before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', cls.__after_cursor_execute)
+            cls.__installed = True
+
+    @classmethod
+    def start(cls) -> Token:
+        return cls.activate(QueryStats())
+
+    @classmethod
+    def activate(cls, a_stats: QueryStats) -> Token:
+        return cls.__current.set(a_stats)
+
+    @classmethod
+    def current(cls) -> Optional[QueryStats]:
+        return cls.__current.get()
+
+    @classmethod
+    def stop(cls, a_token: Token) -> QueryStats:
+        stats = cls.__current.get()
+        cls.__current.reset(a_token)
+        return stats or QueryStats()
+
+    @staticmethod
+    def __before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            context.query_started = time.perf_counter()
+
+    @classmethod
+    def __after_cursor_execute(cls, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = getattr(context, 'query_started', None)
+        if started is None:
+            return
+
+        elapsed = time.perf_counter() - started
+        stats = cls.__current.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+        slow_query_log = cls.__slow_query_log
+        if slow_query_log is not None and elapsed >= slow_query_log.threshold_seconds:
+            slow_query_log.record(conn, statement, parameters, elapsed, executemany)
@@ -0,0 +1,114 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+RouteKey = Tuple[str, str]
+
+
+class _Shard:
+    __slots__ = ('lock', 'requests', 'in_flight', 'latency', 'db_time')
+
+    def __init__(self, a_bucket_count: int) -> None:
+        self.lock = threading.Lock()
+        self.requests: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self.in_flight: Dict[RouteKey, int] = defaultdict(int)
+        self.latency: Dict[RouteKey, List[float]] = defaultdict(lambda: [0] * (a_bucket_count + 2))
+        self.db_time: Dict[RouteKey, List[float]] = defaultdict(lambda: [0] * (a_bucket_count + 2))
+
+
+class RequestMetrics:
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+    SHARD_COUNT = 16
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.__buckets = tuple(sorted(buckets))
+        self.__shards = tuple(_Shard(len(self.__buckets)) for _ in range(self.SHARD_COUNT))
+
+    def begin(self, a_route: str, a_method: str) -> Tuple[RouteKey, float]:
+        key = (a_route, a_method)
+        shard = self.__shard()
+        with shard.lock:
+            shard.in_flight[key] += 1
+        return key, time.perf_counter()
+
+    def end(self, a_request: Tuple[RouteKey, float], a_status: int, a_db_seconds: float = 0.0) -> None:
+        key, started = a_request
+        elapsed = time.perf_counter() - started
+
+        shard = self.__shard()
+        with shard.lock:
+            shard.in_flight[key] -= 1
+            shard.requests[(key[0], key[1], a_status)] += 1
+            self.__observe(shard.latency[key], elapsed)
+            self.__observe(shard.db_time[key], a_db_seconds)
+
+    def render(self) -> str:
+        requests: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        in_flight: Dict[RouteKey, int] = defaultdict(int)
+        latency: Dict[RouteKey, List[float]] = {}
+        db_time: Dict[RouteKey, List[float]] = {}
+        for shard in self.__shards:
+            with shard.lock:
+                for key, count in shard.requests.items():
+                    requests[key] += count
+                for key, count in shard.in_flight.items():
+                    in_flight[key] += count
+                self.__merge(latency, shard.latency)
+                self.__merge(db_time, shard.db_time)
+
+        lines = [
+            '# HELP http_requests_total Requests handled, by route, method and status code.',
+            '# TYPE http_requests_total counter',
+        ]
+        for (route, method, status), count in sorted(requests.items()):
+            lines.append(f'http_requests_total{{{self.__labels(route, method)},status="{status}"}} {count}')
+
+        lines += [
+            '# HELP http_requests_in_flight Requests currently being handled.',
+            '# TYPE http_requests_in_flight gauge',
+        ]
+        for (route, method), count in sorted(in_flight.items()):
+            lines.append(f'http_requests_in_flight{{{self.__labels(route, method)}}} {count}')
+
+        lines += self.__histogram_lines(
+            'http_request_duration_seconds', 'Time spent handling a request.', latency
+        )
+        lines += self.__histogram_lines(
+            'http_request_db_duration_seconds', 'Time spent in database calls while handling a request.', db_time
+        )
+        return '\n'.join(lines) + '\n'
+
+    def __shard(self) -> _Shard:
+        return self.__shards[threading.get_native_id() % self.SHARD_COUNT]
+
+    def __observe(self, a_histogram: List[float], a_value: float) -> None:
+        a_histogram[bisect_left(self.__buckets, a_value)] += 1
+        a_histogram[-1] += a_value
+
+    @staticmethod
+    def __merge(a_target: Dict[RouteKey, List[float]], a_source: Dict[RouteKey, List[float]]) -> None:
+        for key, histogram in a_source.items():
+            merged = a_target.setdefault(key, [0] * len(histogram))
+            for index, value in enumerate(histogram):
+                merged[index] += value
+
+    def __histogram_lines(self, a_name: str, a_help: str, a_histograms: Dict[RouteKey, List[float]]) -> List[str]:
+        lines = [f'# HELP {a_name} {a_help}', f'# TYPE {a_name} histogram']
+        for (route, method), histogram in sorted(a_histograms.items()):
+            labels = self.__labels(route, method)
+            cumulative = 0
+            for bound, count in zip(self.__buckets, histogram):
+                cumulative += count
+                lines.append(f'{a_name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+            cumulative += histogram[-2]
+            lines.append(f'{a_name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f'{a_name}_sum{{{labels}}} {histogram[-1]:.6f}')
+            lines.append(f'{a_name}_count{{{labels}}} {cumulative}')
+        return lines
+
+    @staticmethod
+    def __labels(a_route: str, a_method: str) -> str:
+        route = a_route.replace('\\', '\\\\').replace('"', '\\"')
+        return f'route="{route}",method="{a_method}"'
@@ -0,0 +1,68 @@
+import logging
+import pathlib
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SlowQueryLog:
+    EXPLAINABLE = ('select', 'insert', 'update', 'delete', 'with')
+    MAX_SHAPE_PARAMETERS = 8
+
+    def __init__(self, a_threshold_seconds: float, explain: bool = True, a_path: str = None) -> None:
+        self.threshold_seconds = a_threshold_seconds
+        self.__explain = explain
+        if a_path:
+            self.__log_to(a_path)
+
+    def record(self, a_connection, a_statement: str, a_parameters: Any, an_elapsed: float,
+               executemany: bool = False) -> None:
+        logger.warning(
+            "Slow query (%.1f ms): %s | parameters: %s | plan: %s",
+            an_elapsed * 1000,
+            ' '.join(a_statement.split()),
+            self.parameter_shape(a_parameters, executemany),
+            self.__plan(a_connection, a_statement, a_parameters, executemany)
+        )
+
+    @classmethod
+    def parameter_shape(cls, a_parameters: Any, executemany: bool = False) -> str:
+        if executemany:
+            rows = list(a_parameters or ())
+            return f'{len(rows)} x {cls.parameter_shape(rows[0])}' if rows else '0 x ()'
+        if isinstance(a_parameters, dict):
+            return cls.__shape([f'{name}: {type(value).__name__}' for name, value in a_parameters.items()], '{}')
+        return cls.__shape([type(value).__name__ for value in a_parameters or ()], '()')
+
+    def __plan(self, a_connection, a_statement: str, a_parameters: Any, executemany: bool) -> str:
+        if not self.__explain or not a_statement.lstrip().lower().startswith(self.EXPLAINABLE):
+            return 'not explained'
+
+        explain = 'EXPLAIN QUERY PLAN ' if a_connection.dialect.name == 'sqlite' else 'EXPLAIN '
+        parameters = a_parameters[0] if executemany and a_parameters else a_parameters
+        try:
+            cursor = a_connection.connection.cursor()
+            try:
+                cursor.execute(explain + a_statement, parameters or ())
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        except Exception as exception:
+            return f'unavailable ({exception})'
+        return '; '.join(str(row[-1]) for row in rows) or 'no plan rows'
+
+    @classmethod
+    def __shape(cls, a_parts: list, a_brackets: str) -> str:
+        if len(a_parts) > cls.MAX_SHAPE_PARAMETERS:
+            a_parts = a_parts[:cls.MAX_SHAPE_PARAMETERS] + [f'... {len(a_parts)} parameters']
+        return a_brackets[0] + ', '.join(a_parts) + a_brackets[1]
+
+    @staticmethod
+    def __log_to(a_path: str) -> None:
+        path = pathlib.Path(a_path).resolve()
+        if any(getattr(handler, 'baseFilename', None) == str(path) for handler in logger.handlers):
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        logger.addHandler(handler)
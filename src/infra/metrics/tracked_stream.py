@@ -0,0 +1,49 @@
+from typing import Any, Callable
+
+from src.infra.metrics.query_stats import QueryStats
+from src.infra.metrics.query_tracker import QueryTracker
+
+
+class TrackedStream:
+    def __init__(self, a_body: Any, a_stats: QueryStats, an_on_close: Callable[[], None]) -> None:
+        self.__body = a_body
+        self.__stats = a_stats
+        self.__on_close = an_on_close
+        self.__closed = False
+
+    def __iter__(self) -> 'TrackedStream':
+        return self
+
+    def __next__(self) -> Any:
+        token = QueryTracker.activate(self.__stats)
+        try:
+            return next(self.__body)
+        except BaseException:
+            self.close()
+            raise
+        finally:
+            QueryTracker.stop(token)
+
+    def __aiter__(self) -> 'TrackedStream':
+        return self
+
+    async def __anext__(self) -> Any:
+        token = QueryTracker.activate(self.__stats)
+        try:
+            return await self.__body.__anext__()
+        except BaseException:
+            self.close()
+            raise
+        finally:
+            QueryTracker.stop(token)
+
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        close = getattr(self.__body, 'close', None)
+        try:
+            if close is not None:
+                close()
+        finally:
+            self.__on_close()
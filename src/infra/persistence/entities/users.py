@@ -10,6 +10,7 @@ class UserEntity(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, nullable=False)
     email = Column(String(120), unique=True, nullable=False)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
 
     def __repr__(self):
         return f"User(id={self.id}, name={self.name}, email={self.email})"
@@ -26,6 +27,7 @@ class UserEntity(Base):
             self.id,
             self.name,
             self.email,
+            self.version,
         )
 
     @staticmethod
@@ -36,6 +38,3 @@ class UserEntity(Base):
             email=user.email,
         )
 
-    def __getattribute__(self, __name):
-        return super().__getattribute__(__name)
-
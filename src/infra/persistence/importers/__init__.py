@@ -0,0 +1,3 @@
+from src.infra.persistence.importers.user_bulk_importer import UserBulkImporter
+from src.infra.persistence.importers.user_import_report import UserImportReport
+from src.infra.persistence.importers.user_record_reader import UserRecordReader
@@ -0,0 +1,133 @@
+import json
+import logging
+import time
+from typing import Iterable, List, Optional, Set, TextIO, Tuple
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.domain.validators.user_validator import UserValidator
+from src.infra.persistence.entities.users import UserEntity
+from src.infra.persistence.importers.user_import_report import UserImportReport
+
+logger = logging.getLogger(__name__)
+
+
+class UserBulkImporter:
+    def __init__(self,
+                 an_engine: Engine,
+                 chunk_size: int = 50000,
+                 drop_indexes: bool = False,
+                 rejects: Optional[TextIO] = None) -> None:
+        self.__engine = an_engine
+        self.__chunk_size = chunk_size
+        self.__drop_indexes = drop_indexes
+        self.__rejects = rejects
+        self.__users_table = UserEntity.__table__
+
+    def run(self, records: Iterable[Tuple[int, Optional[dict], Optional[str]]]) -> UserImportReport:
+        report = UserImportReport()
+        started = time.perf_counter()
+        seen_names, seen_emails = self.__load_existing_keys()
+
+        suspended = self.__suspend_secondary_structures() if self.__drop_indexes else []
+        try:
+            chunk: List[dict] = []
+            for line_number, record, parse_error in records:
+                report.read += 1
+                errors = [parse_error] if parse_error else self.__validate(record, seen_names, seen_emails)
+
+                if errors:
+                    report.rejected += 1
+                    self.__reject(line_number, record, errors)
+                    continue
+
+                seen_names.add(record['name'])
+                seen_emails.add(record['email'])
+                chunk.append({'name': record['name'], 'email': record['email']})
+
+                if len(chunk) >= self.__chunk_size:
+                    self.__flush(chunk, report, started)
+                    chunk = []
+
+            if chunk:
+                self.__flush(chunk, report, started)
+        finally:
+            if suspended:
+                self.__restore_secondary_structures(suspended)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def __load_existing_keys(self) -> Tuple[Set[str], Set[str]]:
+        names: Set[str] = set()
+        emails: Set[str] = set()
+        with self.__engine.connect() as connection:
+            result = connection.execution_options(yield_per=self.__chunk_size).execute(
+                select(self.__users_table.c.name, self.__users_table.c.email)
+            )
+            for name, email in result:
+                names.add(name)
+                emails.add(email)
+        return names, emails
+
+    @staticmethod
+    def __validate(record: dict, seen_names: Set[str], seen_emails: Set[str]) -> List[str]:
+        if not all(isinstance(record.get(field), (str, type(None))) for field in ('name', 'email')):
+            return ["Name and email must be strings"]
+
+        messages = UserValidator.errors_for(record.get('name'), record.get('email'))
+        if messages:
+            return messages
+
+        errors = []
+        if record['email'] in seen_emails:
+            errors.append("Email already exists")
+        if record['name'] in seen_names:
+            errors.append("Name already exists")
+        return errors
+
+    def __flush(self, chunk: List[dict], report: UserImportReport, started: float) -> None:
+        with self.__engine.begin() as connection:
+            connection.execute(insert(self.__users_table), chunk)
+
+        report.inserted += len(chunk)
+        elapsed = time.perf_counter() - started
+        logger.info("Inserted %d users (%.0f rows/s)", report.inserted, report.inserted / elapsed if elapsed else 0)
+
+    def __reject(self, line_number: int, record: Optional[dict], errors: List[str]) -> None:
+        if self.__rejects is None:
+            return
+        self.__rejects.write(json.dumps({'line': line_number, 'record': record, 'errors': errors}, ensure_ascii=False))
+        self.__rejects.write('\n')
+
+    def __suspend_secondary_structures(self) -> List[Tuple[str, str, str]]:
+        if self.__engine.dialect.name != 'sqlite':
+            logger.warning("Dropping indexes is only supported on SQLite, importing with indexes in place")
+            return []
+
+        with self.__engine.begin() as connection:
+            suspended = connection.execute(text(
+                "SELECT type, name, sql FROM sqlite_master "
+                "WHERE tbl_name = 'users' AND sql IS NOT NULL "
+                "AND (type = 'index' OR (type = 'trigger' AND name LIKE 'trg_users_fts_%'))"
+            )).all()
+            for object_type, name, _ in suspended:
+                connection.execute(text(f'DROP {object_type.upper()} IF EXISTS "{name}"'))
+
+        logger.info("Suspended %d indexes/triggers for the import", len(suspended))
+        return [tuple(row) for row in suspended]
+
+    def __restore_secondary_structures(self, suspended: List[Tuple[str, str, str]]) -> None:
+        started = time.perf_counter()
+        with self.__engine.begin() as connection:
+            for _, _, sql in suspended:
+                connection.execute(text(sql))
+            if any(object_type == 'trigger' for object_type, _, _ in suspended):
+                self.__rebuild_full_text_index(connection)
+
+        logger.info("Rebuilt %d indexes/triggers in %.1fs", len(suspended), time.perf_counter() - started)
+
+    @staticmethod
+    def __rebuild_full_text_index(connection: Connection) -> None:
+        connection.execute(text("INSERT INTO users_fts (users_fts) VALUES ('rebuild')"))
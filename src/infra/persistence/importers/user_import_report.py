@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class UserImportReport:
+    read: int = 0
+    inserted: int = 0
+    rejected: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.inserted / self.elapsed_seconds
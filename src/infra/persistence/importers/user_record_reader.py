@@ -0,0 +1,39 @@
+import csv
+import json
+from typing import Iterator, Optional, TextIO, Tuple
+
+
+class UserRecordReader:
+    FORMATS = ('ndjson', 'csv')
+
+    @staticmethod
+    def detect_format(a_path: str) -> str:
+        return 'csv' if a_path.lower().endswith('.csv') else 'ndjson'
+
+    @classmethod
+    def read(cls, a_file: TextIO, a_format: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+        if a_format == 'csv':
+            return cls.__read_csv(a_file)
+        return cls.__read_ndjson(a_file)
+
+    @staticmethod
+    def __read_ndjson(a_file: TextIO) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+        for line_number, line in enumerate(a_file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as error:
+                yield line_number, None, f"Invalid JSON: {error.msg}"
+                continue
+
+            if not isinstance(record, dict):
+                yield line_number, None, "Record must be a JSON object"
+                continue
+            yield line_number, record, None
+
+    @staticmethod
+    def __read_csv(a_file: TextIO) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+        reader = csv.DictReader(a_file)
+        for record in reader:
+            yield reader.line_num, record, None
@@ -1 +1,4 @@
-from src.infra.persistence.repositories.users_repository import UsersRepository
\ No newline at end of file
+from src.infra.persistence.repositories.users_repository import UsersRepository
+from src.infra.persistence.repositories.cached_users_repository import CachedUsersRepository
+from src.infra.persistence.repositories.async_users_repository import AsyncUsersRepository
+from src.infra.persistence.repositories.async_bridge_users_repository import AsyncBridgeUsersRepository
\ No newline at end of file
@@ -0,0 +1,51 @@
+from typing import Any, Callable, Iterator, List
+
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
+from src.domain.pagination.pagination import Pagination
+from src.domain.pagination.search_query import SearchQuery
+from src.domain.user.abs_async_user_gateway import AbsAsyncUsersGateway
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+from src.domain.user.user_insert_result import UserInsertResult
+
+
+class AsyncBridgeUsersRepository(AbsUsersGateway):
+    def __init__(self, an_async_gateway: AbsAsyncUsersGateway, a_sync_gateway: AbsUsersGateway) -> None:
+        self.__async_gateway = an_async_gateway
+        self.__sync_gateway = a_sync_gateway
+
+    def insert_usr(self, an_user: User) -> User:
+        return self.__run(self.__async_gateway.insert_usr, self.__sync_gateway.insert_usr, an_user)
+
+    def insert_users(self, an_users: List[User], all_or_nothing: bool = True) -> List[UserInsertResult]:
+        return self.__sync_gateway.insert_users(an_users, all_or_nothing)
+
+    def get_user(self, an_id: int) -> User | None:
+        return self.__run(self.__async_gateway.get_user, self.__sync_gateway.get_user, an_id)
+
+    def list_all_users(self, a_search: SearchQuery) -> Pagination[ListUserOutput]:
+        return self.__sync_gateway.list_all_users(a_search)
+
+    def stream_users(self) -> Iterator[User]:
+        return self.__sync_gateway.stream_users()
+
+    def update_user(self, an_user: User, an_expected_version: int = None) -> User | None:
+        return self.__run(
+            self.__async_gateway.update_user, self.__sync_gateway.update_user, an_user, an_expected_version
+        )
+
+    def delete_user(self, an_id: int, an_expected_version: int = None) -> bool:
+        return self.__run(
+            self.__async_gateway.delete_user, self.__sync_gateway.delete_user, an_id, an_expected_version
+        )
+
+    def get_users_revision(self) -> int:
+        return self.__run(self.__async_gateway.get_users_revision, self.__sync_gateway.get_users_revision)
+
+    @staticmethod
+    def __run(an_async_call: Callable, a_sync_call: Callable, *args: Any) -> Any:
+        if in_greenlet():
+            return await_only(an_async_call(*args))
+        return a_sync_call(*args)
@@ -0,0 +1,63 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.domain.exceptions import IntegrityException
+from src.domain.user.abs_async_user_gateway import AbsAsyncUsersGateway
+from src.domain.user.user import User
+from src.infra.db.settings.async_engine_registry import AsyncEngineRegistry
+from src.infra.persistence.repositories.users_repository import UsersRepository
+
+
+class AsyncUsersRepository(AbsAsyncUsersGateway):
+    def __init__(self, an_engine: AsyncEngine = None) -> None:
+        self.__engine = an_engine or AsyncEngineRegistry.get_engine()
+
+    async def insert_usr(self, an_user: User) -> User:
+        async with self.__engine.connect() as connection:
+            try:
+                result = await connection.execute(
+                    UsersRepository._insert_statement(), {'name': an_user.name, 'email': an_user.email}
+                )
+                row = result.one()
+                await connection.commit()
+                return User(row.id, an_user.name, an_user.email, row.version)
+            except IntegrityError as e:
+                await connection.rollback()
+                if UsersRepository._is_unique_violation(e):
+                    result = await connection.execute(
+                        UsersRepository._existing_fields_statement(an_user.name, an_user.email)
+                    )
+                    notification = UsersRepository._existing_fields_notification(
+                        result.all(), an_user.name, an_user.email
+                    )
+                    if notification.has_errors():
+                        raise IntegrityException(notification.get_errors())
+                raise e
+
+    async def get_user(self, an_id: int) -> User | None:
+        async with self.__engine.connect() as connection:
+            row = (await connection.execute(UsersRepository._select_user_statement(an_id))).first()
+            return User(row.id, row.name, row.email, row.version) if row else None
+
+    async def update_user(self, an_user: User, an_expected_version: int = None) -> User | None:
+        update_statement, params = UsersRepository._update_statement(an_user, an_expected_version)
+
+        async with self.__engine.begin() as connection:
+            row = (await connection.execute(update_statement, params)).first()
+            if row is None:
+                row = (await connection.execute(UsersRepository._select_user_statement(an_user.id))).first()
+                UsersRepository._check_expected_version(row, an_expected_version)
+            return User(row.id, row.name, row.email, row.version) if row else None
+
+    async def delete_user(self, an_id: int, an_expected_version: int = None) -> bool:
+        async with self.__engine.begin() as connection:
+            result = await connection.execute(UsersRepository._delete_statement(an_id, an_expected_version))
+            deleted = result.rowcount > 0
+            if not deleted and an_expected_version is not None:
+                row = (await connection.execute(UsersRepository._select_user_statement(an_id))).first()
+                UsersRepository._check_expected_version(row, an_expected_version)
+            return deleted
+
+    async def get_users_revision(self) -> int:
+        async with self.__engine.connect() as connection:
+            return (await connection.execute(UsersRepository.USERS_REVISION)).scalar() or 0
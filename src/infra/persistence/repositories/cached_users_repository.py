@@ -0,0 +1,69 @@
+import sys
+from typing import Iterator, List
+
+from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
+from src.domain.pagination.pagination import Pagination
+from src.domain.pagination.search_query import SearchQuery
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+from src.domain.user.user_insert_result import UserInsertResult
+from src.infra.cache.cache_statistics import CacheStatistics
+from src.infra.cache.lru_cache import LRUCache
+
+
+class CachedUsersRepository(AbsUsersGateway):
+    def __init__(self, a_gateway: AbsUsersGateway, a_cache: LRUCache) -> None:
+        self.__gateway = a_gateway
+        self.__cache = a_cache
+
+    @staticmethod
+    def sizeof(an_user: User) -> int:
+        return sys.getsizeof(an_user) + sys.getsizeof(an_user.name) + sys.getsizeof(an_user.email)
+
+    def insert_usr(self, an_user: User) -> User:
+        user = self.__gateway.insert_usr(an_user)
+        self.__cache.delete(int(user.id))
+        return user
+
+    def insert_users(self, an_users: List[User], all_or_nothing: bool = True) -> List[UserInsertResult]:
+        results = self.__gateway.insert_users(an_users, all_or_nothing)
+        for result in results:
+            if result.inserted:
+                self.__cache.delete(int(result.user.id))
+        return results
+
+    def get_user(self, an_id: int) -> User | None:
+        key = int(an_id)
+        user = self.__cache.get(key)
+        if user is not None:
+            return user
+
+        generation = self.__cache.generation(key)
+        user = self.__gateway.get_user(key)
+        if user is not None:
+            self.__cache.set(key, user, a_generation=generation)
+        return user
+
+    def list_all_users(self, a_search: SearchQuery) -> Pagination[ListUserOutput]:
+        return self.__gateway.list_all_users(a_search)
+
+    def stream_users(self) -> Iterator[User]:
+        return self.__gateway.stream_users()
+
+    def update_user(self, an_user: User, an_expected_version: int = None) -> User | None:
+        try:
+            return self.__gateway.update_user(an_user, an_expected_version)
+        finally:
+            self.__cache.delete(int(an_user.id))
+
+    def delete_user(self, an_id: int, an_expected_version: int = None) -> bool:
+        try:
+            return self.__gateway.delete_user(an_id, an_expected_version)
+        finally:
+            self.__cache.delete(int(an_id))
+
+    def get_users_revision(self) -> int:
+        return self.__gateway.get_users_revision()
+
+    def stats(self) -> CacheStatistics:
+        return self.__cache.stats()
@@ -1,29 +1,101 @@
-from sqlalchemy import desc, asc, update, or_
+from itertools import starmap
+from typing import Iterator, List, Optional, Set, Tuple
 
-from src.domain.exceptions import IntegrityException
+from sqlalchemy import desc, asc, update, delete, or_, tuple_, text, insert, select, func, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
+from src.domain.exceptions import IntegrityException, BadRequestException, PreconditionFailedException
 from src.domain.notification.notification import Notification
+from src.domain.pagination.cursor import Cursor
 from src.domain.pagination.pagination import Pagination
 from src.domain.pagination.search_query import SearchQuery
 from src.domain.user.user import User
+from src.domain.user.user_insert_result import UserInsertResult
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.config.settings import settings
 from src.infra.db.settings.connection import DBConnectionHandler
 from src.infra.persistence.entities.users import UserEntity
+from src.infra.persistence.search.user_full_text_search import UserFullTextSearch
 from src.domain.user.abs_user_gateway import AbsUsersGateway
 
 class UsersRepository(AbsUsersGateway):
+    KEYSET_SORTS = ('id', 'name', 'email')
+    EMAIL_TAKEN = "Este email já está cadastrado no sistema"
+    NAME_TAKEN = "Este nome já está cadastrado no sistema"
+    USERS_REVISION = text("SELECT revision FROM table_counters WHERE table_name = 'users'")
+    CONFLICT_IGNORING_INSERTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+    _count_cache = TTLCache(settings.LIST_COUNT_CACHE_MAX_ENTRIES, settings.LIST_COUNT_CACHE_TTL_SECONDS)
 
     @classmethod
     def insert_usr(cls, user: User) -> User:
         with DBConnectionHandler() as db:
-            notification = cls._check_existing_fields(db.session, user.name, user.email)
+            try:
+                row = db.session.execute(cls._insert_statement(), {'name': user.name, 'email': user.email}).one()
+                db.session.commit()
+                return User(row.id, user.name, user.email, row.version)
+            except IntegrityError as e:
+                db.session.rollback()
+                if cls._is_unique_violation(e):
+                    notification = cls._check_existing_fields(db.session, user.name, user.email)
+                    if notification.has_errors():
+                        raise IntegrityException(notification.get_errors())
+                raise e
+            except Exception as e:
+                db.session.rollback()
+                raise e
 
-            if notification.has_errors():
-                raise IntegrityException(notification.get_errors())
+    @classmethod
+    def insert_users(cls, an_users: List[User], all_or_nothing: bool = True) -> List[UserInsertResult]:
+        results: List[Optional[UserInsertResult]] = [None] * len(an_users)
+        has_conflicts = False
 
+        with DBConnectionHandler() as db:
+            insert_statement = cls._insert_ignoring_conflicts_statement(db.get_engine().dialect.name)
             try:
-                user = UserEntity.from_domain(user)
-                db.session.add(user)
+                for start in range(0, len(an_users), settings.BATCH_CHUNK_SIZE):
+                    chunk = an_users[start:start + settings.BATCH_CHUNK_SIZE]
+                    taken_names, taken_emails = cls._find_taken_fields(db.session, chunk)
+
+                    pending = []
+                    for index, user in enumerate(chunk, start):
+                        errors = cls._taken_errors(user, taken_names, taken_emails)
+                        if errors:
+                            results[index] = UserInsertResult(errors=errors)
+                            has_conflicts = True
+                        else:
+                            pending.append((index, user))
+
+                    if not pending or (has_conflicts and all_or_nothing):
+                        continue
+
+                    rows = db.session.execute(
+                        insert_statement,
+                        [{'name': user.name, 'email': user.email} for _, user in pending]
+                    ).all()
+                    inserted = {(row.name, row.email): row.id for row in rows}
+
+                    skipped = []
+                    for index, user in pending:
+                        user_id = inserted.pop((user.name, user.email), None)
+                        if user_id is None:
+                            skipped.append((index, user))
+                        else:
+                            results[index] = UserInsertResult(user=User(user_id, user.name, user.email))
+
+                    if skipped:
+                        has_conflicts = True
+                        taken_names, taken_emails = cls._find_taken_fields(db.session, [user for _, user in skipped])
+                        for index, user in skipped:
+                            results[index] = UserInsertResult(errors=cls._taken_errors(user, taken_names, taken_emails))
+
+                if has_conflicts and all_or_nothing:
+                    db.session.rollback()
+                    return [result if result and result.errors else UserInsertResult() for result in results]
+
                 db.session.commit()
-                return user.to_domain()
+                return results
             except Exception as e:
                 db.session.rollback()
                 raise e
@@ -31,91 +103,302 @@ class UsersRepository(AbsUsersGateway):
     @classmethod
     def get_user(cls, an_id: int) -> User | None:
         with DBConnectionHandler() as db:
-            user = db.session.query(UserEntity).where(UserEntity.id == int(an_id)).first()
-            if user: return user.to_domain()
+            row = db.session.execute(cls._select_user_statement(an_id)).first()
+            if row: return User(row.id, row.name, row.email, row.version)
             return None
 
     @classmethod
-    def list_all_users(cls, a_query: SearchQuery) -> Pagination[UserEntity]:
+    def list_all_users(cls, a_query: SearchQuery) -> Pagination[ListUserOutput]:
+        if a_query.is_keyset:
+            return cls._list_users_by_cursor(a_query)
+
         _page = int(a_query.page)
         _per_page = int(a_query.per_page)
         _terms: str = a_query.terms
         _sort: str = a_query.sort
         _direction: str = a_query.direction
 
+        users_table = UserEntity.__table__
         with DBConnectionHandler() as db:
-            query = db.session.query(UserEntity)
-
-            if _terms:
-                search_term = f"%{_terms}%"
-                query = query.filter(
-                    UserEntity.name.ilike(search_term) |
-                    UserEntity.email.ilike(search_term)
-                )
+            full_text = bool(_terms) and UserFullTextSearch.supports(db.session, _terms)
+            query = cls._filter_by_terms(cls._select_list_statement(), _terms, full_text)
 
-            if _sort and hasattr(UserEntity, _sort):
+            if _sort and _sort in users_table.c:
                 order_func = asc if _direction.lower() == 'asc' else desc
-                query = query.order_by(order_func(getattr(UserEntity, _sort)))
+                query = query.order_by(order_func(users_table.c[_sort]))
+            elif full_text:
+                query = UserFullTextSearch.order_by_rank(query)
 
-            total_records = query.count()
+            total_records, total_exact = cls._count_users(db.session, query, a_query)
             offset = (_page - 1) * _per_page
-            users = query.offset(offset).limit(_per_page).all()
+            users = cls._to_list_outputs(db.session.execute(query.offset(offset).limit(_per_page)))
 
             return Pagination(
                 current_page=_page,
                 per_page=_per_page,
                 total=total_records,
-                items=[user.to_dict() for user in users]
+                items=users,
+                total_exact=total_exact
             )
 
     @classmethod
-    def update_user(cls, an_user: User) -> None:
+    def _list_users_by_cursor(cls, a_query: SearchQuery) -> Pagination[ListUserOutput]:
+        _per_page = int(a_query.per_page)
+        _sort: str = a_query.sort if a_query.sort in cls.KEYSET_SORTS else 'id'
+        _direction: str = (a_query.direction or 'asc').lower()
+
+        cursor = Cursor.decode(a_query.cursor, _sort, _direction)
+        if cursor.sort not in cls.KEYSET_SORTS or cursor.direction not in ('asc', 'desc'):
+            raise BadRequestException("Invalid pagination cursor")
+
+        users_table = UserEntity.__table__
+        keys = [users_table.c.id] if cursor.sort == 'id' else [users_table.c[cursor.sort], users_table.c.id]
+        ascending = (cursor.direction == 'asc') != cursor.backward
+        order_func = asc if ascending else desc
+
         with DBConnectionHandler() as db:
-            try:
-                update_statement = (
-                    update(UserEntity)
-                    .where(UserEntity.id == an_user.id)
-                    .values(
-                        name=an_user.name,
-                        email=an_user.email
-                    )
+            full_text = bool(a_query.terms) and UserFullTextSearch.supports(db.session, a_query.terms)
+            query = cls._filter_by_terms(cls._select_list_statement(), a_query.terms, full_text)
+            total_records, total_exact = cls._count_users(db.session, query, a_query)
+
+            if not cursor.is_first_page:
+                position = [cursor.id] if cursor.sort == 'id' else [cursor.value, cursor.id]
+                query = query.where(
+                    tuple_(*keys) > tuple_(*position) if ascending else tuple_(*keys) < tuple_(*position)
                 )
-                db.session.execute(update_statement)
+
+            users = cls._to_list_outputs(
+                db.session.execute(query.order_by(*[order_func(key) for key in keys]).limit(_per_page + 1))
+            )
+
+        has_more = len(users) > _per_page
+        users = users[:_per_page]
+        if cursor.backward:
+            users.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, not cursor.is_first_page
+
+        return Pagination(
+            current_page=None,
+            per_page=_per_page,
+            total=total_records,
+            items=users,
+            next_cursor=cls._cursor_at(cursor, users[-1], False) if users and has_next else None,
+            previous_cursor=cls._cursor_at(cursor, users[0], True) if users and has_previous else None,
+            total_exact=total_exact
+        )
+
+    @classmethod
+    def stream_users(cls) -> Iterator[User]:
+        with DBConnectionHandler() as db:
+            result = db.session.execute(
+                select(UserEntity.id, UserEntity.name, UserEntity.email)
+                .order_by(UserEntity.id)
+                .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+            )
+            for row in result:
+                yield User(row.id, row.name, row.email)
+
+    @classmethod
+    def update_user(cls, an_user: User, an_expected_version: int = None) -> User | None:
+        update_statement, params = cls._update_statement(an_user, an_expected_version)
+
+        with DBConnectionHandler() as db:
+            try:
+                row = db.session.execute(update_statement, params).first()
+                if row is None:
+                    row = db.session.execute(cls._select_user_statement(an_user.id)).first()
+                    cls._check_expected_version(row, an_expected_version)
                 db.session.commit()
+                return User(row.id, row.name, row.email, row.version) if row else None
             except Exception as e:
                 db.session.rollback()
                 raise e
 
     @classmethod
-    def delete_user(cls, an_id: int) -> bool:
+    def delete_user(cls, an_id: int, an_expected_version: int = None) -> bool:
         with DBConnectionHandler() as db:
             try:
-                user = db.session.query(UserEntity).filter(UserEntity.id == an_id).first()
-                if user:
-                    db.session.delete(user)
-                    db.session.commit()
-                    return True
-                else:
-                    return False
+                deleted = db.session.execute(cls._delete_statement(an_id, an_expected_version)).rowcount > 0
+                if not deleted and an_expected_version is not None:
+                    row = db.session.execute(cls._select_user_statement(an_id)).first()
+                    cls._check_expected_version(row, an_expected_version)
+                db.session.commit()
+                return deleted
             except Exception as e:
                 db.session.rollback()
                 raise e
 
     @classmethod
-    def _check_existing_fields(cls, db_session, a_name: str, an_email: str) -> Notification:
-        notification = Notification()
+    def get_users_revision(cls) -> int:
+        with DBConnectionHandler() as db:
+            return db.session.execute(cls.USERS_REVISION).scalar() or 0
+
+    @staticmethod
+    def _insert_statement():
+        users_table = UserEntity.__table__
+        return insert(users_table).returning(users_table.c.id, users_table.c.version)
+
+    @classmethod
+    def _insert_ignoring_conflicts_statement(cls, a_dialect_name: str):
+        users_table = UserEntity.__table__
+        dialect_insert = cls.CONFLICT_IGNORING_INSERTS.get(a_dialect_name)
+        statement = dialect_insert(users_table).on_conflict_do_nothing() if dialect_insert else insert(users_table)
+        return statement.returning(users_table.c.id, users_table.c.name, users_table.c.email)
+
+    @staticmethod
+    def _select_user_statement(an_id: int):
+        users_table = UserEntity.__table__
+        return (
+            select(users_table.c.id, users_table.c.name, users_table.c.email, users_table.c.version)
+            .where(users_table.c.id == int(an_id))
+        )
+
+    @staticmethod
+    def _update_statement(an_user: User, an_expected_version: int = None):
+        users_table = UserEntity.__table__
+        new_name = func.coalesce(bindparam('new_name'), users_table.c.name)
+        new_email = func.coalesce(bindparam('new_email'), users_table.c.email)
+
+        update_statement = (
+            update(users_table)
+            .where(users_table.c.id == int(an_user.id))
+            .where(or_(
+                users_table.c.name.is_distinct_from(new_name),
+                users_table.c.email.is_distinct_from(new_email)
+            ))
+            .values(name=new_name, email=new_email, version=users_table.c.version + 1)
+            .returning(users_table.c.id, users_table.c.name, users_table.c.email, users_table.c.version)
+        )
+        if an_expected_version is not None:
+            update_statement = update_statement.where(users_table.c.version == int(an_expected_version))
+
+        return update_statement, {'new_name': an_user.name or None, 'new_email': an_user.email or None}
+
+    @staticmethod
+    def _delete_statement(an_id: int, an_expected_version: int = None):
+        users_table = UserEntity.__table__
+        delete_statement = delete(users_table).where(users_table.c.id == int(an_id))
+        if an_expected_version is not None:
+            delete_statement = delete_statement.where(users_table.c.version == int(an_expected_version))
+        return delete_statement
+
+    @staticmethod
+    def _is_unique_violation(an_error: IntegrityError) -> bool:
+        return "UNIQUE constraint failed" in str(an_error.orig)
+
+    @staticmethod
+    def _check_expected_version(a_row, an_expected_version: int | None) -> None:
+        if a_row is not None and an_expected_version is not None and a_row.version != int(an_expected_version):
+            raise PreconditionFailedException(
+                f"User version {an_expected_version} is stale, current version is {a_row.version}"
+            )
+
+    @classmethod
+    def _count_users(cls, db_session, query, a_query: SearchQuery) -> Tuple[Optional[int], Optional[bool]]:
+        if not a_query.include_total:
+            return None, None
+
+        if not a_query.terms:
+            total = db_session.execute(
+                text("SELECT row_count FROM table_counters WHERE table_name = 'users'")
+            ).scalar()
+            if total is not None:
+                return total, True
+            return cls._count_rows(db_session, query), True
+
+        cache_key = a_query.terms.lower()
+        total = cls._count_cache.get(cache_key)
+        if total is not None:
+            return total, False
 
-        existing_records = db_session.query(UserEntity).filter(
-            or_(
-                UserEntity.email == an_email,
-                UserEntity.name == a_name
+        total = cls._count_rows(db_session, query)
+        cls._count_cache.set(cache_key, total)
+        return total, True
+
+    @staticmethod
+    def _count_rows(db_session, query) -> int:
+        return db_session.execute(select(func.count()).select_from(query.order_by(None).subquery())).scalar()
+
+    @staticmethod
+    def _select_list_statement():
+        users_table = UserEntity.__table__
+        return select(users_table.c.id, users_table.c.name, users_table.c.email)
+
+    @staticmethod
+    def _to_list_outputs(a_result) -> List[ListUserOutput]:
+        return list(starmap(ListUserOutput, a_result))
+
+    @staticmethod
+    def _filter_by_terms(query, a_terms: str, a_full_text: bool):
+        if not a_terms:
+            return query
+
+        if a_full_text:
+            return UserFullTextSearch.filter(query, a_terms)
+
+        search_term = f"%{a_terms}%"
+        users_table = UserEntity.__table__
+        return query.where(
+            users_table.c.name.ilike(search_term) |
+            users_table.c.email.ilike(search_term)
+        )
+
+    @staticmethod
+    def _cursor_at(a_cursor: Cursor, an_user: ListUserOutput, backward: bool) -> str:
+        return Cursor(
+            sort=a_cursor.sort,
+            direction=a_cursor.direction,
+            value=getattr(an_user, a_cursor.sort),
+            id=an_user.id,
+            backward=backward
+        ).encode()
+
+    @staticmethod
+    def _find_taken_fields(db_session, an_users: List[User]) -> Tuple[Set[str], Set[str]]:
+        names = {user.name for user in an_users}
+        emails = {user.email for user in an_users}
+
+        existing_records = db_session.execute(
+            select(UserEntity.name, UserEntity.email).where(
+                or_(UserEntity.name.in_(names), UserEntity.email.in_(emails))
             )
         ).all()
 
+        taken_names = {record.name for record in existing_records if record.name in names}
+        taken_emails = {record.email for record in existing_records if record.email in emails}
+        return taken_names, taken_emails
+
+    @classmethod
+    def _taken_errors(cls, an_user: User, a_taken_names: Set[str], a_taken_emails: Set[str]) -> List[str]:
+        errors = []
+        if an_user.email in a_taken_emails:
+            errors.append(cls.EMAIL_TAKEN)
+        if an_user.name in a_taken_names:
+            errors.append(cls.NAME_TAKEN)
+        return errors
+
+    @classmethod
+    def _check_existing_fields(cls, db_session, a_name: str, an_email: str) -> Notification:
+        existing_records = db_session.execute(cls._existing_fields_statement(a_name, an_email)).all()
+        return cls._existing_fields_notification(existing_records, a_name, an_email)
+
+    @staticmethod
+    def _existing_fields_statement(a_name: str, an_email: str):
+        users_table = UserEntity.__table__
+        return select(users_table.c.name, users_table.c.email).where(
+            or_(users_table.c.email == an_email, users_table.c.name == a_name)
+        )
+
+    @classmethod
+    def _existing_fields_notification(cls, existing_records, a_name: str, an_email: str) -> Notification:
+        notification = Notification()
+
         for record in existing_records:
             if record.email == an_email:
-                notification.add_error("Este email já está cadastrado no sistema")
+                notification.add_error(cls.EMAIL_TAKEN)
             if record.name == a_name:
-                notification.add_error("Este nome já está cadastrado no sistema")
+                notification.add_error(cls.NAME_TAKEN)
 
         return notification
\ No newline at end of file
@@ -0,0 +1 @@
+from src.infra.persistence.search.user_full_text_search import UserFullTextSearch
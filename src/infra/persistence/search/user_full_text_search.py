@@ -0,0 +1,48 @@
+from typing import Dict
+
+from sqlalchemy import column, literal_column, table, text
+
+from src.infra.persistence.entities.users import UserEntity
+
+
+class UserFullTextSearch:
+    MIN_TERM_LENGTH = 3
+
+    __index = table('users_fts', column('rowid'), column('rank'))
+    __availability: Dict[str, bool] = {}
+
+    @classmethod
+    def is_available(cls, db_session) -> bool:
+        url = str(db_session.get_bind().url)
+        available = cls.__availability.get(url)
+        if available is None:
+            available = db_session.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'")
+            ).scalar() is not None
+            cls.__availability[url] = available
+        return available
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.__availability.clear()
+
+    @classmethod
+    def supports(cls, db_session, a_terms: str) -> bool:
+        return (
+            len(a_terms) >= cls.MIN_TERM_LENGTH
+            and db_session.get_bind().dialect.name == 'sqlite'
+            and cls.is_available(db_session)
+        )
+
+    @classmethod
+    def filter(cls, query, a_terms: str):
+        phrase = '"' + a_terms.replace('"', '""') + '"'
+        return (
+            query
+            .join(cls.__index, cls.__index.c.rowid == UserEntity.id)
+            .filter(literal_column('users_fts').op('MATCH')(phrase))
+        )
+
+    @classmethod
+    def order_by_rank(cls, query):
+        return query.order_by(cls.__index.c.rank)
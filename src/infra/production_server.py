@@ -0,0 +1,47 @@
+from gunicorn.app.base import BaseApplication
+from gunicorn.util import import_app
+
+from src.infra.config.settings import settings
+from src.infra.db.settings.async_engine_registry import AsyncEngineRegistry
+from src.infra.db.settings.engine_registry import EngineRegistry
+
+
+class ProductionServer(BaseApplication):
+    APPLICATIONS = {
+        'flask': ('src.infra.server:app', 'gthread'),
+        'asgi': ('src.infra.asgi_server:app', 'uvicorn.workers.UvicornWorker'),
+    }
+
+    def __init__(self, an_app_server: str = None) -> None:
+        app_server = an_app_server or settings.APP_SERVER
+        if app_server not in self.APPLICATIONS:
+            raise ValueError(f"Unknown APP_SERVER '{app_server}', expected one of {sorted(self.APPLICATIONS)}")
+        self.__application, self.__worker_class = self.APPLICATIONS[app_server]
+        super().__init__()
+
+    def options(self) -> dict:
+        return {
+            'bind': f'{settings.APP_HOST}:{settings.APP_PORT}',
+            'worker_class': self.__worker_class,
+            'workers': settings.SERVER_WORKERS,
+            'threads': settings.SERVER_THREADS,
+            'keepalive': settings.SERVER_KEEPALIVE,
+            'timeout': settings.SERVER_TIMEOUT,
+            'graceful_timeout': settings.SERVER_GRACEFUL_TIMEOUT,
+            'max_requests': settings.SERVER_MAX_REQUESTS,
+            'max_requests_jitter': settings.SERVER_MAX_REQUESTS_JITTER,
+            'preload_app': False,
+            'post_fork': self.post_fork,
+        }
+
+    def load_config(self) -> None:
+        for key, value in self.options().items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return import_app(self.__application)
+
+    @staticmethod
+    def post_fork(_server, _worker) -> None:
+        EngineRegistry.dispose_all(close=False)
+        AsyncEngineRegistry.reset()
@@ -1,5 +1,14 @@
 from flask import Flask
+from src.infra.api.routes.metrics.metrics_routes import MetricsRoutes
 from src.infra.api.routes.user.user_routes import UserRoutes
+from src.infra.config.settings import settings
+from src.infra.traffic import TrafficCapture
 app = Flask(__name__)
 
-app.register_blueprint(UserRoutes().get_blueprint())
\ No newline at end of file
+app.register_blueprint(UserRoutes().get_blueprint())
+
+if settings.METRICS_ENABLED:
+    app.register_blueprint(MetricsRoutes().get_blueprint())
+
+if settings.TRAFFIC_CAPTURE_ENABLED:
+    TrafficCapture(settings.TRAFFIC_CAPTURE_PATH).init_app(app)
\ No newline at end of file
@@ -0,0 +1,3 @@
+from src.infra.traffic.replay_report import ReplayReport
+from src.infra.traffic.traffic_capture import TrafficCapture
+from src.infra.traffic.traffic_replayer import TrafficReplayer
@@ -0,0 +1,52 @@
+import statistics
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class ReplayReport:
+    sent: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    mismatches: Counter = field(default_factory=Counter)
+
+    @property
+    def requests_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.sent / self.elapsed_seconds
+
+    @property
+    def mismatched(self) -> int:
+        return sum(self.mismatches.values())
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        if not self.latencies_ms:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+        cut_points = statistics.quantiles(self.latencies_ms, n=100, method='inclusive') \
+            if len(self.latencies_ms) > 1 else self.latencies_ms * 99
+        return {
+            'p50': round(cut_points[49], 3),
+            'p95': round(cut_points[94], 3),
+            'p99': round(cut_points[98], 3),
+            'max': round(max(self.latencies_ms), 3),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            'sent': self.sent,
+            'failed': self.failed,
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'requests_per_second': round(self.requests_per_second, 2),
+            'latency_ms': self.latency_percentiles(),
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'mismatched': self.mismatched,
+            'mismatches': [
+                {'request': key[0], 'expected': key[1], 'actual': key[2], 'count': count}
+                for key, count in self.mismatches.most_common()
+            ],
+        }
@@ -0,0 +1,69 @@
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from flask import Flask, Response, g, request
+
+from src.infra.config.settings import settings
+
+
+class TrafficCapture:
+    HEADERS = ('Content-Type', 'Accept', 'Accept-Encoding', 'If-Match', 'If-None-Match')
+
+    def __init__(self, a_path: str) -> None:
+        self.__path = a_path
+        self.__lock = threading.Lock()
+        self.__file = None
+
+    def init_app(self, an_app: Flask) -> 'TrafficCapture':
+        an_app.before_request(self.__before_request)
+        an_app.after_request(self.__after_request)
+        return self
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    def __before_request(self) -> None:
+        g.traffic_capture_started = time.perf_counter()
+        g.traffic_capture_timestamp = time.time()
+        g.traffic_capture_body = self.__read_body()
+
+    def __after_request(self, response: Response) -> Response:
+        started = g.pop('traffic_capture_started', None)
+        if started is None:
+            return response
+
+        record = {
+            'timestamp': round(g.pop('traffic_capture_timestamp'), 6),
+            'method': request.method,
+            'path': request.path,
+            'query': request.query_string.decode('latin-1'),
+            'headers': {name: request.headers[name] for name in self.HEADERS if name in request.headers},
+            'body': g.pop('traffic_capture_body', None),
+            'status': response.status_code,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 3),
+        }
+        self.__write(json.dumps(record, ensure_ascii=False) + '\n')
+        return response
+
+    @staticmethod
+    def __read_body() -> Optional[str]:
+        length = request.content_length
+        if not length or length > settings.REQUEST_MAX_BODY_BYTES:
+            return None
+        return request.get_data(cache=True).decode('utf-8', errors='replace')
+
+    def __write(self, a_line: str) -> None:
+        with self.__lock:
+            if self.__file is None:
+                directory = os.path.dirname(self.__path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self.__file = open(self.__path, 'a', encoding='utf-8')
+            self.__file.write(a_line)
+            self.__file.flush()
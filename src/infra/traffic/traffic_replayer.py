@@ -0,0 +1,107 @@
+import http.client
+import json
+import queue
+import threading
+import time
+from typing import Iterable, Iterator, Optional, TextIO
+from urllib.parse import urlsplit
+
+from src.infra.traffic.replay_report import ReplayReport
+
+
+class TrafficReplayer:
+    def __init__(self, a_target: str, speed: Optional[float] = 1.0, concurrency: int = 1,
+                 timeout: float = 30.0) -> None:
+        target = urlsplit(a_target)
+        if target.scheme not in ('http', 'https') or not target.hostname:
+            raise ValueError(f"Replay target must be an http(s) URL, got '{a_target}'")
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed must be positive")
+
+        self.__target = target
+        self.__speed = speed
+        self.__concurrency = max(1, concurrency)
+        self.__timeout = timeout
+
+    @staticmethod
+    def read(a_file: TextIO) -> Iterator[dict]:
+        for line in a_file:
+            if line.strip():
+                yield json.loads(line)
+
+    def run(self, records: Iterable[dict]) -> ReplayReport:
+        report = ReplayReport()
+        lock = threading.Lock()
+        pending: queue.Queue = queue.Queue(maxsize=self.__concurrency * 4)
+        workers = [
+            threading.Thread(target=self.__work, args=(pending, report, lock), daemon=True)
+            for _ in range(self.__concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+
+        started = time.perf_counter()
+        first_timestamp = None
+        for record in records:
+            if self.__speed is not None:
+                first_timestamp = record['timestamp'] if first_timestamp is None else first_timestamp
+                delay = (record['timestamp'] - first_timestamp) / self.__speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            pending.put(record)
+
+        for _ in workers:
+            pending.put(None)
+        for worker in workers:
+            worker.join()
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def __work(self, pending: queue.Queue, report: ReplayReport, lock: threading.Lock) -> None:
+        connection = self.__connect()
+        try:
+            while True:
+                record = pending.get()
+                if record is None:
+                    return
+
+                started = time.perf_counter()
+                try:
+                    status = self.__send(connection, record)
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    connection = self.__connect()
+                    with lock:
+                        report.failed += 1
+                    continue
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                with lock:
+                    report.sent += 1
+                    report.latencies_ms.append(elapsed_ms)
+                    report.statuses[status] += 1
+                    if record.get('status') is not None and status != record['status']:
+                        report.mismatches[(f"{record['method']} {record['path']}", record['status'], status)] += 1
+        finally:
+            connection.close()
+
+    def __connect(self) -> http.client.HTTPConnection:
+        connection_class = http.client.HTTPSConnection if self.__target.scheme == 'https' else http.client.HTTPConnection
+        return connection_class(self.__target.hostname, self.__target.port, timeout=self.__timeout)
+
+    def __send(self, connection: http.client.HTTPConnection, record: dict) -> int:
+        path = self.__target.path.rstrip('/') + record['path']
+        if record.get('query'):
+            path += f"?{record['query']}"
+        body = record.get('body')
+
+        connection.request(
+            record['method'],
+            path,
+            body=body.encode('utf-8') if body is not None else None,
+            headers=record.get('headers') or {}
+        )
+        response = connection.getresponse()
+        response.read()
+        return response.status
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import Mock
+
+from src.application.usecase.user.batch_create.batch_create_users_input import BatchCreateUsersInput
+from src.application.usecase.user.batch_create.batch_create_users_usecase import BatchCreateUsersUseCase
+from src.application.usecase.user.create.create_user_input import CreateUserInput
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+from src.domain.user.user_insert_result import UserInsertResult
+
+
+class TestBatchCreateUsersUseCase(unittest.TestCase):
+    def setUp(self):
+        self.gateway = Mock(spec=AbsUsersGateway)
+        self.use_case = BatchCreateUsersUseCase(self.gateway)
+
+    def tearDown(self):
+        self.gateway.reset_mock()
+
+    def test_given_valid_users_when_execute_should_insert_all_in_one_call(self):
+        # Given
+        items = [CreateUserInput("John Doe", "john@example.com"), CreateUserInput("Jane Doe", "jane@example.com")]
+        self.gateway.insert_users.return_value = [
+            UserInsertResult(user=User(1, "John Doe", "john@example.com")),
+            UserInsertResult(user=User(2, "Jane Doe", "jane@example.com")),
+        ]
+
+        # When
+        result = self.use_case.execute(BatchCreateUsersInput(items))
+
+        # Then
+        self.assertEqual(result.created, 2)
+        self.assertEqual(result.rejected, 0)
+        self.assertEqual([item.id for item in result.items], [1, 2])
+        self.gateway.insert_users.assert_called_once()
+
+    def test_given_invalid_user_in_atomic_mode_when_execute_should_insert_nothing(self):
+        # Given
+        items = [CreateUserInput("John Doe", "john@example.com"), CreateUserInput("", "invalid")]
+
+        # When
+        result = self.use_case.execute(BatchCreateUsersInput(items, all_or_nothing=True))
+
+        # Then
+        self.assertEqual(result.created, 0)
+        self.assertEqual([item.status for item in result.items], ['skipped', 'rejected'])
+        self.assertEqual(result.items[1].errors, ["Name cannot be empty", "Invalid email format"])
+        self.gateway.insert_users.assert_not_called()
+
+    def test_given_invalid_and_conflicting_users_in_partial_mode_when_execute_should_insert_the_rest(self):
+        # Given
+        items = [
+            CreateUserInput("John Doe", "john@example.com"),
+            CreateUserInput("", "invalid"),
+            CreateUserInput("Jane Doe", "jane@example.com"),
+        ]
+        self.gateway.insert_users.return_value = [
+            UserInsertResult(user=User(1, "John Doe", "john@example.com")),
+            UserInsertResult(errors=["Este email já está cadastrado no sistema"]),
+        ]
+
+        # When
+        result = self.use_case.execute(BatchCreateUsersInput(items, all_or_nothing=False))
+
+        # Then
+        self.assertEqual(result.created, 1)
+        self.assertEqual(result.rejected, 2)
+        self.assertEqual([item.status for item in result.items], ['created', 'rejected', 'rejected'])
+        inserted_users, all_or_nothing = self.gateway.insert_users.call_args.args
+        self.assertEqual([user.name for user in inserted_users], ["John Doe", "Jane Doe"])
+        self.assertFalse(all_or_nothing)
+
+    def test_given_duplicated_email_in_batch_when_execute_should_reject_later_item(self):
+        # Given
+        items = [CreateUserInput("John Doe", "john@example.com"), CreateUserInput("Johnny Doe", "john@example.com")]
+        self.gateway.insert_users.return_value = [UserInsertResult(user=User(1, "John Doe", "john@example.com"))]
+
+        # When
+        result = self.use_case.execute(BatchCreateUsersInput(items, all_or_nothing=False))
+
+        # Then
+        self.assertEqual(result.items[1].status, 'rejected')
+        self.assertEqual(result.items[1].errors, ["Email is duplicated in this batch"])
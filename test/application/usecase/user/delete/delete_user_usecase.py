@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import Mock, patch
+from src.application.usecase.user.delete.delete_user_input import DeleteUserInput
 from src.application.usecase.user.delete.delete_user_usecase import DeleteUserUseCase
 from src.domain.user.abs_user_gateway import AbsUsersGateway
 
@@ -18,11 +19,11 @@ class TestDeleteUserUseCase(unittest.TestCase):
         self.gateway.delete_user.return_value = None
 
         # when
-        result = self.use_case.execute(user_id)
+        result = self.use_case.execute(DeleteUserInput(user_id))
 
         # then
         self.assertIsNone(result)
-        self.gateway.delete_user.assert_called_once_with(user_id)
+        self.gateway.delete_user.assert_called_once_with(user_id, None)
 
     def test_given_nonexistent_user_id_when_delete_user_should_raise_error(self):
         # given
@@ -32,11 +33,11 @@ class TestDeleteUserUseCase(unittest.TestCase):
 
         # when/then
         with self.assertRaises(RuntimeError) as context:
-            self.use_case.execute(invalid_id)
+            self.use_case.execute(DeleteUserInput(invalid_id))
 
         # then
         self.assertEqual(str(context.exception), expected_error_message)
-        self.gateway.delete_user.assert_called_once_with(invalid_id)
+        self.gateway.delete_user.assert_called_once_with(invalid_id, None)
 
     def test_given_valid_user_id_when_delete_user_should_call_gateway_once(self):
         # given
@@ -44,8 +45,8 @@ class TestDeleteUserUseCase(unittest.TestCase):
         self.gateway.delete_user.return_value = None
 
         # when
-        result = self.use_case.execute(user_id)
+        result = self.use_case.execute(DeleteUserInput(user_id))
 
         # then
         self.assertIsNone(result)
-        self.gateway.delete_user.assert_called_once_with(user_id)
+        self.gateway.delete_user.assert_called_once_with(user_id, None)
@@ -0,0 +1,24 @@
+import unittest
+from unittest.mock import Mock
+
+from src.application.usecase.user.export.export_users_usecase import ExportUsersUseCase
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+
+
+class TestExportUsersUseCase(unittest.TestCase):
+    def setUp(self):
+        self.gateway = Mock(spec=AbsUsersGateway)
+        self.use_case = ExportUsersUseCase(self.gateway)
+
+    def test_given_users_when_execute_should_return_gateway_stream(self):
+        # Given
+        users = iter([User(1, "John Doe", "john@example.com")])
+        self.gateway.stream_users.return_value = users
+
+        # When
+        result = self.use_case.execute()
+
+        # Then
+        self.assertIs(result, users)
+        self.gateway.stream_users.assert_called_once_with()
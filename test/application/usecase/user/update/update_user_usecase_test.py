@@ -21,10 +21,8 @@ class TestUpdateUserUseCase(unittest.TestCase):
         expected_id = 1
         expected_name = "New Name"
         expected_email = "new@email.com"
-        existing_user = User(an_id=expected_id, a_name="Old Name", an_email="old@email.com")
-        self.gateway.get_user.return_value = existing_user
+        self.gateway.update_user.return_value = User(expected_id, expected_name, expected_email)
         update_input = UpdateUserInput(id=expected_id, name=expected_name, email=expected_email)
-        self.gateway.update_user.return_value = update_input
 
         # When
         result = self.use_case.execute(update_input)
@@ -34,8 +32,21 @@ class TestUpdateUserUseCase(unittest.TestCase):
         self.assertEqual(result.id, expected_id)
         self.assertEqual(result.name, expected_name)
         self.assertEqual(result.email, expected_email)
-        self.gateway.get_user.assert_called_once_with(expected_id)
-        self.gateway.update_user.assert_called_once()
+        self.gateway.get_user.assert_not_called()
+        self.gateway.update_user.assert_called_once_with(User(expected_id, expected_name, expected_email), None)
+
+    def test_given_empty_email_when_execute_should_keep_current_email(self):
+        # Given
+        expected_id = 1
+        self.gateway.update_user.return_value = User(expected_id, "New Name", "old@email.com")
+        update_input = UpdateUserInput(id=expected_id, name="New Name", email="")
+
+        # When
+        result = self.use_case.execute(update_input)
+
+        # Then
+        self.assertEqual(result.email, "old@email.com")
+        self.gateway.update_user.assert_called_once_with(User(expected_id, "New Name", ""), None)
 
     def test_given_invalid_name_when_execute_should_raise_validation_error(self):
         # Given
@@ -43,8 +54,6 @@ class TestUpdateUserUseCase(unittest.TestCase):
         invalid_name = "invalid_name" * 20
         valid_email = "jhon.doe@email.com"
         expected_error_message = "Name must have less than 50 characters"
-        existing_user = User(an_id=1, a_name="Old Name", an_email="old@email.com")
-        self.gateway.get_user.return_value = existing_user
         update_input = UpdateUserInput(id=expected_id, name=invalid_name, email=valid_email)
 
         # When/Then
@@ -58,8 +67,6 @@ class TestUpdateUserUseCase(unittest.TestCase):
         valid_name = "New Name"
         invalid_email = "invalid-email"
         expected_error_message = "Invalid email format"
-        existing_user = User(an_id=expected_id, a_name="Old Name", an_email="old@email.com")
-        self.gateway.get_user.return_value = existing_user
         update_input = UpdateUserInput(id=expected_id, name=valid_name, email=invalid_email)
 
         # When/Then
@@ -70,7 +77,7 @@ class TestUpdateUserUseCase(unittest.TestCase):
     def test_given_nonexistent_user_when_execute_should_return_none(self):
         # Given
         expected_id = 1
-        self.gateway.get_user.return_value = None
+        self.gateway.update_user.return_value = None
         update_input = UpdateUserInput(id=expected_id, name="Any Name", email="any@email.com")
 
         # When
@@ -78,8 +85,7 @@ class TestUpdateUserUseCase(unittest.TestCase):
 
         # Then
         self.assertIsNone(result)
-        self.gateway.get_user.assert_called_once_with(expected_id)
-        self.gateway.update_user.assert_not_called()
+        self.gateway.update_user.assert_called_once()
 
     def test_given_valid_input_when_execute_should_raise_server_error(self):
         # Given
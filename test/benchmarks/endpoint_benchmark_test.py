@@ -0,0 +1,74 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.endpoint_benchmark import compare
+
+
+def _report(a_p95_ms: float) -> dict:
+    return {
+        'meta': {},
+        'results': [{
+            'dataset': 100,
+            'scenario': 'list_users',
+            'throughput_rps': 100.0,
+            'latency_ms': {'p50': a_p95_ms, 'p95': a_p95_ms, 'p99': a_p95_ms},
+        }],
+    }
+
+
+class TestCompare(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_given_regression_above_threshold_when_gating_should_exit_with_failure(self):
+        # Given
+        args = self.__args(_report(10.0), _report(12.0), a_fail_on_regression=10.0)
+
+        # When
+        exit_code = self.__compare(args)
+
+        # Then
+        self.assertEqual(1, exit_code)
+
+    def test_given_regression_equal_to_threshold_when_gating_should_exit_successfully(self):
+        # Given
+        args = self.__args(_report(10.0), _report(11.0), a_fail_on_regression=10.0)
+
+        # When
+        exit_code = self.__compare(args)
+
+        # Then
+        self.assertEqual(0, exit_code)
+
+    def test_given_regression_without_gate_when_comparing_should_exit_successfully(self):
+        # Given
+        args = self.__args(_report(10.0), _report(20.0), a_fail_on_regression=None)
+
+        # When
+        exit_code = self.__compare(args)
+
+        # Then
+        self.assertEqual(0, exit_code)
+
+    def __args(self, a_baseline: dict, a_candidate: dict, a_fail_on_regression) -> argparse.Namespace:
+        paths = []
+        for name, report in (('baseline.json', a_baseline), ('candidate.json', a_candidate)):
+            path = os.path.join(self.directory.name, name)
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(report, file)
+            paths.append(path)
+        return argparse.Namespace(baseline=paths[0], candidate=paths[1], json=False,
+                                  fail_on_regression=a_fail_on_regression)
+
+    @staticmethod
+    def __compare(an_args: argparse.Namespace) -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return compare(an_args)
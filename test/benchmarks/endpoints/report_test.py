@@ -0,0 +1,137 @@
+import unittest
+
+from benchmarks.endpoints.report import compare_reports, latency_summary, regressions
+
+
+def _report(a_throughput_rps: float, a_p95_ms: float) -> dict:
+    return {
+        'results': [{
+            'dataset': 100,
+            'scenario': 'list_users',
+            'throughput_rps': a_throughput_rps,
+            'latency_ms': {'p50': a_p95_ms, 'p95': a_p95_ms, 'p99': a_p95_ms},
+        }],
+    }
+
+
+class TestLatencySummary(unittest.TestCase):
+    def test_given_no_samples_when_summarizing_should_return_zeros(self):
+        # When
+        summary = latency_summary([])
+
+        # Then
+        self.assertEqual({'mean': 0.0, 'max': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0}, summary)
+
+    def test_given_single_sample_when_summarizing_should_report_it_for_every_percentile(self):
+        # When
+        summary = latency_summary([4.2])
+
+        # Then
+        self.assertEqual({'mean': 4.2, 'max': 4.2, 'p50': 4.2, 'p95': 4.2, 'p99': 4.2}, summary)
+
+    def test_given_evenly_spread_samples_when_summarizing_should_interpolate_percentiles(self):
+        # Given
+        latencies_ms = [float(value) for value in range(1, 102)]
+
+        # When
+        summary = latency_summary(latencies_ms)
+
+        # Then
+        self.assertEqual(51.0, summary['mean'])
+        self.assertEqual(101.0, summary['max'])
+        self.assertEqual(51.0, summary['p50'])
+        self.assertEqual(96.0, summary['p95'])
+        self.assertEqual(100.0, summary['p99'])
+
+
+class TestCompareReports(unittest.TestCase):
+    def test_given_zero_baseline_when_comparing_should_leave_change_undefined(self):
+        # When
+        rows = compare_reports(_report(0.0, 0.0), _report(50.0, 3.0))
+
+        # Then
+        self.assertEqual({'baseline': 0.0, 'candidate': 50.0, 'change_percent': None}, rows[0]['throughput_rps'])
+        self.assertEqual({'baseline': 0.0, 'candidate': 3.0, 'change_percent': None}, rows[0]['p95_ms'])
+
+    def test_given_scenario_missing_from_baseline_when_comparing_should_skip_it(self):
+        # Given
+        candidate = _report(100.0, 5.0)
+        candidate['results'][0]['scenario'] = 'export_users'
+
+        # When
+        rows = compare_reports(_report(100.0, 5.0), candidate)
+
+        # Then
+        self.assertEqual([], rows)
+
+
+class TestRegressions(unittest.TestCase):
+    def test_given_p95_change_equal_to_threshold_when_checking_should_not_flag_it(self):
+        # Given
+        rows = compare_reports(_report(100.0, 10.0), _report(100.0, 11.0))
+
+        # When
+        flagged = regressions(rows, 10.0)
+
+        # Then
+        self.assertEqual([], flagged)
+
+    def test_given_p95_change_above_threshold_when_checking_should_flag_it(self):
+        # Given
+        rows = compare_reports(_report(100.0, 10.0), _report(100.0, 11.01))
+
+        # When
+        flagged = regressions(rows, 10.0)
+
+        # Then
+        self.assertEqual(rows, flagged)
+
+    def test_given_throughput_drop_equal_to_threshold_when_checking_should_not_flag_it(self):
+        # Given
+        rows = compare_reports(_report(100.0, 10.0), _report(90.0, 10.0))
+
+        # When
+        flagged = regressions(rows, 10.0)
+
+        # Then
+        self.assertEqual([], flagged)
+
+    def test_given_throughput_drop_above_threshold_when_checking_should_flag_it(self):
+        # Given
+        rows = compare_reports(_report(100.0, 10.0), _report(89.99, 10.0))
+
+        # When
+        flagged = regressions(rows, 10.0)
+
+        # Then
+        self.assertEqual(rows, flagged)
+
+    def test_given_zero_p95_baseline_when_candidate_is_slower_should_flag_it(self):
+        # Given
+        rows = compare_reports(_report(100.0, 0.0), _report(100.0, 2.0))
+
+        # When
+        flagged = regressions(rows, 10.0)
+
+        # Then
+        self.assertEqual(rows, flagged)
+
+    def test_given_zero_baselines_when_candidate_is_unchanged_should_not_flag_it(self):
+        # Given
+        rows = compare_reports(_report(0.0, 0.0), _report(0.0, 0.0))
+
+        # When
+        flagged = regressions(rows, 10.0)
+
+        # Then
+        self.assertEqual([], flagged)
+
+    def test_given_zero_throughput_baseline_when_candidate_serves_requests_should_not_flag_it(self):
+        # Given
+        rows = compare_reports(_report(0.0, 10.0), _report(50.0, 10.0))
+
+        # When
+        flagged = regressions(rows, 10.0)
+
+        # Then
+        self.assertEqual([], flagged)
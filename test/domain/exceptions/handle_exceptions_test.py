@@ -0,0 +1,55 @@
+import sqlite3
+import unittest
+
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.exceptions import NotFoundException
+from src.domain.exceptions.handle_exceptions import HandleException
+
+
+class TestHandleException(unittest.TestCase):
+    def test_given_sqlalchemy_unique_error_when_handle_should_return_field_message(self):
+        # Given
+        exception = IntegrityError(
+            "INSERT INTO users", {}, sqlite3.IntegrityError("UNIQUE constraint failed: users.email")
+        )
+
+        # When
+        response = HandleException.handle(exception)
+
+        # Then
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.body["details"], "Este email já está cadastrado no sistema")
+
+    def test_given_sqlite_unique_error_on_name_when_handle_should_return_name_message(self):
+        # Given
+        exception = sqlite3.IntegrityError("UNIQUE constraint failed: users.name")
+
+        # When
+        response = HandleException.handle(exception)
+
+        # Then
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.body["details"], "Este nome já está cadastrado no sistema")
+
+    def test_given_sqlalchemy_not_null_error_when_handle_should_return_server_error(self):
+        # Given
+        exception = IntegrityError(
+            "INSERT INTO users", {}, sqlite3.IntegrityError("NOT NULL constraint failed: users.name")
+        )
+
+        # When
+        response = HandleException.handle(exception)
+
+        # Then
+        self.assertEqual(response.status_code, 500)
+
+    def test_given_domain_exception_when_handle_should_return_its_status(self):
+        # Given
+        exception = NotFoundException("User not found")
+
+        # When
+        response = HandleException.handle(exception)
+
+        # Then
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from src.domain.exceptions import BadRequestException
+from src.domain.pagination.cursor import Cursor
+
+
+class TestCursor(TestCase):
+    def test_given_cursor_when_encode_and_decode_should_return_same_position(self):
+        # Given
+        cursor = Cursor(sort='name', direction='desc', value='John Doe', id=42, backward=True)
+
+        # When
+        decoded = Cursor.decode(cursor.encode())
+
+        # Then
+        self.assertEqual(decoded, cursor)
+        self.assertFalse(decoded.is_first_page)
+
+    def test_given_empty_token_when_decode_should_return_first_page_cursor(self):
+        # When
+        cursor = Cursor.decode('', 'email', 'asc')
+
+        # Then
+        self.assertTrue(cursor.is_first_page)
+        self.assertEqual(cursor.sort, 'email')
+        self.assertEqual(cursor.direction, 'asc')
+
+    def test_given_malformed_token_when_decode_should_raise_bad_request(self):
+        # When/Then
+        with self.assertRaises(BadRequestException):
+            Cursor.decode('not-a-cursor')
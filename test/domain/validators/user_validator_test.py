@@ -0,0 +1,76 @@
+import re
+import unittest
+
+from src.domain.notification import Notification
+from src.domain.user.user import User
+from src.domain.validators.user_validator import UserValidator
+
+
+class TestUserValidator(unittest.TestCase):
+    EMAILS = [
+        'john@example.com',
+        'john.doe+tag@mail.example.co',
+        'John@example.com',
+        '"john doe"@example.com',
+        'john@[192.168.0.1]',
+        'john@example.com trailing',
+        'john.example.com',
+        '.john@example.com',
+        'john@@example.com',
+        'joão@example.com',
+        'john@exämple.com',
+        '@example.com',
+    ]
+
+    def test_given_emails_when_validating_should_match_uncompiled_pattern(self):
+        for email in self.EMAILS:
+            with self.subTest(email=email):
+                # When
+                valid = UserValidator.is_valid_email(email)
+
+                # Then
+                self.assertEqual(valid, re.match(UserValidator.EMAIL_PATTERN, email) is not None)
+
+    def test_given_mixed_users_when_validate_many_should_return_errors_by_index(self):
+        # Given
+        users = [
+            User(a_name="John Doe", an_email="john@example.com"),
+            User(a_name="Jo", an_email="john.example.com"),
+            User(a_name="Jane Doe", an_email="jane@example.com"),
+            User(a_name=None, an_email=None),
+        ]
+
+        # When
+        errors = UserValidator.validate_many(users)
+
+        # Then
+        self.assertEqual(errors, {
+            1: ["Name must have at least 3 characters", "Invalid email format"],
+            3: ["Name cannot be empty", "Email cannot be empty"],
+        })
+
+    def test_given_partial_validation_when_fields_are_empty_should_not_report_them(self):
+        # When
+        errors = UserValidator.validate_many([User(a_name=None, an_email="bad")], partial=True)
+
+        # Then
+        self.assertEqual(errors, {0: ["Invalid email format"]})
+
+    def test_given_valid_user_when_errors_for_should_return_shared_empty_result(self):
+        # When
+        first = UserValidator.errors_for("John Doe", "john@example.com")
+        second = UserValidator.errors_for("Jane Doe", "jane@example.com")
+
+        # Then
+        self.assertEqual(first, ())
+        self.assertIs(first, second)
+
+    def test_given_invalid_user_when_validate_should_add_errors_to_notification(self):
+        # Given
+        notification = Notification()
+
+        # When
+        User(a_name="John Doe", an_email="x" * 121).validate(notification)
+
+        # Then
+        self.assertEqual(notification.get_errors(), ["Email must have less than 120 characters"])
@@ -1,6 +1,9 @@
+import threading
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+from src.domain.user.user import User
 from src.infra.api.composers.user.user_composer import UserComposer
 from src.infra.api.presentation.http_types.http_request import HttpRequest
 
@@ -43,3 +46,75 @@ class TestUserComposer(unittest.TestCase):
 
         # Then
         self.assertTrue(callable(handler))
+
+    def test_given_batch_create_action_when_compose_should_return_callable_handler(self):
+        # When
+        handler = self.composer.batch_create()
+
+        # Then
+        self.assertTrue(callable(handler))
+
+    def test_given_export_action_when_compose_should_return_callable_handler(self):
+        # When
+        handler = self.composer.export()
+
+        # Then
+        self.assertTrue(callable(handler))
+
+    def test_given_composer_when_composing_many_times_should_reuse_prewired_handlers(self):
+        # Given
+        with patch('src.infra.api.composers.user.user_composer.UserController') as controller:
+            composer = UserComposer(Mock())
+
+        # When
+        handlers = [composer.get() for _ in range(100)]
+
+        # Then
+        self.assertEqual(controller.call_count, len(UserComposer.USE_CASES))
+        self.assertTrue(all(handler is composer.handlers['get'] for handler in handlers))
+
+    def test_given_handlers_when_mutated_should_raise_type_error(self):
+        # When / Then
+        with self.assertRaises(TypeError):
+            self.composer.handlers['get'] = self.composer.delete()
+
+    def test_given_concurrent_requests_on_different_routes_when_handled_should_not_cross_talk(self):
+        # Given
+        def slow_get_user(an_id):
+            time.sleep(0.001)
+            return User(an_id, 'John Doe', 'john@example.com', 1)
+
+        def slow_delete_user(an_id, an_expected_version=None):
+            time.sleep(0.001)
+            return True
+
+        gateway = Mock()
+        gateway.get_user.side_effect = slow_get_user
+        gateway.delete_user.side_effect = slow_delete_user
+        with patch('src.infra.api.composers.user.user_composer.settings') as settings:
+            settings.USER_CACHE_ENABLED = False
+            composer = UserComposer(gateway)
+
+        barrier = threading.Barrier(8)
+        statuses = {'get': [], 'delete': []}
+
+        def worker(action):
+            barrier.wait()
+            for index in range(25):
+                handler = getattr(composer, action)()
+                request = HttpRequest(a_headers={}, a_path_params={'id': index + 1})
+                statuses[action].append(handler(request).status_code)
+
+        threads = [threading.Thread(target=worker, args=(action,)) for action in ('get', 'delete') * 4]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        self.assertEqual(statuses['get'], [200] * 100)
+        self.assertEqual(statuses['delete'], [204] * 100)
+        self.assertEqual(gateway.get_user.call_count, 100)
+        self.assertEqual(gateway.delete_user.call_count, 100)
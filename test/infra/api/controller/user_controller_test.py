@@ -2,7 +2,12 @@ import unittest
 from unittest.mock import Mock
 
 from src.application.usecase.user.create.create_user_input import CreateUserInput
-from src.domain.exceptions import NotFoundException
+from src.application.usecase.user.batch_create.batch_create_users_output import BatchCreateUsersOutput
+from src.application.usecase.user.delete.delete_user_input import DeleteUserInput
+from src.application.usecase.user.retrive.get.find_user_by_id_output import FindUserByIdOutput
+from src.application.usecase.user.update.update_user_input import UpdateUserInput
+from src.application.usecase.user.update.update_user_output import UpdateUserOutput
+from src.domain.exceptions import NotFoundException, BadRequestException, PreconditionFailedException
 from src.domain.pagination.pagination import Pagination
 from src.infra.api.controller.user.user_controller import UserController
 from src.infra.api.presentation.http_types.http_request import HttpRequest
@@ -58,7 +63,7 @@ class TestUserController(unittest.TestCase):
             a_body={'name': expected_name, 'email': expected_email},
             a_path_params={'id': expected_id}
         )
-        expected_output = {'id': expected_id, 'name': expected_name, 'email': expected_email}
+        expected_output = UpdateUserOutput(id=expected_id, name=expected_name, email=expected_email, version=2)
         self.use_case.execute.return_value = expected_output
 
         # When
@@ -68,6 +73,40 @@ class TestUserController(unittest.TestCase):
         # Then
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.body, expected_output)
+        self.assertEqual(response.headers['ETag'], '"u1-v2"')
+
+    def test_given_if_match_when_update_user_should_pass_expected_version(self):
+        # Given
+        http_request = HttpRequest(
+            a_headers={'If-Match': '"u1-v3"'},
+            a_body={'name': 'John Updated', 'email': 'john.updated@example.com'},
+            a_path_params={'id': 1}
+        )
+        self.use_case.execute.return_value = UpdateUserOutput(1, 'John Updated', 'john.updated@example.com', 4)
+
+        # When
+        handler = self.controller.handle('update')
+        response = handler(http_request)
+
+        # Then
+        self.assertEqual(response.headers['ETag'], '"u1-v4"')
+        self.use_case.execute.assert_called_once_with(
+            UpdateUserInput(1, 'John Updated', 'john.updated@example.com', 3)
+        )
+
+    def test_given_if_match_for_another_user_when_update_user_should_raise_precondition_failed(self):
+        # Given
+        http_request = HttpRequest(
+            a_headers={'If-Match': '"u2-v3"'},
+            a_body={'name': 'John Updated', 'email': 'john.updated@example.com'},
+            a_path_params={'id': 1}
+        )
+
+        # When/Then
+        handler = self.controller.handle('update')
+        with self.assertRaises(PreconditionFailedException):
+            handler(http_request)
+        self.use_case.execute.assert_not_called()
 
     def test_given_nonexistent_id_when_update_user_should_raise_not_found(self):
         # Given
@@ -95,7 +134,7 @@ class TestUserController(unittest.TestCase):
 
         # Then
         self.assertEqual(response.status_code, 204)
-        self.use_case.execute.assert_called_once_with(expected_id)
+        self.use_case.execute.assert_called_once_with(DeleteUserInput(expected_id))
 
     def test_given_nonexistent_id_when_delete_user_should_return_not_found(self):
         # Given
@@ -113,7 +152,7 @@ class TestUserController(unittest.TestCase):
     def test_given_valid_id_when_get_user_should_return_user_data(self):
         # Given
         expected_id = 1
-        expected_output = {'id': expected_id, 'name': 'John Doe', 'email': 'john@example.com'}
+        expected_output = FindUserByIdOutput(expected_id, 'John Doe', 'john@example.com', 1)
         http_request = HttpRequest(a_path_params={'id': expected_id})
         self.use_case.execute.return_value = expected_output
 
@@ -124,8 +163,37 @@ class TestUserController(unittest.TestCase):
         # Then
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.body, expected_output)
+        self.assertEqual(response.headers['ETag'], '"u1-v1"')
         self.use_case.execute.assert_called_once_with(expected_id)
 
+    def test_given_matching_if_none_match_when_get_user_should_return_not_modified(self):
+        # Given
+        http_request = HttpRequest(a_headers={'If-None-Match': 'W/"u1-v1"'}, a_path_params={'id': 1})
+        self.use_case.execute.return_value = FindUserByIdOutput(1, 'John Doe', 'john@example.com', 1)
+
+        # When
+        handler = self.controller.handle('get')
+        response = handler(http_request)
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+        self.assertIsNone(response.body)
+        self.assertEqual(response.headers['ETag'], '"u1-v1"')
+
+    def test_given_current_revision_when_list_users_should_return_not_modified_without_querying(self):
+        # Given
+        http_request = HttpRequest(a_headers={'If-None-Match': 'W/"users-r7"'}, a_query_params={'page': 1})
+        self.use_case.revision.return_value = 7
+
+        # When
+        handler = self.controller.handle('list')
+        response = handler(http_request)
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], 'W/"users-r7"')
+        self.use_case.execute.assert_not_called()
+
     def test_given_invalid_action_when_handle_request_should_return_bad_request(self):
         # Given
         invalid_action = 'invalid_action'
@@ -137,3 +205,32 @@ class TestUserController(unittest.TestCase):
         # Then
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.body, {"error": "Invalid action"})
+
+    def test_given_partial_batch_with_rejections_when_batch_create_should_return_multi_status(self):
+        # Given
+        http_request = HttpRequest(
+            a_body=[{'name': 'John Doe', 'email': 'john@example.com'}, {'name': '', 'email': 'x'}],
+            a_query_params={'mode': 'partial'}
+        )
+        self.use_case.execute.return_value = BatchCreateUsersOutput(
+            all_or_nothing=False, created=1, rejected=1, items=[])
+
+        # When
+        handler = self.controller.handle('batch_create')
+        response = handler(http_request)
+
+        # Then
+        self.assertEqual(response.status_code, 207)
+        batch_input = self.use_case.execute.call_args.args[0]
+        self.assertFalse(batch_input.all_or_nothing)
+        self.assertEqual(batch_input.items[0], CreateUserInput('John Doe', 'john@example.com'))
+
+    def test_given_empty_batch_when_batch_create_should_raise_bad_request(self):
+        # Given
+        http_request = HttpRequest(a_body=[], a_query_params={})
+
+        # When/Then
+        handler = self.controller.handle('batch_create')
+        with self.assertRaises(BadRequestException):
+            handler(http_request)
+        self.use_case.execute.assert_not_called()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import Mock
+
+from src.infra.api.presentation.http_types.http_request import HttpRequest
+from src.infra.api.presentation.http_types.http_response import HttpResponse
+
+
+class TestHttpRequest(unittest.TestCase):
+    def test_given_source_when_only_path_params_are_read_should_not_load_anything_else(self):
+        # Given
+        source = Mock()
+
+        # When
+        http_request = HttpRequest.from_source(source, a_path_params={'id': '7'})
+
+        # Then
+        self.assertEqual(http_request.path_params, {'id': '7'})
+        source.body.assert_not_called()
+        source.headers.assert_not_called()
+        source.query_params.assert_not_called()
+        source.url.assert_not_called()
+
+    def test_given_source_when_accessors_are_read_twice_should_load_each_once(self):
+        # Given
+        source = Mock()
+        source.body.return_value = {"name": "John Doe"}
+        source.headers.return_value = {'If-Match': '"u1-v1"'}
+
+        # When
+        http_request = HttpRequest.from_source(source)
+        bodies = [http_request.body, http_request.body]
+        headers = [http_request.headers, http_request.headers]
+
+        # Then
+        self.assertEqual(bodies, [{"name": "John Doe"}] * 2)
+        self.assertEqual(headers, [{'If-Match': '"u1-v1"'}] * 2)
+        source.body.assert_called_once_with()
+        source.headers.assert_called_once_with()
+
+    def test_given_eager_values_when_read_should_return_them(self):
+        # When
+        http_request = HttpRequest(a_body=None, a_query_params={'page': '1'}, an_url='/api/v1/users?page=1')
+
+        # Then
+        self.assertIsNone(http_request.body)
+        self.assertIsNone(http_request.headers)
+        self.assertEqual(http_request.query_params, {'page': '1'})
+        self.assertEqual(http_request.url, '/api/v1/users?page=1')
+
+    def test_given_http_types_when_created_should_not_allocate_instance_dicts(self):
+        # When
+        http_request = HttpRequest()
+        http_response = HttpResponse(a_status_code=204)
+
+        # Then
+        self.assertFalse(hasattr(http_request, '__dict__'))
+        self.assertFalse(hasattr(http_response, '__dict__'))
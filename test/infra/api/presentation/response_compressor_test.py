@@ -0,0 +1,76 @@
+import gzip
+import unittest
+
+from src.infra.api.presentation.compression import ResponseCompressor
+from src.infra.api.presentation.compression import response_compressor
+
+
+class TestResponseCompressor(unittest.TestCase):
+    def setUp(self):
+        self.compressor = ResponseCompressor(['br', 'zstd', 'gzip'], min_bytes=100)
+
+    def test_given_quality_values_when_negotiate_should_pick_highest_accepted_encoding(self):
+        # When
+        encoding = self.compressor.negotiate('br;q=0.1, zstd;q=0, gzip;q=0.8')
+
+        # Then
+        self.assertEqual(encoding, 'gzip')
+
+    def test_given_equal_quality_when_negotiate_should_follow_server_preference(self):
+        # When
+        encoding = self.compressor.negotiate('gzip, br, zstd')
+
+        # Then
+        self.assertEqual(encoding, self.compressor.encodings[0])
+
+    def test_given_no_supported_encoding_when_negotiate_should_return_none(self):
+        # When/Then
+        self.assertIsNone(self.compressor.negotiate('identity, deflate'))
+        self.assertIsNone(self.compressor.negotiate(None))
+        self.assertIsNone(self.compressor.negotiate('*;q=0'))
+
+    def test_given_wildcard_when_negotiate_should_pick_preferred_encoding(self):
+        # When
+        encoding = self.compressor.negotiate('*')
+
+        # Then
+        self.assertEqual(encoding, self.compressor.encodings[0])
+
+    def test_given_small_body_when_should_compress_should_return_false(self):
+        # When/Then
+        self.assertFalse(self.compressor.should_compress(99))
+        self.assertTrue(self.compressor.should_compress(100))
+
+    def test_given_chunks_when_compress_stream_should_produce_single_gzip_member(self):
+        # Given
+        chunks = [b'{"id": %d, "email": "user@example.com"}\n' % index for index in range(1000)]
+
+        # When
+        compressed = b''.join(self.compressor.compress_stream(iter(chunks), 'gzip'))
+
+        # Then
+        self.assertEqual(gzip.decompress(compressed), b''.join(chunks))
+        self.assertLess(len(compressed), len(b''.join(chunks)) // 10)
+
+    @unittest.skipUnless(response_compressor.brotli, "brotli is not installed")
+    def test_given_brotli_when_compress_should_round_trip(self):
+        # Given
+        data = b'{"email": "user@example.com"}' * 100
+
+        # When
+        compressed = self.compressor.compress(data, 'br')
+
+        # Then
+        self.assertEqual(response_compressor.brotli.decompress(compressed), data)
+
+    @unittest.skipUnless(response_compressor.zstandard, "zstandard is not installed")
+    def test_given_zstd_stream_when_compress_stream_should_round_trip(self):
+        # Given
+        chunks = [b'{"email": "user@example.com"}\n'] * 100
+
+        # When
+        compressed = b''.join(self.compressor.compress_stream(iter(chunks), 'zstd'))
+
+        # Then
+        decompressed = response_compressor.zstandard.ZstdDecompressor().decompressobj().decompress(compressed)
+        self.assertEqual(decompressed, b''.join(chunks))
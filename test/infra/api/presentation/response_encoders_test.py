@@ -0,0 +1,72 @@
+import json
+import unittest
+
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
+from src.domain.pagination.pagination import Pagination
+from src.infra.api.presentation.encoders import (
+    JsonifyResponseEncoder,
+    OrjsonResponseEncoder,
+    ResponseEncoders,
+    orjson_response_encoder,
+)
+
+
+class TestResponseEncoders(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.body = Pagination.of(
+            current_page=1,
+            per_page=2,
+            total=2,
+            items=[ListUserOutput(1, "John Doe", "john@example.com"), ListUserOutput(2, "Jane Doé", "jane@example.com")],
+            total_exact=True
+        )
+
+    def test_given_unknown_name_when_create_should_raise_value_error(self):
+        # When/Then
+        with self.assertRaises(ValueError):
+            ResponseEncoders.create('pickle')
+
+    def test_given_jsonify_name_when_create_should_return_jsonify_encoder(self):
+        # When
+        encoder = ResponseEncoders.create('jsonify')
+
+        # Then
+        self.assertIsInstance(encoder, JsonifyResponseEncoder)
+
+    @unittest.skipUnless(orjson_response_encoder.orjson, "orjson is not installed")
+    def test_given_auto_with_orjson_installed_when_create_should_return_orjson_encoder(self):
+        # When
+        encoder = ResponseEncoders.create('auto')
+
+        # Then
+        self.assertIsInstance(encoder, OrjsonResponseEncoder)
+
+    @unittest.skipUnless(orjson_response_encoder.orjson, "orjson is not installed")
+    def test_given_pagination_of_dataclasses_when_encode_should_match_jsonify_document(self):
+        # Given
+        with self.app.app_context():
+            expected = json.loads(JsonifyResponseEncoder().encode(self.body))
+
+        # When
+        encoded = OrjsonResponseEncoder().encode(self.body)
+
+        # Then
+        self.assertEqual(json.loads(encoded), expected)
+        self.assertEqual(expected['items'][1]['name'], "Jane Doé")
+
+    @unittest.skipUnless(orjson_response_encoder.orjson, "orjson is not installed")
+    def test_given_sqlalchemy_rows_when_encode_should_serialize_them_as_objects(self):
+        # Given
+        engine = create_engine('sqlite://')
+        with engine.connect() as connection:
+            rows = connection.execute(text("SELECT 1 AS id, 'John Doe' AS name")).all()
+
+        # When
+        encoded = OrjsonResponseEncoder().encode({'items': rows})
+
+        # Then
+        self.assertEqual(json.loads(encoded), {'items': [{'id': 1, 'name': 'John Doe'}]})
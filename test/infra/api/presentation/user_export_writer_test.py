@@ -0,0 +1,37 @@
+import json
+import unittest
+
+from src.domain.user.user import User
+from src.infra.api.presentation.export import NdjsonUserExportWriter, CsvUserExportWriter
+
+
+class TestUserExportWriter(unittest.TestCase):
+    def setUp(self):
+        self.users = [User(index, f"User {index}", f"user{index}@example.com") for index in range(1, 101)]
+
+    def test_given_users_when_write_ndjson_should_emit_one_object_per_line(self):
+        # When
+        payload = b''.join(NdjsonUserExportWriter(64 * 1024).write(iter(self.users))).decode('utf-8')
+
+        # Then
+        lines = payload.splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertEqual(json.loads(lines[0]), {'id': 1, 'name': 'User 1', 'email': 'user1@example.com'})
+
+    def test_given_users_when_write_csv_should_emit_header_and_rows(self):
+        # When
+        payload = b''.join(CsvUserExportWriter(64 * 1024).write(iter(self.users))).decode('utf-8')
+
+        # Then
+        lines = payload.splitlines()
+        self.assertEqual(lines[0], 'id,name,email')
+        self.assertEqual(lines[1], '1,User 1,user1@example.com')
+        self.assertEqual(len(lines), 101)
+
+    def test_given_small_chunk_size_when_write_should_yield_several_chunks(self):
+        # When
+        chunks = list(NdjsonUserExportWriter(1024).write(iter(self.users)))
+
+        # Then
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 2048 for chunk in chunks))
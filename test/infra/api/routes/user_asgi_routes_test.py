@@ -0,0 +1,172 @@
+import gzip
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src.infra.api.routes.base_asgi_routes import BaseAsgiRoutes
+from src.infra.asgi_server import app
+from src.infra.config.settings import settings
+from src.infra.db.migrations import MigrationRunner
+from src.infra.db.settings import DBConnectionHandler
+from src.infra.persistence.entities import UserEntity
+
+
+class TestUserAsgiRoutes(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        MigrationRunner(DBConnectionHandler().get_engine()).upgrade()
+
+    def setUp(self):
+        self.client = TestClient(app)
+        self.client.__enter__()
+        self.base_url = '/api/v1/users'
+
+    def tearDown(self):
+        self.client.__exit__(None, None, None)
+        with DBConnectionHandler() as db:
+            db.session.query(UserEntity).delete()
+            db.session.commit()
+
+    def test_given_valid_user_when_create_and_get_should_return_same_contract_as_flask(self):
+        # Given
+        payload = {"name": "John Doe", "email": "john@example.com"}
+
+        # When
+        created = self.client.post(self.base_url, json=payload)
+        fetched = self.client.get(f'{self.base_url}/{created.json()["id"]}')
+
+        # Then
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(fetched.status_code, 200)
+        self.assertEqual(fetched.json()['name'], "John Doe")
+        self.assertEqual(fetched.headers['ETag'], f'"u{created.json()["id"]}-v1"')
+
+    def test_given_duplicate_email_when_create_should_return_integrity_error(self):
+        # Given
+        self.client.post(self.base_url, json={"name": "John Doe", "email": "john@example.com"})
+
+        # When
+        response = self.client.post(self.base_url, json={"name": "Jane Doe", "email": "john@example.com"})
+
+        # Then
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['details'], ['Este email já está cadastrado no sistema'])
+
+    def test_given_current_etag_when_get_by_id_should_return_not_modified(self):
+        # Given
+        user_id = self.client.post(self.base_url, json={"name": "John Doe", "email": "john@example.com"}).json()['id']
+        etag = self.client.get(f'{self.base_url}/{user_id}').headers['ETag']
+
+        # When
+        response = self.client.get(f'{self.base_url}/{user_id}', headers={'If-None-Match': etag})
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_given_compressed_user_etag_when_revalidating_should_return_same_encoded_etag(self):
+        # Given
+        user_id = self.client.post(self.base_url, json={"name": "John Doe", "email": "john@example.com"}).json()['id']
+        uri = f'{self.base_url}/{user_id}'
+        with patch.object(BaseAsgiRoutes.compressor, 'should_compress', return_value=True):
+            etag = self.client.get(uri, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+
+        # When
+        response = self.client.get(uri, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+        self.assertTrue(etag.endswith('-gzip"'))
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+
+    def test_given_stale_if_match_when_update_should_return_precondition_failed(self):
+        # Given
+        user_id = self.client.post(self.base_url, json={"name": "John Doe", "email": "john@example.com"}).json()['id']
+        stale_etag = self.client.get(f'{self.base_url}/{user_id}').headers['ETag']
+        self.client.put(f'{self.base_url}/{user_id}', json={"name": "John Fresh", "email": ""})
+
+        # When
+        response = self.client.put(
+            f'{self.base_url}/{user_id}',
+            json={"name": "John Stale", "email": ""},
+            headers={'If-Match': stale_etag}
+        )
+
+        # Then
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.client.get(f'{self.base_url}/{user_id}').json()['name'], "John Fresh")
+
+    def test_given_existing_user_when_delete_should_return_no_content(self):
+        # Given
+        user_id = self.client.post(self.base_url, json={"name": "John Doe", "email": "john@example.com"}).json()['id']
+
+        # When
+        response = self.client.delete(f'{self.base_url}/{user_id}')
+
+        # Then
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get(f'{self.base_url}/{user_id}').status_code, 404)
+
+    def test_given_users_when_list_should_return_paginated_response(self):
+        # Given
+        for index in range(3):
+            self.client.post(self.base_url, json={"name": f"User {index}", "email": f"user{index}@example.com"})
+
+        # When
+        response = self.client.get(f'{self.base_url}?page=1&per_page=2&sort=name&direction=asc')
+
+        # Then
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual([user['name'] for user in response.json()['items']], ["User 0", "User 1"])
+        self.assertEqual(response.json()['total'], 3)
+
+    def test_given_gzip_accepted_when_export_should_stream_compressed_ndjson(self):
+        # Given
+        for index in range(3):
+            self.client.post(self.base_url, json={"name": f"User {index}", "email": f"user{index}@example.com"})
+
+        # When
+        with self.client.stream('GET', f'{self.base_url}/export', headers={'Accept-Encoding': 'gzip'}) as response:
+            body = b''.join(response.iter_raw())
+
+        # Then
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(len(gzip.decompress(body).decode('utf-8').splitlines()), 3)
+
+    def test_given_streamed_export_when_body_is_consumed_should_record_metrics_with_db_time(self):
+        # Given
+        for index in range(3):
+            self.client.post(self.base_url, json={"name": f"User {index}", "email": f"user{index}@example.com"})
+
+        # When
+        with patch.object(BaseAsgiRoutes.metrics, 'end') as end_metrics:
+            with self.client.stream('GET', f'{self.base_url}/export') as response:
+                b''.join(response.iter_raw())
+
+        # Then
+        _, status, db_seconds = end_metrics.call_args.args
+        self.assertEqual(status, 200)
+        self.assertGreater(db_seconds, 0.0)
+
+    def test_given_invalid_json_when_create_should_return_bad_request(self):
+        # When
+        response = self.client.post(self.base_url, content=b'{"name":', headers={'Content-Type': 'application/json'})
+
+        # Then
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content)['title'], "BadRequest")
+
+    def test_given_body_over_limit_when_create_should_return_payload_too_large(self):
+        # Given
+        payload = {"name": "John Doe", "email": "john@example.com", "bio": "x" * 256}
+
+        # When
+        with patch.object(settings, 'REQUEST_MAX_BODY_BYTES', 128):
+            response = self.client.post(self.base_url, json=payload)
+
+        # Then
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(json.loads(response.content)['title'], "Payload Too Large")
@@ -1,13 +1,22 @@
+import gzip
 import json
 from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 from src.infra.server import app
+from src.infra.api.routes.base_routes import BaseRoutes
+from src.infra.config.settings import settings
 import random
 
 from src.infra.persistence.entities import UserEntity
+from src.infra.db.migrations import MigrationRunner
 from src.infra.db.settings import DBConnectionHandler
 
 class TestUserRoutes(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        MigrationRunner(DBConnectionHandler().get_engine()).upgrade()
+
     def setUp(self):
         self.app = app.test_client()
         self.base_url = '/api/v1/users'
@@ -110,6 +119,134 @@ class TestUserRoutes(TestCase):
         # Then
         self.assertEqual(response.status_code, 204)
 
+    def test_given_current_etag_when_get_by_id_should_return_not_modified(self):
+        # Given
+        created_user = self._create_users()
+        etag = self.app.get(f'{self.base_url}/{created_user.get("id")}').headers['ETag']
+
+        # When
+        response = self.app.get(f'{self.base_url}/{created_user.get("id")}', headers={'If-None-Match': etag})
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+
+    def test_given_list_etag_when_users_change_should_return_full_page(self):
+        # Given
+        uri = self.base_url + "?page=1&per_page=10"
+        self._create_users()
+        etag = self.app.get(uri).headers['ETag']
+        not_modified = self.app.get(uri, headers={'If-None-Match': etag})
+        self._create_users()
+
+        # When
+        response = self.app.get(uri, headers={'If-None-Match': etag})
+
+        # Then
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(response.status_code, 206)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_given_stale_if_match_when_update_should_return_precondition_failed(self):
+        # Given
+        created_user = self._create_users()
+        user_url = f'{self.base_url}/{created_user.get("id")}'
+        stale_etag = self.app.get(user_url).headers['ETag']
+        self.app.put(user_url, data=json.dumps({"name": "Fresh Name", "email": ""}), content_type='application/json')
+
+        # When
+        response = self.app.put(
+            user_url,
+            data=json.dumps({"name": "Stale Name", "email": ""}),
+            content_type='application/json',
+            headers={'If-Match': stale_etag}
+        )
+
+        # Then
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.app.get(user_url).get_json()['name'], "Fresh Name")
+
+    def test_given_gzip_accepted_when_list_users_should_return_compressed_page(self):
+        # Given
+        self._create_users(quantity=30)
+        uri = self.base_url + "?page=1&per_page=30"
+        plain = self.app.get(uri)
+
+        # When
+        response = self.app.get(uri, headers={'Accept-Encoding': 'gzip'})
+
+        # Then
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(response.data)), plain.get_json())
+        self.assertEqual(response.headers['ETag'], plain.headers['ETag'])
+        self.assertTrue(response.headers['ETag'].startswith('W/'))
+
+    def test_given_compressed_etag_when_get_by_id_should_return_not_modified(self):
+        # Given
+        created_user = self._create_users()
+        user_url = f'{self.base_url}/{created_user.get("id")}'
+        etag = self.app.get(user_url).headers['ETag']
+
+        # When
+        response = self.app.get(user_url, headers={'If-None-Match': etag[:-1] + '-gzip"'})
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+
+    def test_given_compressed_user_etag_when_revalidating_should_return_same_encoded_etag(self):
+        # Given
+        created_user = self._create_users()
+        user_url = f'{self.base_url}/{created_user.get("id")}'
+        with patch.object(BaseRoutes.compressor, 'should_compress', return_value=True):
+            etag = self.app.get(user_url, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+
+        # When
+        response = self.app.get(user_url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+        self.assertTrue(etag.endswith('-gzip"'))
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+
+    def test_given_uncompressed_etag_when_revalidating_should_keep_bare_etag(self):
+        # Given
+        created_user = self._create_users()
+        user_url = f'{self.base_url}/{created_user.get("id")}'
+        etag = self.app.get(user_url, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+
+        # When
+        response = self.app.get(user_url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+
+        # Then
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+
+    def test_given_small_response_when_get_by_id_should_not_compress(self):
+        # Given
+        created_user = self._create_users()
+
+        # When
+        response = self.app.get(f'{self.base_url}/{created_user.get("id")}', headers={'Accept-Encoding': 'gzip'})
+
+        # Then
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+
+    def test_given_gzip_accepted_when_export_should_stream_compressed_body(self):
+        # Given
+        self._create_users(quantity=5)
+
+        # When
+        response = self.app.get(f'{self.base_url}/export?format=ndjson', headers={'Accept-Encoding': 'gzip'})
+
+        # Then
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(len(gzip.decompress(response.data).decode('utf-8').splitlines()), 5)
+
     def test_given_nonexistent_user_when_get_by_id_should_return_not_found(self):
         # When
         response = self.app.get(f'{self.base_url}/999')
@@ -158,3 +295,115 @@ class TestUserRoutes(TestCase):
             content_type='application/json'
         )
         return json.loads(response.data.decode('utf-8'))
+
+    def test_given_ndjson_users_when_batch_create_should_create_all(self):
+        # Given
+        payload = "\n".join(json.dumps({"name": f"Batch {index}", "email": f"batch{index}@email.com"})
+                            for index in range(3))
+
+        # When
+        response = self.app.post(f'{self.base_url}:batch', data=payload, content_type='application/x-ndjson')
+        data = json.loads(response.data.decode('utf-8'))
+
+        # Then
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(data['created'], 3)
+        self.assertTrue(all(item['status'] == 'created' for item in data['items']))
+
+    def test_given_malformed_ndjson_line_when_batch_create_should_report_its_line_number(self):
+        # Given
+        payload = "\n".join([json.dumps({"name": "Batch 0", "email": "batch0@email.com"}), "", '{"name":'])
+
+        # When
+        response = self.app.post(f'{self.base_url}:batch', data=payload, content_type='application/x-ndjson')
+        data = json.loads(response.data.decode('utf-8'))
+
+        # Then
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('at line 3', data['details'])
+
+    def test_given_ndjson_with_invalid_utf8_when_batch_create_should_return_bad_request(self):
+        # Given
+        payload = b'{"name": "Batch \xff", "email": "batch@email.com"}'
+
+        # When
+        response = self.app.post(f'{self.base_url}:batch', data=payload, content_type='application/x-ndjson')
+        data = json.loads(response.data.decode('utf-8'))
+
+        # Then
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(data['details'].startswith('Invalid NDJSON body:'))
+
+    def test_given_invalid_user_when_atomic_batch_create_should_create_nothing(self):
+        # Given
+        payload = [{"name": "Valid User", "email": "valid@email.com"}, {"name": "", "email": "invalid"}]
+
+        # When
+        response = self.app.post(f'{self.base_url}:batch', data=json.dumps(payload), content_type='application/json')
+        listing = json.loads(self.app.get(self.base_url + "?page=1&per_page=10").data.decode('utf-8'))
+
+        # Then
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(listing['total'], 0)
+
+    def test_given_users_when_export_ndjson_should_stream_every_user(self):
+        # Given
+        self._create_users(quantity=3)
+
+        # When
+        response = self.app.get(f'{self.base_url}/export?format=ndjson')
+        lines = response.data.decode('utf-8').splitlines()
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(set(json.loads(lines[0]).keys()), {'id', 'name', 'email'})
+
+    def test_given_streamed_export_when_body_is_consumed_should_record_metrics_with_db_time(self):
+        # Given
+        self._create_users(quantity=3)
+
+        # When
+        with patch.object(BaseRoutes.metrics, 'end') as end_metrics:
+            response = self.app.get(f'{self.base_url}/export?format=ndjson')
+            recorded_before_body = end_metrics.called
+            response.get_data()
+            response.close()
+
+        # Then
+        self.assertFalse(recorded_before_body)
+        _, status, db_seconds = end_metrics.call_args.args
+        self.assertEqual(status, 200)
+        self.assertGreater(db_seconds, 0.0)
+        self.assertNotIn('Server-Timing', response.headers)
+
+    def test_given_unknown_format_when_export_should_return_bad_request(self):
+        # When
+        response = self.app.get(f'{self.base_url}/export?format=xml')
+
+        # Then
+        self.assertEqual(response.status_code, 400)
+
+    def test_given_body_over_limit_when_create_user_should_return_payload_too_large(self):
+        # Given
+        payload = {"name": "John Doe", "email": "john@example.com", "bio": "x" * 256}
+
+        # When
+        with patch.object(settings, 'REQUEST_MAX_BODY_BYTES', 128):
+            response = self.app.post(self.base_url, json=payload)
+
+        # Then
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(json.loads(response.data)['title'], "Payload Too Large")
+
+    def test_given_unparseable_body_when_get_by_id_should_ignore_unread_body(self):
+        # Given
+        user_created = self._create_users()
+
+        # When
+        response = self.app.get(f"{self.base_url}/{user_created['id']}", data=b'{"name":',
+                                content_type='application/json')
+
+        # Then
+        self.assertEqual(response.status_code, 200)
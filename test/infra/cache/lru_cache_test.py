@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import patch
+
+from src.infra.cache.lru_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_given_cached_value_when_get_should_count_hits_and_misses(self):
+        # Given
+        cache = LRUCache(max_entries=10)
+        cache.set(1, 'john')
+
+        # When
+        hit = cache.get(1)
+        miss = cache.get(2)
+
+        # Then
+        stats = cache.stats()
+        self.assertEqual(hit, 'john')
+        self.assertIsNone(miss)
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertEqual(stats.hit_ratio, 0.5)
+
+    def test_given_full_cache_when_set_should_evict_least_recently_used(self):
+        # Given
+        cache = LRUCache(max_entries=2)
+        cache.set(1, 'a')
+        cache.set(2, 'b')
+        cache.get(1)
+
+        # When
+        cache.set(3, 'c')
+
+        # Then
+        self.assertEqual(cache.get(1), 'a')
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_given_byte_budget_when_set_should_evict_until_it_fits(self):
+        # Given
+        cache = LRUCache(max_entries=100, max_bytes=10, sizeof=len)
+        cache.set(1, 'aaaa')
+        cache.set(2, 'bbbb')
+
+        # When
+        cache.set(3, 'cccc')
+
+        # Then
+        stats = cache.stats()
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(stats.entries, 2)
+        self.assertEqual(stats.bytes, 8)
+
+    def test_given_ttl_when_entry_expired_should_miss(self):
+        # Given
+        cache = LRUCache(max_entries=10, ttl_seconds=5)
+        with patch('src.infra.cache.lru_cache.time.monotonic', return_value=10.0):
+            cache.set(1, 'a')
+
+        # When
+        with patch('src.infra.cache.lru_cache.time.monotonic', return_value=16.0):
+            value = cache.get(1)
+
+        # Then
+        self.assertIsNone(value)
+        self.assertEqual(cache.stats().entries, 0)
+
+    def test_given_cached_value_when_delete_should_remove_it(self):
+        # Given
+        cache = LRUCache(max_entries=10)
+        cache.set(1, 'a')
+
+        # When
+        cache.delete(1)
+
+        # Then
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(cache.stats().bytes, 0)
+
+    def test_given_key_invalidated_after_generation_read_when_set_should_skip_stale_value(self):
+        # Given
+        cache = LRUCache(max_entries=10)
+        generation = cache.generation(1)
+        cache.delete(1)
+
+        # When
+        cache.set(1, 'stale', a_generation=generation)
+
+        # Then
+        self.assertIsNone(cache.get(1))
+
+    def test_given_unchanged_generation_when_set_should_store_value(self):
+        # Given
+        cache = LRUCache(max_entries=10)
+        generation = cache.generation(1)
+
+        # When
+        cache.set(1, 'fresh', a_generation=generation)
+
+        # Then
+        self.assertEqual(cache.get(1), 'fresh')
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import patch
+
+from src.infra.cache.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_given_stored_value_when_get_before_expiry_should_return_value(self):
+        # Given
+        cache = TTLCache(max_entries=10, ttl_seconds=30)
+        cache.set('terms', 42)
+
+        # When
+        value = cache.get('terms')
+
+        # Then
+        self.assertEqual(value, 42)
+
+    def test_given_stored_value_when_ttl_elapsed_should_return_none(self):
+        # Given
+        cache = TTLCache(max_entries=10, ttl_seconds=30)
+        with patch('src.infra.cache.ttl_cache.time.monotonic', return_value=100.0):
+            cache.set('terms', 42)
+
+        # When
+        with patch('src.infra.cache.ttl_cache.time.monotonic', return_value=131.0):
+            value = cache.get('terms')
+
+        # Then
+        self.assertIsNone(value)
+        self.assertEqual(len(cache), 0)
+
+    def test_given_full_cache_when_set_should_evict_oldest_entry(self):
+        # Given
+        cache = TTLCache(max_entries=2, ttl_seconds=30)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        # When
+        cache.set('c', 3)
+
+        # Then
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 3)
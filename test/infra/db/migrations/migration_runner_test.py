@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine, text
+
+from src.infra.db.migrations import Migration, MigrationRunner
+from src.infra.db.migrations.versions import MIGRATIONS
+
+
+class TestMigrationRunner(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.directory.name, 'migrations.db')}")
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def test_given_empty_database_when_upgrade_should_apply_all_migrations(self):
+        # Given
+        runner = MigrationRunner(self.engine)
+
+        # When
+        applied = runner.upgrade()
+
+        # Then
+        self.assertEqual([m.version for m in applied], [m.version for m in MIGRATIONS])
+        self.assertEqual(runner.current_version(), MIGRATIONS[-1].version)
+        self.assertEqual(runner.pending(), [])
+        with self.engine.connect() as connection:
+            tables = connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'")).scalars().all()
+        self.assertIn('users', tables)
+
+    def test_given_applied_migrations_when_upgrade_again_should_do_nothing(self):
+        # Given
+        runner = MigrationRunner(self.engine)
+        runner.upgrade()
+
+        # When
+        applied = runner.upgrade()
+
+        # Then
+        self.assertEqual(applied, [])
+
+    def test_given_ordered_steps_when_upgrade_to_target_should_stop_at_target(self):
+        # Given
+        calls = []
+        migrations = [
+            Migration(2, 'second', lambda connection: calls.append(2)),
+            Migration(1, 'first', lambda connection: calls.append(1)),
+            Migration(3, 'third', lambda connection: calls.append(3)),
+        ]
+        runner = MigrationRunner(self.engine, migrations)
+
+        # When
+        runner.upgrade(a_target=2)
+
+        # Then
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(runner.current_version(), 2)
+        self.assertEqual([m.version for m in runner.pending()], [3])
+
+    def test_given_failing_step_when_upgrade_should_not_record_its_version(self):
+        # Given
+        def failing(connection):
+            raise RuntimeError("boom")
+
+        runner = MigrationRunner(self.engine, [Migration(1, 'failing', failing)])
+
+        # When/Then
+        with self.assertRaises(RuntimeError):
+            runner.upgrade()
+        self.assertEqual(runner.current_version(), 0)
+
+    def test_given_duplicated_versions_when_create_runner_should_raise_error(self):
+        # Given
+        migrations = [
+            Migration(1, 'first', lambda connection: None),
+            Migration(1, 'again', lambda connection: None),
+        ]
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            MigrationRunner(self.engine, migrations)
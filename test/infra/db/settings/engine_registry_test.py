@@ -0,0 +1,73 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from sqlalchemy import text
+
+from src.infra.db.settings.connection import DBConnectionHandler
+from src.infra.db.settings.engine_registry import EngineRegistry
+
+
+class TestEngineRegistry(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.connection_string = f"sqlite:///{os.path.join(self.directory.name, 'registry.db')}"
+
+    def tearDown(self):
+        EngineRegistry.get_engine(self.connection_string).dispose()
+        self.directory.cleanup()
+
+    def test_given_same_url_when_get_engine_should_return_shared_engine(self):
+        # When
+        first = EngineRegistry.get_engine(self.connection_string)
+        second = EngineRegistry.get_engine(self.connection_string)
+
+        # Then
+        self.assertIs(first, second)
+        self.assertIs(
+            EngineRegistry.get_session_factory(self.connection_string),
+            EngineRegistry.get_session_factory(self.connection_string)
+        )
+
+    def test_given_many_threads_when_get_engine_should_create_a_single_engine(self):
+        # Given
+        engines = []
+        threads = [
+            threading.Thread(target=lambda: engines.append(EngineRegistry.get_engine(self.connection_string)))
+            for _ in range(16)
+        ]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        self.assertEqual(len(engines), 16)
+        self.assertEqual(len({id(engine) for engine in engines}), 1)
+
+    def test_given_connection_handlers_when_reused_should_share_engine(self):
+        # When
+        first = DBConnectionHandler(self.connection_string)
+        second = DBConnectionHandler(self.connection_string)
+
+        # Then
+        self.assertIs(first.get_engine(), second.get_engine())
+
+    def test_given_sessions_when_executed_should_record_pool_statistics(self):
+        # Given
+        before = EngineRegistry.get_pool_statistics(self.connection_string)
+
+        # When
+        for _ in range(3):
+            with DBConnectionHandler(self.connection_string) as db:
+                db.session.execute(text('SELECT 1'))
+
+        # Then
+        after = EngineRegistry.get_pool_statistics(self.connection_string)
+        self.assertEqual(after.checkouts - before.checkouts, 3)
+        self.assertEqual(after.checkins - before.checkins, 3)
+        self.assertEqual(after.checked_out, 0)
+        self.assertGreaterEqual(after.max_wait_ms, 0.0)
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from src.infra.config.settings import Settings
+from src.infra.db.settings.sqlite_pragmas import SqlitePragmas
+
+
+class TestSqlitePragmas(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.directory.name, 'pragmas.db')}")
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def test_given_performance_profile_when_connect_should_apply_pragmas(self):
+        # Given
+        SqlitePragmas.install(self.engine, Settings.SQLITE_PROFILES['performance'])
+
+        # When
+        effective = SqlitePragmas.effective(self.engine)
+
+        # Then
+        self.assertEqual(effective['journal_mode'], 'wal')
+        self.assertEqual(effective['synchronous'], 1)
+        self.assertEqual(effective['cache_size'], -64000)
+        self.assertEqual(effective['temp_store'], 2)
+        self.assertEqual(effective['busy_timeout'], 5000)
+
+    def test_given_unknown_pragma_when_install_should_raise_error(self):
+        # When/Then
+        with self.assertRaises(ValueError):
+            SqlitePragmas.install(self.engine, {'foreign_keys': 'ON'})
+
+    def test_given_unsafe_value_when_install_should_raise_error(self):
+        # When/Then
+        with self.assertRaises(ValueError):
+            SqlitePragmas.install(self.engine, {'synchronous': 'OFF; DROP TABLE users'})
+
+    def test_given_env_override_when_resolve_profile_should_replace_profile_value(self):
+        # Given
+        a_settings = Settings()
+        a_settings.DB_SQLITE_PROFILE = 'performance'
+
+        # When
+        with patch.dict(os.environ, {'DB_SQLITE_SYNCHRONOUS': 'FULL'}):
+            pragmas = a_settings.sqlite_pragmas()
+
+        # Then
+        self.assertEqual(pragmas['synchronous'], 'FULL')
+        self.assertEqual(pragmas['journal_mode'], 'WAL')
+
+    def test_given_unknown_profile_when_resolve_should_raise_error(self):
+        # Given
+        a_settings = Settings()
+        a_settings.DB_SQLITE_PROFILE = 'turbo'
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            a_settings.sqlite_pragmas()
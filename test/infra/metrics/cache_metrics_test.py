@@ -0,0 +1,34 @@
+import unittest
+
+from src.infra.cache.lru_cache import LRUCache
+from src.infra.metrics import CacheMetrics
+
+
+class TestCacheMetrics(unittest.TestCase):
+    def test_given_registered_cache_when_rendering_should_expose_hits_misses_and_evictions(self):
+        # Given
+        cache = LRUCache(max_entries=1)
+        CacheMetrics.register('metrics-test', cache)
+        cache.set(1, 'a')
+        cache.get(1)
+        cache.get(2)
+        cache.set(2, 'b')
+
+        # When
+        output = CacheMetrics.render()
+
+        # Then
+        self.assertIn('cache_hits_total{cache="metrics-test"} 1', output)
+        self.assertIn('cache_misses_total{cache="metrics-test"} 1', output)
+        self.assertIn('cache_evictions_total{cache="metrics-test"} 1', output)
+        self.assertIn('cache_entries{cache="metrics-test"} 1', output)
+
+    def test_given_collected_cache_when_rendering_should_drop_it(self):
+        # Given
+        CacheMetrics.register('collected-test', LRUCache(max_entries=1))
+
+        # When
+        output = CacheMetrics.render()
+
+        # Then
+        self.assertNotIn('cache="collected-test"', output)
@@ -0,0 +1,60 @@
+import unittest
+
+from src.infra.metrics import QueryPatternDetector, QueryStats
+
+
+class TestQueryPatternDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = QueryPatternDetector(3)
+
+    def test_given_statement_repeated_per_row_when_detecting_should_flag_n_plus_one(self):
+        # Given
+        stats = QueryStats()
+        stats.record('SELECT users.id FROM users LIMIT ?', 0.001)
+        for _ in range(3):
+            stats.record('SELECT users.email FROM users WHERE users.id = ?', 0.001)
+
+        # When
+        findings = self.detector.detect(stats)
+
+        # Then
+        self.assertEqual(findings, ['3 executions of: SELECT users.email FROM users WHERE users.id = ?'])
+
+    def test_given_in_lists_of_different_sizes_when_detecting_should_group_them_as_one_statement(self):
+        # Given
+        stats = QueryStats()
+        stats.record('SELECT users.id FROM users WHERE users.id IN (?, ?)', 0.001)
+        stats.record('SELECT users.id FROM users WHERE users.id IN (?, ?, ?)', 0.001)
+        stats.record('SELECT users.id FROM users WHERE users.id IN (?)', 0.001)
+
+        # When
+        findings = self.detector.detect(stats)
+
+        # Then
+        self.assertEqual(findings, ['3 executions of: SELECT users.id FROM users WHERE users.id IN (?)'])
+
+    def test_given_get_then_update_when_detecting_should_flag_read_before_write(self):
+        # Given
+        stats = QueryStats()
+        stats.record('SELECT users.id, users.version FROM users WHERE users.id = ?', 0.001)
+        stats.record('UPDATE users SET name=? WHERE users.id = ?', 0.001)
+
+        # When
+        with self.assertLogs('src.infra.metrics.query_pattern_detector', level='WARNING') as logs:
+            findings = self.detector.inspect('/api/v1/users/<id>', 'PUT', stats)
+
+        # Then
+        self.assertEqual(findings, ['users read before being written by: UPDATE users SET name=? WHERE users.id = ?'])
+        self.assertIn('Possible N+1 on PUT /api/v1/users/<id>', logs.output[0])
+
+    def test_given_single_round_trip_update_when_detecting_should_not_flag(self):
+        # Given
+        stats = QueryStats()
+        stats.record('UPDATE users SET name=? WHERE users.id = ? RETURNING users.id', 0.001)
+        stats.record('SELECT users.id, users.version FROM users WHERE users.id = ?', 0.001)
+
+        # When
+        findings = self.detector.detect(stats)
+
+        # Then
+        self.assertEqual(findings, [])
@@ -0,0 +1,59 @@
+import unittest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+
+from src.infra.metrics import QueryTracker
+
+
+class TestQueryTracker(unittest.TestCase):
+    def setUp(self):
+        QueryTracker.install()
+        self.engine = create_engine('sqlite://')
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_given_tracked_request_when_executing_statements_should_count_and_time_each(self):
+        # Given
+        token = QueryTracker.start()
+
+        # When
+        with self.engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+            connection.execute(text('SELECT 1'))
+            connection.execute(text('SELECT 2'))
+        stats = QueryTracker.stop(token)
+
+        # Then
+        self.assertEqual(stats.count, 3)
+        self.assertGreater(stats.seconds, 0.0)
+        self.assertEqual(stats.statements, {'SELECT 1': 2, 'SELECT 2': 1})
+        self.assertIsNone(QueryTracker.current())
+
+    def test_given_no_tracked_request_when_executing_statements_should_not_fail(self):
+        # When
+        with self.engine.connect() as connection:
+            result = connection.execute(text('SELECT 1')).scalar()
+
+        # Then
+        self.assertEqual(result, 1)
+        self.assertIsNone(QueryTracker.current())
+
+    def test_given_failing_statement_when_executed_should_not_leave_timing_state_on_the_connection(self):
+        # Given
+        token = QueryTracker.start()
+
+        # When
+        with self.engine.connect() as connection:
+            connection.execute(text('CREATE TABLE users (email TEXT UNIQUE)'))
+            connection.execute(text("INSERT INTO users VALUES ('john@example.com')"))
+            with self.assertRaises(IntegrityError):
+                connection.execute(text("INSERT INTO users VALUES ('john@example.com')"))
+            connection.execute(text('SELECT 1'))
+            info = dict(connection.info)
+        stats = QueryTracker.stop(token)
+
+        # Then
+        self.assertEqual(info, {})
+        self.assertEqual(stats.count, 3)
@@ -0,0 +1,87 @@
+import threading
+import unittest
+
+from src.infra.metrics import RequestMetrics
+
+
+class TestRequestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = RequestMetrics([0.1, 1.0])
+
+    def test_given_handled_requests_when_rendering_should_count_by_route_method_and_status(self):
+        # Given
+        for status in (200, 200, 404):
+            self.metrics.end(self.metrics.begin('/api/v1/users/<id>', 'GET'), status)
+
+        # When
+        output = self.metrics.render()
+
+        # Then
+        self.assertIn('http_requests_total{route="/api/v1/users/<id>",method="GET",status="200"} 2', output)
+        self.assertIn('http_requests_total{route="/api/v1/users/<id>",method="GET",status="404"} 1', output)
+        self.assertIn('http_requests_in_flight{route="/api/v1/users/<id>",method="GET"} 0', output)
+        self.assertIn('http_request_duration_seconds_bucket{route="/api/v1/users/<id>",method="GET",le="0.1"} 3', output)
+        self.assertIn('http_request_duration_seconds_bucket{route="/api/v1/users/<id>",method="GET",le="+Inf"} 3', output)
+        self.assertIn('http_request_duration_seconds_count{route="/api/v1/users/<id>",method="GET"} 3', output)
+
+    def test_given_request_in_progress_when_rendering_should_report_it_in_flight(self):
+        # Given
+        tracked = self.metrics.begin('/api/v1/users', 'POST')
+
+        # When
+        output = self.metrics.render()
+        self.metrics.end(tracked, 201)
+
+        # Then
+        self.assertIn('http_requests_in_flight{route="/api/v1/users",method="POST"} 1', output)
+        self.assertIn('http_requests_in_flight{route="/api/v1/users",method="POST"} 0', self.metrics.render())
+
+    def test_given_requests_on_several_threads_when_rendering_should_merge_every_shard(self):
+        # Given
+        def handle():
+            for _ in range(50):
+                self.metrics.end(self.metrics.begin('/api/v1/users', 'GET'), 206)
+
+        threads = [threading.Thread(target=handle) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # When
+        output = self.metrics.render()
+
+        # Then
+        self.assertIn('http_requests_total{route="/api/v1/users",method="GET",status="206"} 200', output)
+        self.assertIn('http_request_duration_seconds_count{route="/api/v1/users",method="GET"} 200', output)
+
+    def test_given_many_short_lived_threads_when_handling_requests_should_keep_a_fixed_number_of_shards(self):
+        # Given
+        def handle():
+            self.metrics.end(self.metrics.begin('/api/v1/users', 'GET'), 206)
+
+        # When
+        for _ in range(RequestMetrics.SHARD_COUNT * 4):
+            thread = threading.Thread(target=handle)
+            thread.start()
+            thread.join()
+
+        # Then
+        self.assertEqual(len(self.metrics._RequestMetrics__shards), RequestMetrics.SHARD_COUNT)
+        self.assertIn(
+            f'http_requests_total{{route="/api/v1/users",method="GET",status="206"}} {RequestMetrics.SHARD_COUNT * 4}',
+            self.metrics.render()
+        )
+
+    def test_given_db_time_when_handling_request_should_record_it_in_db_histogram(self):
+        # Given
+        tracked = self.metrics.begin('/api/v1/users', 'GET')
+
+        # When
+        self.metrics.end(tracked, 200, 0.25)
+        output = self.metrics.render()
+
+        # Then
+        self.assertIn('http_request_db_duration_seconds_bucket{route="/api/v1/users",method="GET",le="0.1"} 0', output)
+        self.assertIn('http_request_db_duration_seconds_bucket{route="/api/v1/users",method="GET",le="1"} 1', output)
+        self.assertIn('http_request_db_duration_seconds_sum{route="/api/v1/users",method="GET"} 0.250000', output)
@@ -0,0 +1,52 @@
+import unittest
+
+from sqlalchemy import create_engine, text
+
+from src.infra.metrics import SlowQueryLog
+
+
+class TestSlowQueryLog(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        with self.engine.begin() as connection:
+            connection.execute(text('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)'))
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_given_slow_statement_when_recorded_should_log_parameter_shape_and_query_plan(self):
+        # Given
+        slow_query_log = SlowQueryLog(0.1)
+
+        # When
+        with self.engine.connect() as connection:
+            with self.assertLogs('src.infra.metrics.slow_query_log', level='WARNING') as logs:
+                slow_query_log.record(
+                    connection, 'SELECT name FROM users WHERE email = ?', ('john@example.com',), 0.25
+                )
+
+        # Then
+        message = logs.output[0]
+        self.assertIn('Slow query (250.0 ms): SELECT name FROM users WHERE email = ?', message)
+        self.assertIn('parameters: (str)', message)
+        self.assertIn('plan: SCAN users', message)
+        self.assertNotIn('john@example.com', message)
+
+    def test_given_parameters_when_shaping_should_describe_types_without_values(self):
+        # When / Then
+        self.assertEqual(SlowQueryLog.parameter_shape({'id': 1, 'name': 'John'}), '{id: int, name: str}')
+        self.assertEqual(SlowQueryLog.parameter_shape([('a', 1), ('b', 2)], executemany=True), '2 x (str, int)')
+        self.assertEqual(SlowQueryLog.parameter_shape(tuple(range(10))),
+                         '(int, int, int, int, int, int, int, int, ... 10 parameters)')
+
+    def test_given_non_query_statement_when_recorded_should_not_explain_it(self):
+        # Given
+        slow_query_log = SlowQueryLog(0.1)
+
+        # When
+        with self.engine.connect() as connection:
+            with self.assertLogs('src.infra.metrics.slow_query_log', level='WARNING') as logs:
+                slow_query_log.record(connection, 'PRAGMA optimize', (), 0.5)
+
+        # Then
+        self.assertIn('plan: not explained', logs.output[0])
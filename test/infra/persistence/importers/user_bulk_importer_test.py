@@ -0,0 +1,96 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, text
+
+from src.infra.db.migrations import MigrationRunner
+from src.infra.persistence.importers import UserBulkImporter, UserRecordReader
+
+
+class TestUserBulkImporter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.directory.name, 'import.db')}")
+        MigrationRunner(self.engine).upgrade()
+        self.rejects = io.StringIO()
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def test_given_ndjson_records_when_run_should_insert_valid_and_reject_invalid(self):
+        # Given
+        source = io.StringIO("\n".join([
+            json.dumps({"name": "John Doe", "email": "john@example.com"}),
+            json.dumps({"name": "Jane Doe", "email": "jane@example.com"}),
+            json.dumps({"name": "Johnny", "email": "john@example.com"}),
+            json.dumps({"name": "", "email": "invalid"}),
+            "{not json",
+        ]))
+        importer = UserBulkImporter(self.engine, chunk_size=1, rejects=self.rejects)
+
+        # When
+        report = importer.run(UserRecordReader.read(source, 'ndjson'))
+
+        # Then
+        self.assertEqual((report.read, report.inserted, report.rejected), (5, 2, 3))
+        rejected = [json.loads(line) for line in self.rejects.getvalue().splitlines()]
+        self.assertEqual([row['line'] for row in rejected], [3, 4, 5])
+        self.assertEqual(rejected[0]['errors'], ["Email already exists"])
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.execute(text("SELECT COUNT(*) FROM users")).scalar(), 2)
+
+    def test_given_existing_users_when_run_should_reject_rows_already_in_database(self):
+        # Given
+        with self.engine.begin() as connection:
+            connection.execute(text("INSERT INTO users (name, email) VALUES ('John Doe', 'john@example.com')"))
+        source = io.StringIO("name,email\nJohn Doe,other@example.com\nJane Doe,jane@example.com\n")
+        importer = UserBulkImporter(self.engine, rejects=self.rejects)
+
+        # When
+        report = importer.run(UserRecordReader.read(source, 'csv'))
+
+        # Then
+        self.assertEqual((report.inserted, report.rejected), (1, 1))
+        self.assertIn("Name already exists", self.rejects.getvalue())
+
+    def test_given_drop_indexes_on_other_dialect_when_run_should_keep_indexes(self):
+        # Given
+        source = io.StringIO(json.dumps({"name": "Alice Smith", "email": "alice@example.com"}))
+        with self.engine.connect() as connection:
+            before = connection.execute(text("SELECT name FROM sqlite_master ORDER BY name")).scalars().all()
+        importer = UserBulkImporter(self.engine, drop_indexes=True)
+
+        # When
+        with patch.object(self.engine.dialect, 'name', 'postgresql'), self.assertLogs(level='WARNING'):
+            report = importer.run(UserRecordReader.read(source, 'ndjson'))
+
+        # Then
+        with self.engine.connect() as connection:
+            after = connection.execute(text("SELECT name FROM sqlite_master ORDER BY name")).scalars().all()
+        self.assertEqual(report.inserted, 1)
+        self.assertEqual(before, after)
+
+    def test_given_drop_indexes_when_run_should_restore_indexes_and_search_index(self):
+        # Given
+        source = io.StringIO(json.dumps({"name": "Alice Smith", "email": "alice@example.com"}))
+        with self.engine.connect() as connection:
+            before = connection.execute(text("SELECT name FROM sqlite_master ORDER BY name")).scalars().all()
+        importer = UserBulkImporter(self.engine, drop_indexes=True)
+
+        # When
+        report = importer.run(UserRecordReader.read(source, 'ndjson'))
+
+        # Then
+        with self.engine.connect() as connection:
+            after = connection.execute(text("SELECT name FROM sqlite_master ORDER BY name")).scalars().all()
+            matches = connection.execute(text("SELECT COUNT(*) FROM users_fts WHERE users_fts MATCH 'smith'")).scalar()
+            total = connection.execute(text("SELECT row_count FROM table_counters WHERE table_name = 'users'")).scalar()
+        self.assertEqual(report.inserted, 1)
+        self.assertEqual(before, after)
+        self.assertEqual(matches, 1)
+        self.assertEqual(total, 1)
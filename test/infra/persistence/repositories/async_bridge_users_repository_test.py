@@ -0,0 +1,52 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from src.domain.pagination.search_query import SearchQuery
+from src.domain.user.abs_async_user_gateway import AbsAsyncUsersGateway
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+from src.infra.persistence.repositories import AsyncBridgeUsersRepository
+
+
+class TestAsyncBridgeUsersRepository(unittest.TestCase):
+    def setUp(self):
+        self.async_gateway = AsyncMock(spec=AbsAsyncUsersGateway)
+        self.sync_gateway = Mock(spec=AbsUsersGateway)
+        self.repository = AsyncBridgeUsersRepository(self.async_gateway, self.sync_gateway)
+        self.user = User(1, "John Doe", "john@example.com", 1)
+
+    def test_given_event_loop_greenlet_when_get_user_should_await_async_gateway(self):
+        # Given
+        self.async_gateway.get_user.return_value = self.user
+
+        # When
+        user = asyncio.run(greenlet_spawn(self.repository.get_user, 1))
+
+        # Then
+        self.assertIs(user, self.user)
+        self.async_gateway.get_user.assert_awaited_once_with(1)
+        self.sync_gateway.get_user.assert_not_called()
+
+    def test_given_worker_thread_when_get_user_should_call_sync_gateway_directly(self):
+        # Given
+        self.sync_gateway.get_user.return_value = self.user
+
+        # When
+        user = self.repository.get_user(1)
+
+        # Then
+        self.assertIs(user, self.user)
+        self.async_gateway.get_user.assert_not_called()
+
+    def test_given_search_when_listing_should_delegate_to_sync_gateway(self):
+        # Given
+        search = SearchQuery(1, 10, '', 'id', 'asc')
+
+        # When
+        self.repository.list_all_users(search)
+
+        # Then
+        self.sync_gateway.list_all_users.assert_called_once_with(search)
@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import Mock
+
+from src.domain.user.abs_user_gateway import AbsUsersGateway
+from src.domain.user.user import User
+from src.infra.cache.lru_cache import LRUCache
+from src.infra.persistence.repositories.cached_users_repository import CachedUsersRepository
+
+
+class TestCachedUsersRepository(unittest.TestCase):
+    def setUp(self):
+        self.gateway = Mock(spec=AbsUsersGateway)
+        self.repository = CachedUsersRepository(self.gateway, LRUCache(max_entries=10))
+        self.user = User(1, "John Doe", "john@example.com")
+
+    def test_given_repeated_reads_when_get_user_should_hit_gateway_once(self):
+        # Given
+        self.gateway.get_user.return_value = self.user
+
+        # When
+        first = self.repository.get_user("1")
+        second = self.repository.get_user(1)
+
+        # Then
+        self.assertEqual(first, self.user)
+        self.assertIs(second, first)
+        self.gateway.get_user.assert_called_once_with(1)
+        self.assertEqual(self.repository.stats().hits, 1)
+
+    def test_given_missing_user_when_get_user_should_not_cache_none(self):
+        # Given
+        self.gateway.get_user.return_value = None
+
+        # When
+        self.repository.get_user(1)
+        self.repository.get_user(1)
+
+        # Then
+        self.assertEqual(self.gateway.get_user.call_count, 2)
+
+    def test_given_cached_user_when_update_should_invalidate(self):
+        # Given
+        self.gateway.get_user.return_value = self.user
+        self.repository.get_user(1)
+
+        # When
+        self.repository.update_user(User(1, "Jane Doe", "jane@example.com"))
+        self.repository.get_user(1)
+
+        # Then
+        self.assertEqual(self.gateway.get_user.call_count, 2)
+
+    def test_given_cached_user_when_delete_should_invalidate(self):
+        # Given
+        self.gateway.get_user.return_value = self.user
+        self.repository.get_user(1)
+        self.gateway.delete_user.return_value = True
+
+        # When
+        deleted = self.repository.delete_user(1)
+        self.gateway.get_user.return_value = None
+        after = self.repository.get_user(1)
+
+        # Then
+        self.assertTrue(deleted)
+        self.assertIsNone(after)
+
+    def test_given_reused_id_when_insert_should_invalidate_stale_entry(self):
+        # Given
+        self.gateway.get_user.return_value = self.user
+        self.repository.get_user(1)
+        new_user = User(1, "Jane Doe", "jane@example.com")
+        self.gateway.insert_usr.return_value = new_user
+
+        # When
+        self.repository.insert_usr(User(a_name="Jane Doe", an_email="jane@example.com"))
+        self.gateway.get_user.return_value = new_user
+        result = self.repository.get_user(1)
+
+        # Then
+        self.assertEqual(result, new_user)
+
+    def test_given_update_during_read_through_when_get_user_should_not_cache_stale_user(self):
+        # Given
+        def read_then_concurrent_update(an_id):
+            self.repository.update_user(User(1, "Jane Doe", "jane@example.com"))
+            return self.user
+
+        self.gateway.get_user.side_effect = read_then_concurrent_update
+
+        # When
+        self.repository.get_user(1)
+        self.gateway.get_user.side_effect = None
+        self.gateway.get_user.return_value = User(1, "Jane Doe", "jane@example.com")
+        user = self.repository.get_user(1)
+
+        # Then
+        self.assertEqual(user.name, "Jane Doe")
+        self.assertEqual(self.gateway.get_user.call_count, 2)
@@ -1,16 +1,36 @@
+import os
+import tempfile
 import unittest
-from sqlalchemy import text
+from unittest.mock import patch
+from sqlalchemy import event, text
 from sqlalchemy.exc import IntegrityError
 
-from src.domain.exceptions import IntegrityException
+from src.application.usecase.user.retrive.list.list_user_output import ListUserOutput
+from src.domain.exceptions import IntegrityException, PreconditionFailedException
 from src.domain.pagination.search_query import SearchQuery
 from src.domain.user.user import User
 from src.infra.config import settings
+from src.infra.db.migrations import MigrationRunner
 from src.infra.db.settings.connection import DBConnectionHandler
 from src.infra.persistence.repositories import UsersRepository
 
 
 class TestUserRepository(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.database_url = patch.object(
+            settings, 'DATABASE_URL', f"sqlite:///{os.path.join(cls.directory.name, 'users.db')}"
+        )
+        cls.database_url.start()
+        MigrationRunner(DBConnectionHandler().get_engine()).upgrade()
+
+    @classmethod
+    def tearDownClass(cls):
+        DBConnectionHandler().get_engine().dispose()
+        cls.database_url.stop()
+        cls.directory.cleanup()
+
     def setUp(self):
         self.db_connection_handler = DBConnectionHandler()
         self.connection = self.db_connection_handler.get_engine().connect()
@@ -37,6 +57,33 @@ class TestUserRepository(unittest.TestCase):
         self.assertEqual(users[0].name, test_name)
         self.assertEqual(users[0].email, test_email)
 
+    def test_given_valid_user_when_insert_should_issue_single_statement(self):
+        # Given
+        statements = []
+        engine = self.db_connection_handler.get_engine()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, 'before_cursor_execute', listener)
+
+        # When
+        try:
+            user = self.repository.insert_usr(User(a_name="John Doe", an_email="john.doe@example.com"))
+        finally:
+            event.remove(engine, 'before_cursor_execute', listener)
+
+        # Then
+        self.assertEqual(len(statements), 1)
+        self.assertIn("RETURNING", statements[0])
+        self.assertIsNotNone(user.id)
+
+    def test_given_duplicate_email_when_insert_should_raise_integrity_exception_for_email(self):
+        # Given
+        self.repository.insert_usr(User(a_name="John Doe", an_email="john.doe@example.com"))
+
+        # When/Then
+        with self.assertRaises(IntegrityException) as context:
+            self.repository.insert_usr(User(a_name="Jane Doe", an_email="john.doe@example.com"))
+        self.assertEqual("['Este email já está cadastrado no sistema']", str(context.exception))
+
     def test_given_duplicate_user_when_insert_should_raise_integrity_exception(self):
         # Given
         test_name = "John Doe"
@@ -135,6 +182,97 @@ class TestUserRepository(unittest.TestCase):
         self.assertEqual(updated_user.name, updated_name)
         self.assertEqual(updated_user.email, updated_email)
 
+    def test_given_valid_user_when_update_should_return_updated_row_in_single_statement(self):
+        # Given
+        user_id = self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com")).id
+        statements = []
+        engine = self.db_connection_handler.get_engine()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, 'before_cursor_execute', listener)
+
+        # When
+        try:
+            updated_user = self.repository.update_user(User(user_id, "John Updated", None))
+        finally:
+            event.remove(engine, 'before_cursor_execute', listener)
+
+        # Then
+        self.assertEqual(updated_user, User(user_id, "John Updated", "john@example.com"))
+        self.assertEqual(len(statements), 1)
+        self.assertIn("RETURNING", statements[0])
+
+    def test_given_identical_values_when_update_should_skip_write_and_return_current_row(self):
+        # Given
+        user_id = self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com")).id
+        statements = []
+        engine = self.db_connection_handler.get_engine()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, 'before_cursor_execute', listener)
+
+        # When
+        try:
+            updated_user = self.repository.update_user(User(user_id, "John Doe", "john@example.com"))
+        finally:
+            event.remove(engine, 'before_cursor_execute', listener)
+
+        # Then
+        self.assertEqual(updated_user, User(user_id, "John Doe", "john@example.com"))
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(statements[1].startswith("SELECT"))
+
+    def test_given_changed_values_when_update_should_increment_version(self):
+        # Given
+        user = self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+
+        # When
+        updated_user = self.repository.update_user(User(user.id, "John Updated", None), user.version)
+
+        # Then
+        self.assertEqual(user.version, 1)
+        self.assertEqual(updated_user.version, 2)
+        self.assertEqual(self.repository.get_user(user.id).version, 2)
+
+    def test_given_stale_version_when_update_should_raise_precondition_failed(self):
+        # Given
+        user = self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+        self.repository.update_user(User(user.id, "John Updated", None))
+
+        # When/Then
+        with self.assertRaises(PreconditionFailedException):
+            self.repository.update_user(User(user.id, "John Stale", None), user.version)
+        self.assertEqual(self.repository.get_user(user.id).name, "John Updated")
+
+    def test_given_stale_version_when_delete_should_raise_precondition_failed(self):
+        # Given
+        user = self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+        self.repository.update_user(User(user.id, "John Updated", None))
+
+        # When/Then
+        with self.assertRaises(PreconditionFailedException):
+            self.repository.delete_user(user.id, user.version)
+        self.assertTrue(self.repository.delete_user(user.id, user.version + 1))
+
+    def test_given_writes_when_get_users_revision_should_increase(self):
+        # Given
+        initial_revision = self.repository.get_users_revision()
+
+        # When
+        user = self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+        inserted_revision = self.repository.get_users_revision()
+        self.repository.update_user(User(user.id, "John Updated", None))
+        updated_revision = self.repository.get_users_revision()
+
+        # Then
+        self.assertGreater(inserted_revision, initial_revision)
+        self.assertGreater(updated_revision, inserted_revision)
+
+    def test_given_nonexistent_id_when_update_should_return_none(self):
+        # When
+        updated_user = self.repository.update_user(User(9999, "Nobody Here", "nobody@example.com"))
+
+        # Then
+        self.assertIsNone(updated_user)
+
     def test_given_empty_database_when_list_all_should_return_empty_list(self):
         # Given
         search_query = SearchQuery.of(
@@ -176,8 +314,30 @@ class TestUserRepository(unittest.TestCase):
         self.assertEqual(user_paginated.per_page, 10)
         self.assertEqual(user_paginated.current_page, 1)
         for i, user in enumerate(test_users):
-            self.assertEqual(user_paginated.items[i]['name'], user.name)
-            self.assertEqual(user_paginated.items[i]['email'], user.email)
+            self.assertEqual(user_paginated.items[i].name, user.name)
+            self.assertEqual(user_paginated.items[i].email, user.email)
+
+    def test_given_users_when_list_should_select_only_output_columns_into_slotted_records(self):
+        # Given
+        self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+        engine = self.db_connection_handler.get_engine()
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # When
+        event.listen(engine, 'before_cursor_execute', capture)
+        try:
+            user_paginated = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10))
+        finally:
+            event.remove(engine, 'before_cursor_execute', capture)
+
+        # Then
+        self.assertEqual(user_paginated.items, [ListUserOutput(user_paginated.items[0].id, "John Doe", "john@example.com")])
+        self.assertFalse(hasattr(user_paginated.items[0], '__dict__'))
+        page_statement = next(statement for statement in statements if 'LIMIT' in statement)
+        self.assertNotIn('version', page_statement)
 
     def test_given_existing_user_when_delete_should_remove_user(self):
         # Given
@@ -233,4 +393,231 @@ class TestUserRepository(unittest.TestCase):
         self.assertEqual(user_paginated.total, 2)
         self.assertEqual(user_paginated.per_page, 10)
         self.assertEqual(user_paginated.current_page, 1)
-        self.assertTrue(all(user['email'] != "jane@example.com" for user in user_paginated.items))
+        self.assertTrue(all(user.email != "jane@example.com" for user in user_paginated.items))
+
+    def test_given_users_when_list_by_cursor_should_walk_pages_forward_and_backward(self):
+        # Given
+        for index in range(5):
+            self.repository.insert_usr(User(a_name=f"User {index}", an_email=f"user{index}@example.com"))
+        first_query = SearchQuery.of(page=None, per_page=2, sort="name", direction="asc", cursor="")
+
+        # When
+        first_page = self.repository.list_all_users(first_query)
+        second_page = self.repository.list_all_users(
+            SearchQuery.of(page=None, per_page=2, cursor=first_page.next_cursor))
+        last_page = self.repository.list_all_users(
+            SearchQuery.of(page=None, per_page=2, cursor=second_page.next_cursor))
+        back_page = self.repository.list_all_users(
+            SearchQuery.of(page=None, per_page=2, cursor=second_page.previous_cursor))
+
+        # Then
+        self.assertEqual([user.name for user in first_page.items], ["User 0", "User 1"])
+        self.assertEqual([user.name for user in second_page.items], ["User 2", "User 3"])
+        self.assertEqual([user.name for user in last_page.items], ["User 4"])
+        self.assertEqual([user.name for user in back_page.items], ["User 0", "User 1"])
+        self.assertIsNone(first_page.previous_cursor)
+        self.assertIsNone(last_page.next_cursor)
+        self.assertIsNone(back_page.previous_cursor)
+        self.assertEqual(first_page.total, 5)
+
+    def test_given_descending_sort_when_list_by_cursor_should_seek_in_reverse_order(self):
+        # Given
+        for index in range(3):
+            self.repository.insert_usr(User(a_name=f"User {index}", an_email=f"user{index}@example.com"))
+        first_query = SearchQuery.of(page=None, per_page=2, sort="email", direction="desc", cursor="")
+
+        # When
+        first_page = self.repository.list_all_users(first_query)
+        second_page = self.repository.list_all_users(
+            SearchQuery.of(page=None, per_page=2, cursor=first_page.next_cursor))
+
+        # Then
+        self.assertEqual([user.email for user in first_page.items], ["user2@example.com", "user1@example.com"])
+        self.assertEqual([user.email for user in second_page.items], ["user0@example.com"])
+        self.assertIsNone(second_page.next_cursor)
+
+    def test_given_users_when_list_without_terms_should_read_exact_total_from_counter(self):
+        # Given
+        for index in range(3):
+            self.repository.insert_usr(User(a_name=f"User {index}", an_email=f"user{index}@example.com"))
+        result = self.connection.execute(text('SELECT id from users WHERE email = :email'),
+                                         {'email': "user1@example.com"})
+        self.repository.delete_user(result.fetchone().id)
+
+        # When
+        user_paginated = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10))
+
+        # Then
+        self.assertEqual(user_paginated.total, 2)
+        self.assertTrue(user_paginated.total_exact)
+
+    def test_given_include_total_false_when_list_should_skip_total(self):
+        # Given
+        self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+
+        # When
+        user_paginated = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10, include_total=False))
+
+        # Then
+        self.assertIsNone(user_paginated.total)
+        self.assertIsNone(user_paginated.total_exact)
+        self.assertEqual(len(user_paginated.items), 1)
+
+    def test_given_repeated_search_when_list_should_serve_cached_estimated_total(self):
+        # Given
+        self.repository.insert_usr(User(a_name="Cached Search", an_email="cached.search@example.com"))
+        search_query = SearchQuery.of(page=1, per_page=10, terms="cached.search")
+
+        # When
+        first = self.repository.list_all_users(search_query)
+        second = self.repository.list_all_users(search_query)
+
+        # Then
+        self.assertEqual(first.total, 1)
+        self.assertTrue(first.total_exact)
+        self.assertEqual(second.total, 1)
+        self.assertFalse(second.total_exact)
+
+    def test_given_indexed_users_when_search_terms_should_match_name_or_email(self):
+        # Given
+        self.repository.insert_usr(User(a_name="Alice Smith", an_email="alice@example.com"))
+        self.repository.insert_usr(User(a_name="Bob Jones", an_email="bob@smithson.org"))
+        self.repository.insert_usr(User(a_name="Carol White", an_email="carol@example.com"))
+
+        # When
+        user_paginated = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10, terms="SMITH"))
+
+        # Then
+        self.assertEqual(sorted(user.name for user in user_paginated.items), ["Alice Smith", "Bob Jones"])
+
+    def test_given_updated_and_deleted_users_when_search_should_keep_index_in_sync(self):
+        # Given
+        self.repository.insert_usr(User(a_name="Alice Smith", an_email="alice@example.com"))
+        self.repository.insert_usr(User(a_name="Bob Jones", an_email="bob@example.com"))
+        alice_id = self.connection.execute(text("SELECT id FROM users WHERE name = 'Alice Smith'")).scalar()
+        bob_id = self.connection.execute(text("SELECT id FROM users WHERE name = 'Bob Jones'")).scalar()
+
+        # When
+        self.repository.update_user(User(alice_id, "Alice Walker", "alice@example.com"))
+        self.repository.delete_user(bob_id)
+
+        # Then
+        by_old_name = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10, terms="smith"))
+        by_new_name = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10, terms="walker"))
+        by_deleted = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10, terms="jones"))
+        self.assertEqual(by_old_name.items, [])
+        self.assertEqual([user.id for user in by_new_name.items], [alice_id])
+        self.assertEqual(by_deleted.items, [])
+
+    def test_given_full_text_unavailable_when_search_should_fall_back_to_like(self):
+        # Given
+        self.repository.insert_usr(User(a_name="Alice Smith", an_email="alice@example.com"))
+        self.repository.insert_usr(User(a_name="Bob Jones", an_email="bob@example.com"))
+
+        # When
+        with patch('src.infra.persistence.repositories.users_repository.UserFullTextSearch.supports',
+                   return_value=False):
+            user_paginated = self.repository.list_all_users(SearchQuery.of(page=1, per_page=10, terms="ali"))
+
+        # Then
+        self.assertEqual([user.name for user in user_paginated.items], ["Alice Smith"])
+
+    def test_given_terms_when_list_should_check_full_text_support_once(self):
+        # Given
+        self.repository.insert_usr(User(a_name="Alice Smith", an_email="alice@example.com"))
+
+        # When
+        with patch('src.infra.persistence.repositories.users_repository.UserFullTextSearch.supports',
+                   return_value=False) as supports:
+            self.repository.list_all_users(SearchQuery(1, 10, 'alice', '', 'asc'))
+
+        # Then
+        supports.assert_called_once()
+
+    def test_given_new_users_when_insert_users_should_insert_all_with_ids(self):
+        # Given
+        users = [User(a_name=f"Bulk {index}", an_email=f"bulk{index}@example.com") for index in range(5)]
+
+        # When
+        results = self.repository.insert_users(users)
+
+        # Then
+        self.assertTrue(all(result.inserted for result in results))
+        self.assertEqual([result.user.name for result in results], [user.name for user in users])
+        count = self.connection.execute(text('SELECT COUNT(*) FROM users')).scalar()
+        self.assertEqual(count, 5)
+
+    def test_given_conflict_in_atomic_mode_when_insert_users_should_insert_nothing(self):
+        # Given
+        self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+        users = [
+            User(a_name="Jane Doe", an_email="jane@example.com"),
+            User(a_name="Johnny", an_email="john@example.com"),
+        ]
+
+        # When
+        results = self.repository.insert_users(users, all_or_nothing=True)
+
+        # Then
+        self.assertEqual([result.inserted for result in results], [False, False])
+        self.assertEqual(results[0].errors, [])
+        self.assertEqual(results[1].errors, ["Este email já está cadastrado no sistema"])
+        count = self.connection.execute(text('SELECT COUNT(*) FROM users')).scalar()
+        self.assertEqual(count, 1)
+
+    def test_given_conflict_in_partial_mode_when_insert_users_should_insert_the_rest(self):
+        # Given
+        self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+        users = [
+            User(a_name="John Doe", an_email="other@example.com"),
+            User(a_name="Jane Doe", an_email="jane@example.com"),
+        ]
+
+        # When
+        results = self.repository.insert_users(users, all_or_nothing=False)
+
+        # Then
+        self.assertEqual(results[0].errors, ["Este nome já está cadastrado no sistema"])
+        self.assertTrue(results[1].inserted)
+        count = self.connection.execute(text('SELECT COUNT(*) FROM users')).scalar()
+        self.assertEqual(count, 2)
+
+    def test_given_conflict_committed_after_the_check_when_insert_users_should_report_it_per_item(self):
+        # Given
+        users = [
+            User(a_name="Jane Doe", an_email="jane@example.com"),
+            User(a_name="Johnny", an_email="john@example.com"),
+        ]
+        find_taken_fields = UsersRepository._find_taken_fields
+
+        def check_then_concurrent_insert(db_session, an_users):
+            taken = find_taken_fields(db_session, an_users)
+            if len(an_users) == 2:
+                self.repository.insert_usr(User(a_name="John Doe", an_email="john@example.com"))
+            return taken
+
+        # When
+        with patch.object(UsersRepository, '_find_taken_fields', side_effect=check_then_concurrent_insert):
+            results = self.repository.insert_users(users, all_or_nothing=False)
+
+        # Then
+        self.assertTrue(results[0].inserted)
+        self.assertEqual(results[1].errors, ["Este email já está cadastrado no sistema"])
+        count = self.connection.execute(text('SELECT COUNT(*) FROM users')).scalar()
+        self.assertEqual(count, 2)
+
+    def test_given_duplicate_emails_in_batch_when_insert_users_should_insert_only_the_first(self):
+        # Given
+        users = [
+            User(a_name="Jane Doe", an_email="jane@example.com"),
+            User(a_name="Janet", an_email="jane@example.com"),
+        ]
+
+        # When
+        results = self.repository.insert_users(users, all_or_nothing=False)
+
+        # Then
+        self.assertTrue(results[0].inserted)
+        self.assertEqual(results[1].errors, ["Este email já está cadastrado no sistema"])
+        count = self.connection.execute(text('SELECT COUNT(*) FROM users')).scalar()
+        self.assertEqual(count, 1)
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine
+
+from src.infra.db.migrations import MigrationRunner
+from src.infra.persistence.search import UserFullTextSearch
+
+
+class TestUserFullTextSearch(unittest.TestCase):
+    def setUp(self):
+        UserFullTextSearch.reset()
+        self.db_session = MagicMock()
+        self.db_session.get_bind.return_value.url = 'sqlite:///users.db'
+        self.db_session.execute.return_value.scalar.return_value = None
+
+    def tearDown(self):
+        UserFullTextSearch.reset()
+
+    def test_given_missing_index_when_checking_twice_should_query_schema_once(self):
+        # When
+        first = UserFullTextSearch.is_available(self.db_session)
+        second = UserFullTextSearch.is_available(self.db_session)
+
+        # Then
+        self.assertFalse(first)
+        self.assertFalse(second)
+        self.db_session.execute.assert_called_once()
+
+    def test_given_cached_result_when_migrations_apply_should_query_schema_again(self):
+        # Given
+        UserFullTextSearch.is_available(self.db_session)
+        directory = tempfile.TemporaryDirectory()
+        engine = create_engine(f"sqlite:///{os.path.join(directory.name, 'search.db')}")
+
+        # When
+        try:
+            MigrationRunner(engine).upgrade()
+        finally:
+            engine.dispose()
+            directory.cleanup()
+        UserFullTextSearch.is_available(self.db_session)
+
+        # Then
+        self.assertEqual(self.db_session.execute.call_count, 2)
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+
+from src.infra.config.settings import settings
+from src.infra.production_server import ProductionServer
+
+
+class TestProductionServer(unittest.TestCase):
+    def test_given_flask_server_when_loading_config_should_use_threaded_workers_from_settings(self):
+        # When
+        server = ProductionServer('flask')
+
+        # Then
+        self.assertEqual(server.cfg.worker_class_str, 'gthread')
+        self.assertEqual(server.cfg.bind, [f'{settings.APP_HOST}:{settings.APP_PORT}'])
+        self.assertEqual(server.cfg.workers, settings.SERVER_WORKERS)
+        self.assertEqual(server.cfg.threads, settings.SERVER_THREADS)
+        self.assertEqual(server.cfg.keepalive, settings.SERVER_KEEPALIVE)
+        self.assertEqual(server.cfg.timeout, settings.SERVER_TIMEOUT)
+        self.assertEqual(server.cfg.graceful_timeout, settings.SERVER_GRACEFUL_TIMEOUT)
+        self.assertEqual(server.cfg.max_requests, settings.SERVER_MAX_REQUESTS)
+        self.assertEqual(server.cfg.max_requests_jitter, settings.SERVER_MAX_REQUESTS_JITTER)
+        self.assertFalse(server.cfg.preload_app)
+
+    def test_given_asgi_server_when_loading_should_use_uvicorn_workers(self):
+        # When
+        server = ProductionServer('asgi')
+
+        # Then
+        self.assertEqual(server.cfg.worker_class_str, 'uvicorn.workers.UvicornWorker')
+        self.assertEqual(type(server.load()).__name__, 'FastAPI')
+
+    def test_given_unknown_server_when_created_should_raise_value_error(self):
+        # When / Then
+        with self.assertRaises(ValueError):
+            ProductionServer('twisted')
+
+    def test_given_forked_worker_when_post_fork_should_drop_inherited_engines(self):
+        # Given
+        server = ProductionServer('flask')
+
+        # When
+        with patch('src.infra.production_server.EngineRegistry') as engine_registry, \
+                patch('src.infra.production_server.AsyncEngineRegistry') as async_engine_registry:
+            server.cfg.post_fork(None, None)
+
+        # Then
+        engine_registry.dispose_all.assert_called_once_with(close=False)
+        async_engine_registry.reset.assert_called_once_with()
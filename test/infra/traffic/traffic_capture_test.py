@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+import unittest
+
+from flask import Flask, request
+
+from src.infra.traffic import TrafficCapture
+
+
+class TestTrafficCapture(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'captures', 'traffic.jsonl')
+        self.app = Flask(__name__)
+
+        @self.app.post('/api/v1/users')
+        def create():
+            return {'name': request.get_json()['name']}, 201
+
+        @self.app.get('/api/v1/users/<id>')
+        def get(id):
+            return {'id': id}, 200
+
+        self.capture = TrafficCapture(self.path).init_app(self.app)
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        self.capture.close()
+        self.directory.cleanup()
+
+    def test_given_requests_when_captured_should_write_one_jsonl_record_each(self):
+        # When
+        self.client.post('/api/v1/users', json={'name': 'John Doe'})
+        self.client.get('/api/v1/users/7?fields=name', headers={'If-None-Match': '"u7-v1"'})
+        self.capture.close()
+
+        # Then
+        with open(self.path, encoding='utf-8') as capture:
+            records = [json.loads(line) for line in capture]
+        self.assertEqual([record['method'] for record in records], ['POST', 'GET'])
+        self.assertEqual(json.loads(records[0]['body']), {'name': 'John Doe'})
+        self.assertEqual(records[0]['status'], 201)
+        self.assertEqual(records[1]['path'], '/api/v1/users/7')
+        self.assertEqual(records[1]['query'], 'fields=name')
+        self.assertIsNone(records[1]['body'])
+        self.assertEqual(records[1]['headers'], {'If-None-Match': '"u7-v1"'})
+        self.assertGreaterEqual(records[1]['duration_ms'], 0)
+        self.assertLessEqual(records[0]['timestamp'], records[1]['timestamp'])
@@ -0,0 +1,79 @@
+import io
+import json
+import threading
+import time
+import unittest
+
+from flask import Flask, request
+from werkzeug.serving import make_server
+
+from src.infra.traffic import TrafficReplayer
+
+
+class TestTrafficReplayer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        app = Flask(__name__)
+        cls.received = []
+
+        @app.route('/api/v1/users', methods=['GET', 'POST'])
+        def users():
+            cls.received.append((request.method, request.query_string.decode(), request.get_data(as_text=True)))
+            return {}, 201 if request.method == 'POST' else 206
+
+        cls.server = make_server('127.0.0.1', 0, app, threaded=True)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.target = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.thread.join()
+
+    def setUp(self):
+        self.received.clear()
+
+    def test_given_capture_when_replayed_as_fast_as_possible_should_report_statuses_and_mismatches(self):
+        # Given
+        capture = io.StringIO('\n'.join(json.dumps(record) for record in [
+            {'timestamp': 100.0, 'method': 'POST', 'path': '/api/v1/users', 'query': '',
+             'headers': {'Content-Type': 'application/json'}, 'body': '{"name": "John Doe"}', 'status': 201},
+            {'timestamp': 160.0, 'method': 'GET', 'path': '/api/v1/users', 'query': 'page=1&per_page=10',
+             'headers': {}, 'body': None, 'status': 200},
+            {'timestamp': 220.0, 'method': 'GET', 'path': '/api/v1/users', 'query': 'page=2&per_page=10',
+             'headers': {}, 'body': None, 'status': 206},
+        ]) + '\n')
+
+        # When
+        report = TrafficReplayer(self.target, speed=None, concurrency=2).run(TrafficReplayer.read(capture))
+
+        # Then
+        self.assertEqual(report.sent, 3)
+        self.assertEqual(report.failed, 0)
+        self.assertLess(report.elapsed_seconds, 5)
+        self.assertEqual(dict(report.statuses), {201: 1, 206: 2})
+        self.assertEqual(dict(report.mismatches), {('GET /api/v1/users', 200, 206): 1})
+        self.assertIn(('POST', '', '{"name": "John Doe"}'), self.received)
+        self.assertEqual(report.to_dict()['mismatched'], 1)
+
+    def test_given_speed_multiplier_when_replayed_should_keep_scaled_pacing(self):
+        # Given
+        records = [
+            {'timestamp': 10.0, 'method': 'GET', 'path': '/api/v1/users', 'query': '', 'status': 206},
+            {'timestamp': 11.0, 'method': 'GET', 'path': '/api/v1/users', 'query': '', 'status': 206},
+        ]
+
+        # When
+        started = time.perf_counter()
+        report = TrafficReplayer(self.target, speed=5, concurrency=1).run(records)
+
+        # Then
+        self.assertGreaterEqual(time.perf_counter() - started, 0.2)
+        self.assertEqual(report.sent, 2)
+        self.assertEqual(report.mismatched, 0)
+
+    def test_given_invalid_target_when_created_should_raise_value_error(self):
+        # When / Then
+        with self.assertRaises(ValueError):
+            TrafficReplayer('localhost:8000')